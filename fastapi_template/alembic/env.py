@@ -5,6 +5,7 @@ from sqlalchemy import engine_from_config, pool
 from alembic import context
 
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -40,6 +41,16 @@ from app.db.models.item import Item
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# 전문 검색 인덱스(FullTextIndex)의 FTS5 테이블, tsvector 컬럼과 GIN 인덱스는 트리거와 함께
+# 마이그레이션으로 관리하므로 autogenerate 비교에서 제외
+FULLTEXT_OBJECTS = re.compile(r"(_fts(_\w+)?|search_vector)$")
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if reflected and compare_to is None and FULLTEXT_OBJECTS.search(name or ""):
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -62,6 +73,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -87,6 +99,7 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
+            include_object=include_object,
             compare_type=True,  # 컬럼 타입 변경 감지
             compare_server_default=True,  # 기본값 변경 감지
         )
@@ -0,0 +1,33 @@
+"""add user item_count
+
+Revision ID: 5d2a7c41e9b3
+Revises: 010b6259916c
+Create Date: 2026-10-19 10:12:44.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2a7c41e9b3'
+down_revision: Union[str, None] = '010b6259916c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user', sa.Column('item_count', sa.Integer(), server_default='0', nullable=False))
+    # 기존 아이템 수로 카운터 초기화
+    op.execute(
+        'UPDATE "user" SET item_count = '
+        '(SELECT count(*) FROM item WHERE item.owner_id = "user".id)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user', 'item_count')
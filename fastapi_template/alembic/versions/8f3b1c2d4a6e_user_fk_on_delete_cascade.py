@@ -0,0 +1,50 @@
+"""user foreign keys on delete cascade
+
+Revision ID: 8f3b1c2d4a6e
+Revises: 5d2a7c41e9b3
+Create Date: 2026-10-19 13:05:21.774102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3b1c2d4a6e'
+down_revision: Union[str, None] = '5d2a7c41e9b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 컬럼) - user.id를 참조하는 외래 키
+USER_FOREIGN_KEYS = [
+    ('item', 'owner_id'),
+    ('file', 'user_id'),
+    ('token', 'user_id'),
+]
+
+# 이름 없는 외래 키(SQLite)를 PostgreSQL 기본 이름과 같은 이름으로 반영
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+
+def _replace_user_foreign_keys(ondelete: Union[str, None]) -> None:
+    existing_tables = sa.inspect(op.get_bind()).get_table_names()
+    for table, column in USER_FOREIGN_KEYS:
+        # file, token 테이블은 마이그레이션 이력 밖에서 생성되었을 수 있음
+        if table not in existing_tables:
+            continue
+        constraint = f'{table}_{column}_fkey'
+        with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+            batch_op.drop_constraint(constraint, type_='foreignkey')
+            batch_op.create_foreign_key(constraint, 'user', [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_user_foreign_keys('CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_user_foreign_keys(None)
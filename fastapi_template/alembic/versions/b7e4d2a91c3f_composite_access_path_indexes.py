@@ -0,0 +1,78 @@
+"""composite access path indexes
+
+Revision ID: b7e4d2a91c3f
+Revises: 8f3b1c2d4a6e
+Create Date: 2026-10-19 15:42:08.310457
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4d2a91c3f'
+down_revision: Union[str, None] = '8f3b1c2d4a6e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스, 테이블, 컬럼)
+COMPOSITE_INDEXES = [
+    ('ix_item_owner_id_id', 'item', ['owner_id', 'id']),
+    ('ix_item_owner_id_created_at_id', 'item', ['owner_id', 'created_at', 'id']),
+    ('ix_token_user_id_type_expires_at', 'token', ['user_id', 'type', 'expires_at']),
+]
+
+# 복합 인덱스로 대체되는 단일 컬럼 인덱스
+# - ix_token_user_id: 복합 인덱스의 선두 컬럼과 같음
+# - ix_token_type: 값 종류가 적어 단독으로 사용되지 않음
+REPLACED_INDEXES = [
+    ('ix_token_user_id', 'token', ['user_id']),
+    ('ix_token_type', 'token', ['type']),
+]
+
+
+def _existing_indexes(table: str) -> Union[set, None]:
+    """테이블의 인덱스 이름 목록, 테이블이 없으면 None"""
+    inspector = sa.inspect(op.get_bind())
+    # token 테이블은 이력의 어느 리비전도 만들지 않으므로 없는 DB에서는 ix_token_* 작업을 건너뜀
+    # (있는 인덱스를 다시 만들거나 없는 인덱스를 지우지 않도록 이름도 함께 확인)
+    if table not in inspector.get_table_names():
+        return None
+    return {index['name'] for index in inspector.get_indexes(table)}
+
+
+def _create_index(name: str, table: str, columns: list) -> None:
+    existing = _existing_indexes(table)
+    if existing is None or name in existing:
+        return
+    if op.get_bind().dialect.name == 'postgresql':
+        # 운영 중인 테이블의 쓰기를 막지 않도록 CONCURRENTLY로 생성
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+    else:
+        op.create_index(name, table, columns)
+
+
+def _drop_index(name: str, table: str) -> None:
+    existing = _existing_indexes(table)
+    if existing is None or name not in existing:
+        return
+    op.drop_index(name, table_name=table)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in COMPOSITE_INDEXES:
+        _create_index(name, table, columns)
+    for name, table, _ in REPLACED_INDEXES:
+        _drop_index(name, table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, columns in REPLACED_INDEXES:
+        _create_index(name, table, columns)
+    for name, table, _ in COMPOSITE_INDEXES:
+        _drop_index(name, table)
@@ -0,0 +1,40 @@
+"""item fulltext search
+
+Revision ID: c4f81a6d2e57
+Revises: b7e4d2a91c3f
+Create Date: 2026-10-19 16:05:31.527410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.common.database.database_fulltext import FullTextIndex
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f81a6d2e57'
+down_revision: Union[str, None] = 'b7e4d2a91c3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 아이템 제목/설명 전문 검색 인덱스 (SQLite FTS5 / PostgreSQL tsvector + GIN, 트리거로 동기화)
+item_search_index = FullTextIndex(
+    sa.table('item', sa.column('id'), sa.column('title'), sa.column('description')),
+    ('title', 'description'),
+    weights=(4.0, 1.0),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 인덱스와 트리거 생성 후 기존 아이템 색인
+    for statement in item_search_index.create_statements(op.get_bind().dialect.name):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in item_search_index.drop_statements(op.get_bind().dialect.name):
+        op.execute(statement)
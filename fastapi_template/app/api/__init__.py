@@ -8,7 +8,7 @@
 from fastapi import APIRouter
 
 # 모든 라우터 가져오기
-from app.api.routes import auth, users, items
+from app.api.routes import auth, users, items, monitoring
 
 # API 라우터 생성
 api_router = APIRouter()
@@ -16,4 +16,5 @@ api_router = APIRouter()
 # 각 라우터 등록
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
-api_router.include_router(items.router, prefix="/items", tags=["items"]) 
\ No newline at end of file
+api_router.include_router(items.router, prefix="/items", tags=["items"])
+api_router.include_router(monitoring.router, prefix="/monitoring", tags=["monitoring"])
\ No newline at end of file
@@ -6,26 +6,72 @@
 # - 권한 기반 아이템 접근 제어
 """
 
-from typing import Any, List
+from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.sql import func
 
 from app.api.dependencies import get_current_active_user
-from app.common.database import get_db
+from app.common.database import get_db, get_transactional_db
 from app.common.exceptions import NotFoundError, PermissionDeniedError
-from app.common.utils.pagination import PaginationParams, PaginatedResponse
+from app.common.utils.pagination import (
+    CursorParams,
+    CursorPaginatedResponse,
+    PaginatedResponse,
+)
 from app.common.utils import get_python_value
 from app.db.models.user import User
 from app.db.models.item import Item
-from app.db.schemas.item import Item as ItemSchema, ItemCreate, ItemUpdate
+from app.db.schemas.item import Item as ItemSchema, ItemCreate, ItemImportResult, ItemUpdate
 from app.services.item_service import ItemService
+from fastapi_template.app.common.utils.bulk_export import ExportFormat, export_response
+from fastapi_template.app.common.utils.bulk_import import get_record_parser
 
 router = APIRouter()
 
 
+@router.get("/export")
+async def export_items(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format", description="ndjson 또는 csv"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    아이템 전체 내보내기 (NDJSON/CSV 스트리밍)
+    - 관리자: 모든 아이템, 일반 사용자: 본인의 아이템만 (list_items와 동일)
+    - 서버 측 커서로 조회하여 페이지 단위 조회 없이 한 번의 응답으로 전송
+    """
+    owner_id = None if current_user.is_admin else get_python_value(current_user.id)
+    return export_response(
+        ItemService.stream_items(db, owner_id=owner_id),
+        ItemService.EXPORT_FIELDS,
+        export_format,
+        filename="items",
+    )
+
+
+@router.get("/search", response_model=CursorPaginatedResponse[ItemSchema])
+async def search_items(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (제목/설명)"),
+    page_size: int = Query(10, ge=1, le=100, description="페이지당 항목 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    prefix: bool = Query(True, description="마지막 단어 접두어 검색 여부 (입력 중 자동 완성)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    아이템 전문 검색
+    - 관리자: 모든 아이템, 일반 사용자: 본인의 아이템만 (list_items와 동일)
+    - 관련도 순으로 정렬하며 커서 기반 페이지네이션 (next_cursor 반환)
+    """
+    owner_id = None if current_user.is_admin else get_python_value(current_user.id)
+    params = CursorParams(page_size=page_size, paging="cursor", cursor=cursor, sort_by="rank")
+    items, next_cursor = await ItemService.search(
+        db, q, params, owner_id=owner_id, prefix=prefix
+    )
+    return CursorPaginatedResponse.create(items=items, next_cursor=next_cursor, params=params)
+
+
 @router.get("/{item_id}", response_model=ItemSchema)
 async def read_item(
     item_id: int,
@@ -46,9 +92,12 @@ async def read_item(
     return item
 
 
-@router.get("/", response_model=PaginatedResponse[ItemSchema])
+@router.get(
+    "/",
+    response_model=Union[PaginatedResponse[ItemSchema], CursorPaginatedResponse[ItemSchema]],
+)
 async def list_items(
-    pagination: PaginationParams = Depends(),
+    pagination: CursorParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
@@ -56,30 +105,27 @@ async def list_items(
     아이템 목록 조회
     - 관리자: 모든 아이템 조회 가능
     - 일반 사용자: 본인의 아이템만 조회 가능
+    - paging=cursor 또는 cursor 지정 시 커서 기반 페이지네이션 (next_cursor 반환)
     """
-    # 관리자는 모든 아이템 조회 가능
-    if current_user.is_admin:
-        items = await ItemService.get_items(
-            db, skip=pagination.skip, limit=pagination.page_size
-        )
-        total_count = await db.execute(select(func.count()).select_from(Item))
-    else:
-        # 일반 사용자는 본인의 아이템만 조회 가능
-        user_id = get_python_value(current_user.id)
+    # 관리자는 모든 아이템, 일반 사용자는 본인의 아이템만 조회 가능
+    owner_id = None if current_user.is_admin else get_python_value(current_user.id)
 
-        items = await ItemService.get_user_items(
-            db, user_id, skip=pagination.skip, limit=pagination.page_size
+    if pagination.use_cursor:
+        items, next_cursor = await ItemService.get_items_by_cursor(
+            db, pagination, owner_id=owner_id
         )
-        total_count = await db.execute(
-            select(func.count())
-            .select_from(Item)
-            .where(Item.owner_id == current_user.id)
+        return CursorPaginatedResponse.create(
+            items=list(items), next_cursor=next_cursor, params=pagination
         )
 
-    total_items = total_count.scalar()
+    # 총 개수는 설정된 전략(PAGINATION_COUNT_STRATEGY)으로 계산
+    items, count = await ItemService.get_items_page(db, pagination, owner_id=owner_id)
 
     return PaginatedResponse.create(
-        items=list(items), total_items=total_items or 0, params=pagination
+        items=items,
+        total_items=count.total,
+        params=pagination,
+        total_is_exact=count.exact,
     )
 
 
@@ -91,47 +137,67 @@ async def create_item(
 ) -> Any:
     """
     새 아이템 생성
+    - 쓰기가 한 번이므로 단위 작업 없이 처리 (ITEM_GROUP_COMMIT_ENABLED면 그룹 커밋)
     """
     owner_id = get_python_value(current_user.id)
     return await ItemService.create_item(db, item, owner_id=owner_id)
 
 
+@router.post("/import", response_model=ItemImportResult)
+async def import_items(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    아이템 대량 가져오기
+    - 본문: CSV(text/csv, 첫 줄은 헤더) 또는 NDJSON(application/x-ndjson, 줄마다 JSON 객체)
+    - 본문 전체를 버퍼링하지 않고 스트리밍으로 읽어 ITEM_IMPORT_CHUNK_SIZE행 단위로 삽입/커밋
+    - 모든 아이템은 현재 사용자 소유로 생성되며, 실패한 행은 행 번호별 오류로 반환
+    """
+    parser = get_record_parser(request.headers.get("content-type", ""))
+    if parser is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="text/csv 또는 application/x-ndjson 본문만 지원합니다",
+        )
+    owner_id = get_python_value(current_user.id)
+    return await ItemService.import_items(db, parser(request.stream()), owner_id=owner_id)
+
+
 @router.put("/{item_id}", response_model=ItemSchema)
 async def update_item(
     item_id: int,
     item: ItemUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_transactional_db, scope="function"),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     아이템 정보 업데이트
+    - 본인의 아이템 또는 관리자만 수정 가능 (권한 조건을 UPDATE 쿼리에 포함)
     """
-    current_item = await ItemService.get_item(db, item_id)
-    if not current_item:
-        raise NotFoundError(f"Item with ID {item_id} not found")
-
-    # 본인의 아이템이 아니고 관리자도 아니면 접근 거부
-    if current_item.owner_id != current_user.id and not current_user.is_admin:
-        raise PermissionDeniedError("Not enough permissions")
-
-    return await ItemService.update_item(db, item_id, item)
+    return await ItemService.update_user_item(
+        db,
+        item_id,
+        item,
+        user_id=get_python_value(current_user.id),
+        is_admin=bool(current_user.is_admin),
+    )
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_item(
     item_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_transactional_db, scope="function"),
     current_user: User = Depends(get_current_active_user),
 ) -> None:
     """
     아이템 삭제
+    - 본인의 아이템 또는 관리자만 삭제 가능 (권한 조건을 DELETE 쿼리에 포함)
     """
-    current_item = await ItemService.get_item(db, item_id)
-    if not current_item:
-        raise NotFoundError(f"Item with ID {item_id} not found")
-
-    # 본인의 아이템이 아니고 관리자도 아니면 접근 거부
-    if current_item.owner_id != current_user.id and not current_user.is_admin:
-        raise PermissionDeniedError("Not enough permissions")
-
-    await ItemService.delete_item(db, item_id)
+    await ItemService.delete_user_item(
+        db,
+        item_id,
+        user_id=get_python_value(current_user.id),
+        is_admin=bool(current_user.is_admin),
+    )
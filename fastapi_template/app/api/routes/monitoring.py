@@ -0,0 +1,32 @@
+"""
+# File: fastapi_template/app/api/routes/monitoring.py
+# Description: 운영 모니터링 API 엔드포인트 정의
+# - 느린 쿼리 상위 N개 보고서 (관리자 전용)
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.dependencies import get_current_admin_user
+from app.common.database.database_slow_query import slow_query_log
+from app.db.models.user import User
+
+router = APIRouter()
+
+
+@router.get("/slow-queries")
+async def read_slow_queries(
+    limit: int = Query(20, ge=1, le=100, description="반환할 최대 문장 수"),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    느린 쿼리 보고서 조회 (관리자 전용)
+    - 최근 DB_SLOW_QUERY_HISTORY건의 느린 쿼리를 문장별로 합산하여 총 소요 시간 순으로 반환
+    - DB_SLOW_QUERY_LOG가 꺼져 있으면 enabled=False와 빈 목록 반환
+    """
+    return {
+        "enabled": slow_query_log.enabled,
+        "threshold_ms": slow_query_log.threshold_ms,
+        "queries": [stats._asdict() for stats in slow_query_log.report(limit)],
+    }
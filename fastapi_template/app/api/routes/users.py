@@ -5,21 +5,24 @@
 # - 사용자 인증 및 권한 검증
 """
 
-from typing import Any, List
+from typing import Any, List, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.sql import func
 
 from app.api.dependencies import get_current_active_user, get_current_admin_user
-from app.common.database import get_db
+from app.common.database import get_db, get_transactional_db
 from app.common.exceptions import NotFoundError
-from app.common.utils.pagination import PaginationParams, PaginatedResponse
+from app.common.utils.pagination import (
+    CursorParams,
+    CursorPaginatedResponse,
+    PaginatedResponse,
+)
 from app.common.utils import get_python_value
 from app.db.models.user import User
 from app.db.schemas.user import User as UserSchema, UserCreate, UserUpdate
 from app.services.user_service import UserService
+from fastapi_template.app.common.utils.bulk_export import ExportFormat, export_response
 
 router = APIRouter()
 
@@ -36,7 +39,7 @@ async def read_user_me(current_user: User = Depends(get_current_active_user)) ->
 async def update_user_me(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_transactional_db, scope="function"),
 ) -> Any:
     """
     현재 로그인한 사용자 정보 수정
@@ -46,6 +49,21 @@ async def update_user_me(
     return updated_user
 
 
+@router.get("/export")
+async def export_users(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format", description="ndjson 또는 csv"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    사용자 전체 내보내기 (관리자 전용, NDJSON/CSV 스트리밍)
+    - 응답 스키마 필드만 내보냄 (비밀번호 해시 제외)
+    """
+    return export_response(
+        UserService.stream_users(db), UserService.LIST_FIELDS, export_format, filename="users"
+    )
+
+
 @router.get("/{user_id}", response_model=UserSchema)
 async def read_user_by_id(
     user_id: int,
@@ -68,34 +86,40 @@ async def read_user_by_id(
     return user
 
 
-@router.get("/", response_model=PaginatedResponse[UserSchema])
+@router.get(
+    "/",
+    response_model=Union[PaginatedResponse[UserSchema], CursorPaginatedResponse[UserSchema]],
+)
 async def read_users(
-    pagination: PaginationParams = Depends(),
+    pagination: CursorParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user),
 ) -> Any:
     """
     사용자 목록 조회 (관리자 전용)
+    - paging=cursor 또는 cursor 지정 시 커서 기반 페이지네이션 (next_cursor 반환)
     """
-    # 여기서는 간단한 구현이지만, 실제로는 더 복잡한 필터링 로직이 필요할 수 있음
-    # 예: 이름 검색, 등록일 필터링 등
-    users = await db.execute(
-        select(User).offset(pagination.skip).limit(pagination.page_size)
-    )
-    users_list = users.scalars().all()
+    if pagination.use_cursor:
+        users_list, next_cursor = await UserService.get_users_by_cursor(db, pagination)
+        return CursorPaginatedResponse.create(
+            items=list(users_list), next_cursor=next_cursor, params=pagination
+        )
 
-    total_count = await db.execute(select(func.count()).select_from(User))
-    total_items = total_count.scalar()
+    # 총 개수는 설정된 전략(PAGINATION_COUNT_STRATEGY)으로 계산
+    users_list, count = await UserService.get_users_page(db, pagination)
 
     return PaginatedResponse.create(
-        items=list(users_list), total_items=total_items or 0, params=pagination
+        items=users_list,
+        total_items=count.total,
+        params=pagination,
+        total_is_exact=count.exact,
     )
 
 
 @router.post("/", response_model=UserSchema, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_in: UserCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_transactional_db, scope="function"),
     current_user: User = Depends(get_current_admin_user),
 ) -> Any:
     """
@@ -113,10 +137,40 @@ async def create_user(
 async def update_user(
     user_id: int,
     user_in: UserUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_transactional_db, scope="function"),
     current_user: User = Depends(get_current_admin_user),
 ) -> Any:
     """
     사용자 정보 업데이트 (관리자 전용)
     """
     return await UserService.update_user(db, user_id, user_in)
+
+
+@router.delete(
+    "/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"description": "백그라운드에서 삭제 진행"}},
+)
+async def delete_user(
+    user_id: int,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_transactional_db, scope="function"),
+    current_user: User = Depends(get_current_admin_user),
+) -> Response:
+    """
+    사용자 삭제 (관리자 전용)
+    - 아이템/파일/토큰은 DB의 ON DELETE CASCADE로 함께 삭제
+    - 아이템이 USER_DELETE_BACKGROUND_THRESHOLD개 이상이면 계정을 비활성화한 뒤
+      백그라운드에서 나누어 삭제하고 202를 반환
+    """
+    user = await UserService.get_user(db, user_id)
+    if not user:
+        raise NotFoundError(f"User with ID {user_id} not found")
+
+    if await UserService.should_delete_in_background(db, user):
+        await UserService.deactivate_user(db, user_id)
+        background_tasks.add_task(UserService.purge_user, user_id)
+        return Response(status_code=status.HTTP_202_ACCEPTED)
+
+    await UserService.delete_user(db, user_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -9,7 +9,7 @@ from typing import Any, Dict, Optional, Union
 import jwt
 from pydantic import ValidationError
 
-from app.common.config import dev_settings as settings
+from fastapi_template.app.common.config import config_settings as settings
 from app.common.exceptions import AuthenticationError
 from app.db.schemas.token import TokenPayload
 
@@ -6,9 +6,9 @@
 import os
 import json
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from typing import Annotated, Dict, Any, Optional, List
 from functools import lru_cache
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, NoDecode
 from pydantic import field_validator, model_validator
 import logging
 
@@ -84,6 +84,61 @@ class Settings(BaseSettings):
     # 데이터베이스 설정
     DATABASE_URL: Optional[str] = None
     DB_ECHO_LOG: bool = False
+    DB_QUERY_CACHE_SIZE: int = 1200  # 컴파일된 SQL 캐시 크기 (SQLAlchemy 기본값 500)
+    DB_INDEX_ADVISOR: bool = False  # 개발용: 실행된 쿼리를 기록하고 종료 시 인덱스 추천을 로그로 출력
+    
+    # 읽기 전용 복제본(replica) 설정
+    DATABASE_REPLICA_URLS: Annotated[List[str], NoDecode] = []  # 콤마로 구분된 복제본 URL 목록
+    DATABASE_REPLICA_STRATEGY: str = "round_robin"  # round_robin 또는 least_loaded
+    DATABASE_REPLICA_STICKY_SECONDS: float = 5.0  # 쓰기 직후 같은 클라이언트의 읽기를 주 DB로 고정할 시간(초)
+    
+    # 수평 샤딩 설정 (설정 시 __shard_key__ 모델(아이템, 파일)을 소유자 ID로 샤드 DB에 분산 저장)
+    DATABASE_SHARD_URLS: Annotated[List[str], NoDecode] = []  # 콤마로 구분된 샤드 URL 목록 (순서가 샤드 번호, 변경 시 데이터 재배치 필요)
+    
+    # SQLite 고성능 모드 설정 (sqlite+aiosqlite 사용 시 적용)
+    SQLITE_PERFORMANCE_MODE: bool = True
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 268435456  # 256MB
+    SQLITE_CACHE_SIZE: int = -64000  # 음수는 KiB 단위 (약 64MB)
+    SQLITE_BUSY_TIMEOUT: int = 5000  # 밀리초
+    SQLITE_POOL_SIZE: int = 5
+    SQLITE_SERIALIZE_WRITES: bool = True  # 쓰기 트랜잭션 직렬화
+    
+    # 페이지네이션 총 개수 계산 설정
+    PAGINATION_COUNT_STRATEGY: str = "exact"  # exact, window, cached, estimate, counter
+    PAGINATION_COUNT_CACHE_TTL: int = 60  # cached 전략의 캐시 유효기간(초)
+    PAGINATION_COUNT_ESTIMATE_THRESHOLD: int = 100000  # 추정치를 사용할 최소 행 수
+    
+    # 사용자 삭제 설정
+    USER_DELETE_BACKGROUND_THRESHOLD: int = 10000  # 아이템이 이 값 이상인 사용자는 백그라운드로 나누어 삭제
+    USER_DELETE_CHUNK_SIZE: int = 5000  # 백그라운드 삭제 시 한 트랜잭션에서 삭제할 행 수
+    
+    # 만료 토큰 정리 작업 설정
+    TOKEN_CLEANUP_ENABLED: bool = True
+    TOKEN_CLEANUP_INTERVAL: int = 3600  # 실행 간격(초)
+    TOKEN_CLEANUP_BATCH_SIZE: int = 5000  # 한 트랜잭션에서 삭제할 토큰 수
+    TOKEN_CLEANUP_BATCH_PAUSE: float = 0.1  # 배치 사이 대기 시간(초)
+    TOKEN_CLEANUP_PARTITIONED: bool = False  # expires_at 시간 파티션 사용 시 만료 파티션 DROP (PostgreSQL)
+    
+    # 아이템 생성 그룹 커밋 설정 (동시 생성 요청을 모아 한 트랜잭션으로 커밋)
+    ITEM_GROUP_COMMIT_ENABLED: bool = False
+    ITEM_GROUP_COMMIT_MAX_BATCH: int = 200  # 한 트랜잭션에 기록할 최대 아이템 수
+    ITEM_GROUP_COMMIT_MAX_DELAY_MS: float = 5.0  # 첫 요청 후 기록까지 최대 대기 시간(밀리초), 클수록 처리량↑ 지연↑
+    
+    # 아이템 대량 가져오기 설정 (POST /items/import)
+    ITEM_IMPORT_CHUNK_SIZE: int = 10000  # 한 번에 삽입하고 커밋할 행 수 (PostgreSQL은 copy_threshold 이상이면 COPY)
+    ITEM_IMPORT_MAX_ERRORS: int = 1000  # 결과에 포함할 최대 오류 행 수
+    
+    # 느린 쿼리 기록 설정
+    DB_SLOW_QUERY_LOG: bool = False
+    DB_SLOW_QUERY_THRESHOLD_MS: float = 200.0  # 기록할 최소 실행 시간(밀리초)
+    DB_SLOW_QUERY_EXPLAIN: bool = False  # 느린 문장의 실행 계획(EXPLAIN, 실행 없음) 수집
+    DB_SLOW_QUERY_REDACT_PARAMS: bool = True  # 파라미터 값을 타입 이름으로 가림
+    DB_SLOW_QUERY_HISTORY: int = 1000  # 보고서용으로 보관할 최근 기록 수
+    
+    # 요청별 쿼리 통계 설정 (SQL 문 수, DB 시간, 로드된 행 수를 요청 로그에 기록)
+    DB_QUERY_STATS: bool = True
+    DB_QUERY_STATS_HEADER: bool = True  # Server-Timing 응답 헤더로 노출 (프로덕션에서는 비활성화)
     
     # 캐시 설정
     CACHE_TYPE: CacheType = CacheType.REDIS
@@ -137,6 +192,51 @@ class Settings(BaseSettings):
         
         return v
     
+    @field_validator('DATABASE_REPLICA_URLS', 'DATABASE_SHARD_URLS', mode='before')
+    def split_database_urls(cls, v):
+        """콤마로 구분된 복제본/샤드 URL 문자열을 리스트로 변환합니다."""
+        if isinstance(v, str):
+            return [url.strip() for url in v.split(",") if url.strip()]
+        return v
+    
+    @field_validator('DATABASE_REPLICA_URLS', 'DATABASE_SHARD_URLS')
+    def validate_database_urls(cls, v):
+        """복제본/샤드 URL 목록을 검증합니다."""
+        for url in v:
+            cls.validate_database_url(url)
+        
+        return v
+    
+    @field_validator('DATABASE_REPLICA_STRATEGY')
+    def validate_database_replica_strategy(cls, v):
+        """복제본 선택 전략 유효성 검증"""
+        valid_strategies = ["round_robin", "least_loaded"]
+        
+        if v.lower() not in valid_strategies:
+            raise ValidationError(f"지원하지 않는 복제본 선택 전략: {v}. 지원 전략: {', '.join(valid_strategies)}")
+        
+        return v.lower()
+    
+    @field_validator('SQLITE_SYNCHRONOUS')
+    def validate_sqlite_synchronous(cls, v):
+        """SQLite synchronous 설정 유효성 검증"""
+        valid_levels = ["OFF", "NORMAL", "FULL", "EXTRA"]
+        
+        if v.upper() not in valid_levels:
+            raise ValidationError(f"지원하지 않는 SQLITE_SYNCHRONOUS 값: {v}. 지원 값: {', '.join(valid_levels)}")
+        
+        return v.upper()
+    
+    @field_validator('PAGINATION_COUNT_STRATEGY')
+    def validate_pagination_count_strategy(cls, v):
+        """페이지네이션 개수 계산 전략 유효성 검증"""
+        valid_strategies = ["exact", "window", "cached", "estimate", "counter"]
+        
+        if v.lower() not in valid_strategies:
+            raise ValidationError(f"지원하지 않는 개수 계산 전략: {v}. 지원 전략: {', '.join(valid_strategies)}")
+        
+        return v.lower()
+    
     @field_validator('CACHE_TYPE')
     def validate_cache_type(cls, v):
         """캐시 타입 유효성 검증"""
@@ -176,6 +276,8 @@ class Settings(BaseSettings):
             self.DEBUG = False
             self.RELOAD = False
             self.ENABLE_PROFILER = False
+            self.DB_INDEX_ADVISOR = False
+            self.DB_QUERY_STATS_HEADER = False
             
             # 프로덕션 환경에서는 특정 출처만 허용
             if "*" in self.CORS_ORIGINS:
@@ -195,6 +297,11 @@ class Settings(BaseSettings):
         return {
             "url": self.DATABASE_URL,
             "echo": self.DB_ECHO_LOG,
+            "replica_urls": self.DATABASE_REPLICA_URLS,
+            "replica_strategy": self.DATABASE_REPLICA_STRATEGY,
+            "replica_sticky_seconds": self.DATABASE_REPLICA_STICKY_SECONDS,
+            "shard_urls": self.DATABASE_SHARD_URLS,
+            "sqlite_performance_mode": self.SQLITE_PERFORMANCE_MODE,
         }
     
     def get_redis_settings(self) -> Dict[str, Any]:
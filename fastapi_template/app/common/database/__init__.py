@@ -4,6 +4,49 @@
 """
 
 from fastapi_template.app.common.database.database_base import Base, BaseModel, TimeStampMixin
-from fastapi_template.app.common.database.database_session import get_db, engine, async_engine
+from fastapi_template.app.common.database.database_session import (
+    get_db, get_transactional_db, engine, async_engine,
+)
+from fastapi_template.app.common.database.database_routing import (
+    ReplicaRouter,
+    ReplicaStickinessMiddleware,
+    RoutingSession,
+    set_replica_client,
+    use_primary,
+)
+from fastapi_template.app.common.database.database_sharding import ShardMap, ShardRoutingSession, shard_map_of
+from fastapi_template.app.common.database.database_sqlite import (
+    SerializedAsyncSession,
+    SQLiteWriteQueue,
+    enable_sqlite_foreign_keys,
+)
+from fastapi_template.app.common.database.database_index_advisor import IndexAdvisor, IndexSuggestion
+from fastapi_template.app.common.database.database_unit_of_work import UnitOfWork, current_unit_of_work
+from fastapi_template.app.common.database.database_group_commit import GroupCommitWriter
+from fastapi_template.app.common.database.database_fulltext import FullTextIndex, search_terms
+from fastapi_template.app.common.database.database_slow_query import (
+    QueryContextMiddleware,
+    SlowQueryLog,
+    SlowQueryStats,
+    slow_query_log,
+)
+from fastapi_template.app.common.database.database_query_stats import (
+    QueryStats,
+    QueryStatsMiddleware,
+    current_query_stats,
+    install_query_stats,
+    track_queries,
+)
 
-__all__ = ["Base", "BaseModel", "TimeStampMixin", "get_db", "engine", "async_engine"] 
\ No newline at end of file
+__all__ = [
+    "Base", "BaseModel", "TimeStampMixin", "get_db", "get_transactional_db", "engine", "async_engine",
+    "ReplicaRouter", "ReplicaStickinessMiddleware", "RoutingSession", "set_replica_client", "use_primary",
+    "ShardMap", "ShardRoutingSession", "shard_map_of",
+    "SerializedAsyncSession", "SQLiteWriteQueue", "enable_sqlite_foreign_keys",
+    "IndexAdvisor", "IndexSuggestion",
+    "UnitOfWork", "current_unit_of_work",
+    "GroupCommitWriter",
+    "FullTextIndex", "search_terms",
+    "QueryContextMiddleware", "SlowQueryLog", "SlowQueryStats", "slow_query_log",
+    "QueryStats", "QueryStatsMiddleware", "current_query_stats", "install_query_stats", "track_queries",
+] 
\ No newline at end of file
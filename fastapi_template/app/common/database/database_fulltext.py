@@ -0,0 +1,210 @@
+"""
+# File: fastapi_template/app/common/database/database_fulltext.py
+# Description: 데이터베이스 전문 검색 인덱스
+# - SQLite: FTS5 외부 콘텐츠 테이블 + INSERT/UPDATE/DELETE 트리거
+# - PostgreSQL: tsvector 컬럼 + 갱신 트리거 + GIN 인덱스
+# - 검색어를 안전한 검색 식으로 변환하고 순위(작을수록 관련도 높음) 식 제공
+"""
+
+import re
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, bindparam, column, event, func, literal, literal_column, or_
+from sqlalchemy import table as lightweight_table
+
+# 검색어에서 사용할 최대 단어 수
+MAX_TERMS = 16
+
+_TERM = re.compile(r"\w+")
+
+_PG_WEIGHT_LABELS = "ABCD"
+
+
+def search_terms(text: str) -> List[str]:
+    """검색어를 단어 목록으로 분리 (연산자/따옴표 등 특수 문자는 무시)"""
+    return _TERM.findall(text)[:MAX_TERMS]
+
+
+class FullTextIndex:
+    """
+    테이블 텍스트 컬럼의 전문 검색 인덱스
+
+    인덱스는 트리거로 원본 테이블과 같은 트랜잭션에서 갱신되므로, 일반 INSERT/UPDATE/DELETE와
+    대량 삽입(executemany, PostgreSQL COPY) 모두 별도 동기화 없이 검색에 반영됩니다.
+    SQLite와 PostgreSQL 외의 데이터베이스에서는 인덱스 없이 LIKE 검색(순위 없음)으로 동작합니다.
+
+    Example:
+        item_search_index = FullTextIndex(Item.__table__, ("title", "description"), weights=(4.0, 1.0))
+        item_search_index.attach()  # create_all/drop_all 시 함께 생성/삭제
+
+        query, score = item_search_index.apply(select(Item), "sqlite", "사과 주")
+        items = (await db.scalars(query.order_by(score, Item.id).limit(20))).all()
+    """
+
+    def __init__(
+        self,
+        table: Any,
+        columns: Sequence[str],
+        *,
+        weights: Optional[Sequence[float]] = None,
+        id_column: str = "id",
+        pg_config: str = "simple",
+        vector_column: str = "search_vector",
+    ):
+        """
+        Args:
+            table: 원본 테이블 (Table 또는 sqlalchemy.table())
+            columns: 검색할 텍스트 컬럼
+            weights: 컬럼별 가중치 (SQLite bm25 가중치, PostgreSQL은 가중치 순으로 A~D 등급)
+            id_column: 정수 기본 키 컬럼 (SQLite FTS5 rowid)
+            pg_config: PostgreSQL 텍스트 검색 설정 (한국어 등 형태소 분석이 없는 언어는 simple)
+            vector_column: PostgreSQL tsvector 컬럼명
+        """
+        weights = tuple(weights) if weights is not None else (1.0,) * len(columns)
+        if len(weights) != len(columns):
+            raise ValueError("weights는 columns와 길이가 같아야 합니다")
+        if len(columns) > len(_PG_WEIGHT_LABELS):
+            raise ValueError(f"검색 컬럼은 최대 {len(_PG_WEIGHT_LABELS)}개입니다")
+
+        self.table = table
+        self.columns = tuple(columns)
+        self.weights = weights
+        self.id_column = id_column
+        self.pg_config = pg_config
+        self.vector_column = vector_column
+        self.fts_name = f"{table.name}_fts"
+
+        self._fts = lightweight_table(self.fts_name, column("rowid"), column(self.fts_name))
+        # 모델에 없는 컬럼이므로 원본 테이블의 컬럼으로 직접 참조
+        self._vector = literal_column(f'"{table.name}".{vector_column}')
+
+    # DDL
+
+    def create_statements(self, dialect_name: str) -> List[str]:
+        """인덱스, 동기화 트리거 생성 및 기존 행 색인 문장 (지원하지 않는 DB는 빈 목록)"""
+        if dialect_name == "sqlite":
+            return self._sqlite_create()
+        if dialect_name == "postgresql":
+            return self._postgresql_create()
+        return []
+
+    def drop_statements(self, dialect_name: str) -> List[str]:
+        """인덱스와 트리거 삭제 문장"""
+        name = self.table.name
+        if dialect_name == "sqlite":
+            return [
+                *(f"DROP TRIGGER IF EXISTS {self.fts_name}_{suffix}" for suffix in ("ai", "ad", "au")),
+                f"DROP TABLE IF EXISTS {self.fts_name}",
+            ]
+        if dialect_name == "postgresql":
+            function = f"{name}_{self.vector_column}_update"
+            return [
+                f"DROP INDEX IF EXISTS ix_{name}_{self.vector_column}",
+                f'DROP TRIGGER IF EXISTS {function} ON "{name}"',
+                f"DROP FUNCTION IF EXISTS {function}()",
+                f'ALTER TABLE "{name}" DROP COLUMN IF EXISTS {self.vector_column}',
+            ]
+        return []
+
+    def _sqlite_create(self) -> List[str]:
+        name, fts, key = self.table.name, self.fts_name, self.id_column
+        columns = ", ".join(self.columns)
+        new_values = ", ".join(f"new.{c}" for c in self.columns)
+        old_values = ", ".join(f"old.{c}" for c in self.columns)
+        delete_old = (
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.{key}, {old_values});"
+        )
+        insert_new = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.{key}, {new_values});"
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns}, "
+            f"content='{name}', content_rowid='{key}', tokenize='unicode61 remove_diacritics 2')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {name} BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {name} BEGIN {delete_old} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {columns} ON {name} "
+            f"BEGIN {delete_old} {insert_new} END",
+            # 기존 행 색인
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ]
+
+    def _pg_vector_expression(self, prefix: str) -> str:
+        ranked = sorted(range(len(self.columns)), key=lambda i: -self.weights[i])
+        labels = {index: _PG_WEIGHT_LABELS[rank] for rank, index in enumerate(ranked)}
+        return " || ".join(
+            f"setweight(to_tsvector('{self.pg_config}', coalesce({prefix}{c}, '')), '{labels[i]}')"
+            for i, c in enumerate(self.columns)
+        )
+
+    def _postgresql_create(self) -> List[str]:
+        name, vector = self.table.name, self.vector_column
+        function = f"{name}_{vector}_update"
+        return [
+            f'ALTER TABLE "{name}" ADD COLUMN IF NOT EXISTS {vector} tsvector',
+            f"CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$ BEGIN "
+            f"NEW.{vector} := {self._pg_vector_expression('NEW.')}; RETURN NEW; "
+            f"END $$ LANGUAGE plpgsql",
+            f'DROP TRIGGER IF EXISTS {function} ON "{name}"',
+            f'CREATE TRIGGER {function} BEFORE INSERT OR UPDATE OF {", ".join(self.columns)} '
+            f'ON "{name}" FOR EACH ROW EXECUTE FUNCTION {function}()',
+            # 기존 행 색인 후 GIN 인덱스 생성
+            f'UPDATE "{name}" SET {vector} = {self._pg_vector_expression("")}',
+            f'CREATE INDEX IF NOT EXISTS ix_{name}_{vector} ON "{name}" USING GIN ({vector})',
+        ]
+
+    def attach(self) -> None:
+        """create_all/drop_all 시 인덱스와 트리거를 함께 생성/삭제하도록 등록"""
+        event.listen(self.table, "after_create", self._after_create)
+        event.listen(self.table, "before_drop", self._before_drop)
+
+    def _after_create(self, target: Any, connection: Any, **kw: Any) -> None:
+        for statement in self.create_statements(connection.dialect.name):
+            connection.exec_driver_sql(statement)
+
+    def _before_drop(self, target: Any, connection: Any, **kw: Any) -> None:
+        for statement in self.drop_statements(connection.dialect.name):
+            connection.exec_driver_sql(statement)
+
+    # 검색
+
+    def apply(
+        self, query: Any, dialect_name: str, text: str, *, prefix: bool = True
+    ) -> Tuple[Optional[Any], Any]:
+        """
+        조회 쿼리에 검색 조건을 적용합니다.
+
+        모든 단어를 포함하는 행만 찾으며, prefix이면 마지막 단어는 접두어로 검색합니다
+        (입력 중인 단어 자동 완성). 특수 문자는 무시하므로 사용자 입력을 그대로 넘겨도 됩니다.
+
+        Args:
+            query: 원본 테이블을 조회하는 select
+            dialect_name: 데이터베이스 종류 (db.get_bind().dialect.name)
+            text: 검색어
+            prefix: 마지막 단어 접두어 검색 여부
+
+        Returns:
+            Tuple: (검색 조건이 적용된 쿼리, 순위 식). 순위는 작을수록 관련도가 높으며
+            (SQLite bm25, PostgreSQL -ts_rank_cd, 그 외 0), 검색할 단어가 없으면 쿼리는 None
+        """
+        terms = search_terms(text)
+        if not terms:
+            return None, literal(0.0)
+
+        if dialect_name == "sqlite":
+            expression = " ".join(f'"{term}"' for term in terms) + ("*" if prefix else "")
+            match = self._fts.c[self.fts_name]
+            score = func.bm25(match, *self.weights).label("search_rank")
+            query = query.join(self._fts, self._fts.c.rowid == self.table.c[self.id_column]).where(
+                match.op("MATCH")(bindparam("search_expression", expression))
+            )
+            return query, score
+
+        if dialect_name == "postgresql":
+            expression = " & ".join(f"'{term}'" for term in terms) + (":*" if prefix else "")
+            ts_query = func.to_tsquery(self.pg_config, bindparam("search_expression", expression))
+            score = (-func.ts_rank_cd(self._vector, ts_query)).label("search_rank")
+            return query.where(self._vector.op("@@")(ts_query)), score
+
+        conditions = [
+            or_(*(self.table.c[c].icontains(term, autoescape=True) for c in self.columns))
+            for term in terms
+        ]
+        return query.where(and_(*conditions)), literal(0.0).label("search_rank")
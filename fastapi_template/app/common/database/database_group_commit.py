@@ -0,0 +1,182 @@
+"""
+# File: fastapi_template/app/common/database/database_group_commit.py
+# Description: 대량 INSERT용 그룹 커밋
+# - 동시에 들어온 INSERT 요청을 모아 하나의 트랜잭션으로 커밋 (커밋/fsync 횟수 감소)
+# - max_batch_size개가 모이거나 첫 요청 후 max_delay초가 지나면 기록
+# - 요청마다 자신의 행(또는 자신의 예외)을 돌려받음
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_template.app.common.database.database_sharding import shard_map_of
+
+logger = logging.getLogger(__name__)
+
+AfterInsert = Callable[[AsyncSession, Sequence[Any]], Awaitable[None]]
+
+
+class GroupCommitWriter:
+    """
+    동시에 들어온 INSERT 요청을 모아 한 번에 커밋하는 작성기
+
+    배치는 INSERT ... RETURNING 한 번과 커밋 한 번으로 기록합니다. 배치 중 한 행이라도
+    실패하면 배치를 롤백한 뒤 행마다 세이브포인트로 다시 삽입하여, 실패한 요청만 예외를
+    받고 나머지는 하나의 트랜잭션으로 커밋합니다.
+
+    max_delay가 클수록 배치가 커져 처리량이 늘지만 요청 지연 시간도 최대 그만큼 늘어납니다.
+    결과를 기다리던 요청이 취소되어도 이미 대기열에 들어간 행은 기록됩니다.
+
+    Example:
+        writer = GroupCommitWriter(AsyncSessionLocal, Item, max_batch_size=200, max_delay=0.005)
+        item = await writer.submit({"title": "새 아이템", "owner_id": 1})
+        ...
+        await writer.stop()  # 종료 시 남은 요청 기록
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        model: Type[Any],
+        *,
+        max_batch_size: int = 100,
+        max_delay: float = 0.005,
+        after_insert: Optional[AfterInsert] = None,
+    ):
+        """
+        Args:
+            session_factory: 배치마다 새 세션을 만드는 팩토리 (expire_on_commit=False, 예: AsyncSessionLocal)
+            model: 삽입할 모델 클래스
+            max_batch_size: 한 트랜잭션에 기록할 최대 행 수
+            max_delay: 첫 요청 후 배치를 기록하기까지 기다리는 최대 시간(초)
+            after_insert: 삽입 직후 같은 트랜잭션에서 실행할 함수 (예: 카운터 갱신)
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size는 1 이상이어야 합니다")
+
+        self.session_factory = session_factory
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.after_insert = after_insert
+        self._statement = insert(model).returning(model, sort_by_parameter_order=True)
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._has_pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def submit(self, values: Dict[str, Any]) -> Any:
+        """
+        행을 대기열에 넣고 커밋될 때까지 기다립니다. (기록 작업은 첫 호출 시 시작)
+
+        Args:
+            values: 삽입할 컬럼 값
+
+        Returns:
+            커밋된 모델 객체 (세션에서 분리된 상태)
+
+        Raises:
+            이 행의 삽입 또는 배치 커밋에 실패한 경우 해당 예외
+        """
+        if self._closing:
+            raise RuntimeError("종료 중인 그룹 커밋 작성기에는 요청을 추가할 수 없습니다")
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="group_commit")
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((values, future))
+        self._has_pending.set()
+        if len(self._pending) >= self.max_batch_size:
+            self._batch_full.set()
+        return await future
+
+    async def stop(self) -> None:
+        """대기 중인 요청을 모두 기록한 뒤 기록 작업을 종료합니다."""
+        if self._task is None:
+            return
+        self._closing = True
+        self._has_pending.set()
+        self._batch_full.set()
+        try:
+            await self._task
+        finally:
+            self._task = None
+            self._closing = False
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_pending.wait()
+            if not self._closing and len(self._pending) < self.max_batch_size:
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), self.max_delay)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            if len(self._pending) < self.max_batch_size:
+                self._batch_full.clear()
+            if not self._pending:
+                self._has_pending.clear()
+
+            if batch:
+                await self._write(batch)
+            if self._closing and not self._pending:
+                return
+
+    async def _write(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        rows = [values for values, _ in batch]
+        futures = [future for _, future in batch]
+        try:
+            async with self.session_factory() as db:
+                try:
+                    results: List[Any] = list(await self._insert(db, rows))
+                    await db.commit()
+                except Exception:
+                    await db.rollback()
+                    if len(rows) == 1:
+                        raise
+                    results = await self._insert_each(db, rows)
+                    await db.commit()
+        except Exception as exc:
+            logger.warning(f"{self.model.__name__} 그룹 커밋 실패 ({len(rows)}행): {exc}")
+            results = [exc] * len(rows)
+
+        for future, result in zip(futures, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _insert(self, db: AsyncSession, rows: List[Dict[str, Any]]) -> Sequence[Any]:
+        shard_map = shard_map_of(db)
+        if shard_map is None:
+            objs = (await db.scalars(self._statement, rows)).all()
+        else:
+            # 샤드별로 나누어 삽입 (결과는 요청 순서)
+            objs = await shard_map.insert(db, self.model, rows)
+        if self.after_insert is not None:
+            await self.after_insert(db, objs)
+        return objs
+
+    async def _insert_each(self, db: AsyncSession, rows: List[Dict[str, Any]]) -> List[Any]:
+        """행마다 세이브포인트로 삽입하여 실패한 행만 예외로 남깁니다."""
+        results: List[Any] = []
+        for values in rows:
+            try:
+                async with db.begin_nested():
+                    results.append((await self._insert(db, [values]))[0])
+            except Exception as exc:
+                results.append(exc)
+        return results
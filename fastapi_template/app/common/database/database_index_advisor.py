@@ -0,0 +1,311 @@
+"""
+# File: fastapi_template/app/common/database/database_index_advisor.py
+# Description: 개발용 인덱스 추천 도구
+# - 실행된 SELECT/UPDATE/DELETE 문장 기록
+# - EXPLAIN 결과에서 전체 테이블 스캔과 정렬용 임시 정렬을 찾아 인덱스 추천
+# - 추천 컬럼 순서: 동등 조건 → 정렬 → 범위 조건
+"""
+
+import json
+import re
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+
+from sqlalchemy import Delete, Select, Table, Update, event, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList, ColumnClause, UnaryExpression
+from sqlalchemy.sql.selectable import Subquery
+
+_EQUALITY_OPERATORS = (operators.eq, operators.in_op, operators.is_)
+_RANGE_OPERATORS = (
+    operators.lt, operators.le, operators.gt, operators.ge, operators.between_op,
+)
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)")
+_SQLITE_TEMP_SORT = "USE TEMP B-TREE FOR ORDER BY"
+
+# EXPLAIN 결과에서 정렬이 필요한 경우를 나타내는 키
+_SORT = "__sort__"
+
+
+class AccessPath(NamedTuple):
+    """한 테이블에 대한 쿼리의 접근 조건"""
+
+    equality: Tuple[str, ...] = ()
+    order: Tuple[str, ...] = ()
+    range: Tuple[str, ...] = ()
+
+    @property
+    def index_columns(self) -> Tuple[str, ...]:
+        """추천 인덱스 컬럼 (동등 조건 → 정렬 → 범위 조건, 중복 제거)"""
+        return tuple(dict.fromkeys(self.equality + self.order + self.range))
+
+
+class IndexSuggestion(NamedTuple):
+    """인덱스 추천 결과"""
+
+    table: str
+    columns: Tuple[str, ...]
+    reason: str
+    statement: str
+    calls: int
+
+    @property
+    def name(self) -> str:
+        return f"ix_{self.table}_{'_'.join(self.columns)}"
+
+    @property
+    def ddl(self) -> str:
+        return f"CREATE INDEX {self.name} ON {self.table} ({', '.join(self.columns)})"
+
+
+def _append_column(target: Dict[str, List[str]], element: Any) -> None:
+    if isinstance(element, UnaryExpression):
+        element = element.element
+    table = getattr(element, "table", None)
+    if isinstance(element, ColumnClause) and isinstance(table, Table):
+        columns = target.setdefault(table.name, [])
+        if element.name not in columns:
+            columns.append(element.name)
+
+
+def _conjuncts(clause: Any) -> List[Any]:
+    """WHERE 절을 AND로 연결된 조건 목록으로 분리합니다. (OR 내부 조건은 제외)"""
+    if clause is None:
+        return []
+    if isinstance(clause, BooleanClauseList) and clause.operator is operators.and_:
+        return [conjunct for sub in clause.clauses for conjunct in _conjuncts(sub)]
+    return [clause]
+
+
+def access_paths(statement: Any) -> Dict[str, AccessPath]:
+    """
+    SQLAlchemy 문장에서 테이블별 접근 조건을 추출합니다.
+
+    서브쿼리(예: count(*) 쿼리의 내부 SELECT)도 함께 분석합니다.
+
+    Args:
+        statement: Select, Update 또는 Delete 문장
+
+    Returns:
+        Dict[str, AccessPath]: 테이블 이름별 접근 조건
+    """
+    equality: Dict[str, List[str]] = {}
+    order: Dict[str, List[str]] = {}
+    ranges: Dict[str, List[str]] = {}
+    paths: Dict[str, AccessPath] = {}
+
+    if not isinstance(statement, (Select, Update, Delete)):
+        return paths
+
+    for condition in _conjuncts(statement.whereclause):
+        if not isinstance(condition, BinaryExpression):
+            continue
+        if condition.operator in _EQUALITY_OPERATORS:
+            _append_column(equality, condition.left)
+        elif condition.operator in _RANGE_OPERATORS:
+            _append_column(ranges, condition.left)
+
+    if isinstance(statement, Select):
+        for clause in statement._order_by_clauses:
+            _append_column(order, clause)
+        for from_ in statement.get_final_froms():
+            if isinstance(from_, Subquery):
+                for table, path in access_paths(from_.element).items():
+                    paths.setdefault(table, path)
+
+    for table in dict.fromkeys([*equality, *order, *ranges]):
+        paths[table] = AccessPath(
+            equality=tuple(equality.get(table, ())),
+            order=tuple(order.get(table, ())),
+            range=tuple(ranges.get(table, ())),
+        )
+    return paths
+
+
+def _sqlite_plan_problems(conn: Connection, statement: str, parameters: Any) -> Dict[str, str]:
+    problems: Dict[str, str] = {}
+    for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters):
+        detail = row[-1]
+        match = _SQLITE_SCAN.match(detail)
+        if match:
+            problems.setdefault(match.group(1), "전체 테이블 스캔")
+        if _SQLITE_TEMP_SORT in detail:
+            problems[_SORT] = "정렬용 임시 B-tree"
+    return problems
+
+
+def _postgresql_plan_problems(
+    conn: Connection, statement: str, parameters: Any
+) -> Dict[str, str]:
+    plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    problems: Dict[str, str] = {}
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node.get("Node Type") == "Seq Scan":
+            problems.setdefault(node.get("Relation Name"), "전체 테이블 스캔 (Seq Scan)")
+        elif node.get("Node Type") in ("Sort", "Incremental Sort"):
+            problems[_SORT] = "정렬 (Sort)"
+        nodes.extend(node.get("Plans", ()))
+    return problems
+
+
+_PLAN_PROBLEMS = {
+    "sqlite": _sqlite_plan_problems,
+    "postgresql": _postgresql_plan_problems,
+}
+
+
+class _RecordedStatement:
+    __slots__ = ("sql", "parameters", "statement", "calls")
+
+    def __init__(self, sql: str, parameters: Any, statement: Any):
+        self.sql = sql
+        self.parameters = parameters
+        self.statement = statement
+        self.calls = 0
+
+
+class IndexAdvisor:
+    """
+    개발용 인덱스 추천 도구
+
+    start()부터 stop()까지 엔진에서 실행된 SELECT/UPDATE/DELETE 문장을 기록하고,
+    suggest()에서 각 문장의 EXPLAIN 결과를 확인하여 전체 테이블 스캔이나 정렬이
+    발생하는 테이블에 대해 인덱스를 추천합니다. (SQLite, PostgreSQL)
+
+    Example:
+        advisor = IndexAdvisor(async_engine)
+        advisor.start()
+        ...  # 실제 요청 실행
+        advisor.stop()
+        for suggestion in await advisor.suggest():
+            print(suggestion.ddl)
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self._statements: Dict[str, _RecordedStatement] = {}
+        self._recording = False
+
+    def start(self) -> None:
+        """문장 기록을 시작합니다."""
+        if not self._recording:
+            event.listen(self.engine.sync_engine, "before_cursor_execute", self._record)
+            self._recording = True
+
+    def stop(self) -> None:
+        """문장 기록을 중지합니다. (기록된 문장은 유지)"""
+        if self._recording:
+            event.remove(self.engine.sync_engine, "before_cursor_execute", self._record)
+            self._recording = False
+
+    def clear(self) -> None:
+        """기록된 문장을 삭제합니다."""
+        self._statements.clear()
+
+    def _record(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        compiled = getattr(context, "compiled", None)
+        if executemany or compiled is None or statement.startswith("EXPLAIN"):
+            return
+        if not isinstance(compiled.statement, (Select, Update, Delete)):
+            return
+        recorded = self._statements.get(statement)
+        if recorded is None:
+            recorded = self._statements[statement] = _RecordedStatement(
+                statement, parameters, compiled.statement
+            )
+        recorded.calls += 1
+
+    async def suggest(self, min_calls: int = 1) -> List[IndexSuggestion]:
+        """
+        기록된 문장을 EXPLAIN하여 인덱스를 추천합니다.
+
+        Args:
+            min_calls: 추천 대상이 될 최소 실행 횟수
+
+        Returns:
+            List[IndexSuggestion]: 실행 횟수가 많은 순서의 추천 목록
+                (같은 인덱스를 추천하는 문장은 하나로 합침)
+        """
+        async with self.engine.connect() as conn:
+            return await conn.run_sync(self._suggest, min_calls)
+
+    def _suggest(self, conn: Connection, min_calls: int) -> List[IndexSuggestion]:
+        explain = _PLAN_PROBLEMS.get(conn.dialect.name)
+        if explain is None:
+            raise NotImplementedError(f"{conn.dialect.name}은(는) 인덱스 추천을 지원하지 않습니다")
+
+        inspector = inspect(conn)
+        existing: Dict[str, List[Tuple[str, ...]]] = {}
+        suggestions: Dict[Tuple[str, Tuple[str, ...]], IndexSuggestion] = {}
+
+        for recorded in list(self._statements.values()):
+            if recorded.calls < min_calls:
+                continue
+            paths = access_paths(recorded.statement)
+            if not paths:
+                continue
+            problems = explain(conn, recorded.sql, recorded.parameters)
+
+            for table, path in paths.items():
+                if table in problems and (path.equality or path.range):
+                    reason = problems[table]
+                elif _SORT in problems and path.order:
+                    reason = problems[_SORT]
+                else:
+                    continue
+
+                columns = path.index_columns
+                if table not in existing:
+                    existing[table] = self._index_columns(inspector, table)
+                if self._covered(columns, existing[table]):
+                    continue
+
+                key = (table, columns)
+                previous = suggestions.get(key)
+                calls = recorded.calls + (previous.calls if previous else 0)
+                suggestions[key] = IndexSuggestion(
+                    table=table,
+                    columns=columns,
+                    reason=previous.reason if previous else reason,
+                    statement=previous.statement if previous else recorded.sql,
+                    calls=calls,
+                )
+
+        return sorted(self._merge_prefixes(suggestions.values()), key=lambda s: -s.calls)
+
+    @staticmethod
+    def _merge_prefixes(suggestions: Any) -> List[IndexSuggestion]:
+        """다른 추천 인덱스의 선두 컬럼과 같은 추천은 더 긴 인덱스에 합칩니다."""
+        merged: List[IndexSuggestion] = []
+        for suggestion in sorted(suggestions, key=lambda s: -len(s.columns)):
+            for i, longer in enumerate(merged):
+                if longer.table == suggestion.table and (
+                    longer.columns[:len(suggestion.columns)] == suggestion.columns
+                ):
+                    merged[i] = longer._replace(calls=longer.calls + suggestion.calls)
+                    break
+            else:
+                merged.append(suggestion)
+        return merged
+
+    @staticmethod
+    def _index_columns(inspector: Any, table: str) -> List[Tuple[str, ...]]:
+        """테이블의 기존 인덱스(기본 키 포함) 컬럼 목록"""
+        indexes = [tuple(index["column_names"]) for index in inspector.get_indexes(table)]
+        primary_key = inspector.get_pk_constraint(table).get("constrained_columns")
+        if primary_key:
+            indexes.append(tuple(primary_key))
+        return indexes
+
+    @staticmethod
+    def _covered(columns: Sequence[str], indexes: List[Tuple[str, ...]]) -> bool:
+        """추천 컬럼으로 시작하는 인덱스가 이미 있는지 확인합니다."""
+        return any(index[:len(columns)] == tuple(columns) for index in indexes)
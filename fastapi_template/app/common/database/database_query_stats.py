@@ -0,0 +1,184 @@
+"""
+# File: fastapi_template/app/common/database/database_query_stats.py
+# Description: 요청별 쿼리 통계
+# - 요청마다 실행된 SQL 문 수, DB 실행 시간 합계, 로드된 ORM 객체 수를 집계
+# - 요청 로그 한 줄(RequestLoggingMiddleware)과 Server-Timing 응답 헤더로 노출
+# - 테스트에서 요청별 통계를 수집하여 엔드포인트의 쿼리 예산 검사에 사용
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Mapper
+
+from fastapi_template.app.common.database.database_slow_query import route_of
+
+# 현재 요청(또는 track_queries 블록)의 통계
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+# 요청별 통계를 받을 목록 (observe_requests가 설정, 테스트용)
+_request_observer: ContextVar[Optional[List["RequestQueryStats"]]] = ContextVar(
+    "query_stats_observer", default=None
+)
+
+_STARTED_KEY = "query_stats_started"
+
+_installed = False
+
+
+class QueryStats:
+    """
+    실행된 SQL 문 수, DB 실행 시간 합계(밀리초), 로드된 ORM 객체 수
+
+    객체 수는 Mapper load 이벤트로 세므로 Core/컬럼 select, RETURNING 스칼라처럼
+    ORM 객체를 만들지 않는 조회의 행은 포함되지 않습니다 (가져온 행 수가 아님).
+    """
+
+    __slots__ = ("statements", "duration_ms", "objects")
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.duration_ms = 0.0
+        self.objects = 0
+
+    def add(self, other: "QueryStats") -> None:
+        self.statements += other.statements
+        self.duration_ms += other.duration_ms
+        self.objects += other.objects
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (예: 'db;dur=12.3;desc="5 queries, 20 objects"')"""
+        return f'db;dur={self.duration_ms:.1f};desc="{self.statements} queries, {self.objects} objects"'
+
+    def __repr__(self) -> str:
+        return f"QueryStats(statements={self.statements}, duration_ms={self.duration_ms:.1f}, objects={self.objects})"
+
+
+class RequestQueryStats(NamedTuple):
+    """요청 한 건의 쿼리 통계"""
+
+    route: str
+    status: Optional[int]
+    stats: QueryStats
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current_stats.get() is not None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_stats.get()
+    started = conn.info.get(_STARTED_KEY)
+    if stats is None or not started:
+        return
+    stats.statements += 1
+    stats.duration_ms += (time.perf_counter() - started.pop()) * 1000
+
+
+def _handle_error(context) -> None:
+    # 실패한 문장도 실행된 문장으로 집계
+    conn = context.connection
+    if conn is not None:
+        _after_cursor_execute(conn, None, None, None, None, None)
+
+
+def _on_load(target, context) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.objects += 1
+
+
+def install_query_stats() -> None:
+    """
+    모든 엔진과 매퍼에 집계용 이벤트 리스너를 등록합니다. (여러 번 호출해도 한 번만 등록)
+
+    리스너는 track_queries 블록(요청) 밖에서는 아무것도 하지 않습니다.
+    """
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    event.listen(Mapper, "load", _on_load)
+    _installed = True
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 쿼리를 집계합니다. 중첩된 블록의 통계는 바깥 블록에도 더해집니다.
+
+        with track_queries() as stats:
+            await repository.get_multi(db)
+        print(stats.statements, stats.duration_ms, stats.objects)
+    """
+    parent = _current_stats.get()
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        if parent is not None:
+            parent.add(stats)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """현재 요청의 쿼리 통계, 집계 중이 아니면 None"""
+    return _current_stats.get()
+
+
+@contextmanager
+def observe_requests() -> Iterator[List[RequestQueryStats]]:
+    """블록 안에서 QueryStatsMiddleware가 처리한 요청별 통계를 목록으로 수집합니다."""
+    requests: List[RequestQueryStats] = []
+    token = _request_observer.set(requests)
+    try:
+        yield requests
+    finally:
+        _request_observer.reset(token)
+
+
+class QueryStatsMiddleware:
+    """
+    요청별 쿼리 통계를 집계하여 Server-Timing 헤더로 노출하는 ASGI 미들웨어
+
+    요청 로그는 안쪽에 등록한 RequestLoggingMiddleware가 current_query_stats()로 기록합니다.
+    헤더는 응답 시작 시점까지의 통계를, 로그는 스트리밍 응답을 포함한 요청 전체의 통계를 담습니다.
+    install_query_stats()로 리스너가 등록되어 있어야 집계됩니다.
+    """
+
+    def __init__(self, app: Any, *, header: bool = True):
+        self.app = app
+        self.header = header
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status: Optional[int] = None
+
+        with track_queries() as stats:
+            async def send_with_timing(message: Dict[str, Any]) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    if self.header:
+                        headers = list(message.get("headers", []))
+                        headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                        message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                observer = _request_observer.get()
+                if observer is not None:
+                    observer.append(RequestQueryStats(route_of(scope), status, stats))
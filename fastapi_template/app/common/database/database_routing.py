@@ -0,0 +1,212 @@
+"""
+# File: fastapi_template/app/common/database/database_routing.py
+# Description: 읽기 전용 복제본(replica) 라우팅 세션
+# - 읽기 쿼리는 복제본 엔진으로 분산 (round_robin / least_loaded)
+# - 쓰기 및 쓰기 직후의 읽기는 주(primary) 엔진으로 고정 (같은 세션, 같은 클라이언트)
+"""
+
+import hashlib
+import itertools
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Delete, Insert, Update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+
+# 세션 info에 저장되는 주 DB 고정 플래그 키
+USE_PRIMARY_KEY = "use_primary"
+
+_WRITE_STATEMENTS = (Insert, Update, Delete)
+
+# 쓰기 직후 읽기 고정 시각을 기록하는 최대 클라이언트 수 (초과하면 만료된 기록 정리)
+MAX_STICKY_CLIENTS = 10000
+
+# 현재 요청의 클라이언트 키 (요청 밖이거나 클라이언트를 알 수 없으면 None)
+_replica_client: ContextVar[Optional[str]] = ContextVar("replica_client", default=None)
+
+
+def set_replica_client(key: Optional[Any]) -> Token:
+    """
+    현재 컨텍스트의 클라이언트 키를 지정합니다 (예: 사용자 ID).
+
+    같은 키의 쓰기 이후 sticky_seconds 동안 해당 클라이언트의 읽기는 주 DB를 사용합니다.
+
+    Returns:
+        Token: 이전 값으로 되돌릴 때 사용하는 토큰 (_replica_client.reset)
+    """
+    return _replica_client.set(None if key is None else str(key))
+
+
+def current_replica_client() -> Optional[str]:
+    """현재 컨텍스트의 클라이언트 키"""
+    return _replica_client.get()
+
+
+class ReplicaStickinessMiddleware:
+    """
+    요청의 인증 정보로 클라이언트 키를 지정하는 ASGI 미들웨어
+
+    Authorization 헤더(또는 지정한 쿠키)의 해시를 키로 사용하므로, 쓰기 직후의 읽기 고정은
+    쓰기를 한 클라이언트에만 적용됩니다. 인증 정보가 없는 요청은 고정하지 않습니다.
+    """
+
+    def __init__(self, app: Any, cookie_name: Optional[str] = None):
+        self.app = app
+        self.cookie_name = cookie_name
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = set_replica_client(self._client_key(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _replica_client.reset(token)
+
+    def _client_key(self, scope: Dict[str, Any]) -> Optional[str]:
+        headers = dict(scope.get("headers") or [])
+        credential = headers.get(b"authorization")
+        if credential is None and self.cookie_name is not None:
+            cookies = headers.get(b"cookie", b"").decode("latin-1")
+            for part in cookies.split(";"):
+                name, _, value = part.strip().partition("=")
+                if name == self.cookie_name and value:
+                    credential = value.encode("latin-1")
+                    break
+        if not credential:
+            return None
+        # 인증 정보를 메모리에 그대로 두지 않도록 해시로 저장
+        return hashlib.sha256(credential).hexdigest()
+
+
+class ReplicaRouter:
+    """
+    주 엔진과 복제본 엔진 목록을 보관하고 쿼리별 대상 엔진을 선택하는 라우터
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: Sequence[Engine] = (),
+        strategy: str = "round_robin",
+        sticky_seconds: float = 5.0,
+    ):
+        """
+        라우터를 초기화합니다.
+
+        Args:
+            primary: 쓰기 및 강제 읽기에 사용할 주 엔진 (동기 엔진)
+            replicas: 읽기 전용 복제본 엔진 목록 (동기 엔진)
+            strategy: 복제본 선택 전략 (round_robin 또는 least_loaded)
+            sticky_seconds: 클라이언트의 마지막 쓰기 이후 그 클라이언트의 읽기를 주 엔진으로 고정할 시간(초)
+        """
+        if strategy not in ("round_robin", "least_loaded"):
+            raise ValueError(f"지원하지 않는 복제본 선택 전략: {strategy}")
+
+        self.primary = primary
+        self.replicas: List[Engine] = list(replicas)
+        self.strategy = strategy
+        self.sticky_seconds = sticky_seconds
+        self._cycle = itertools.cycle(self.replicas) if self.replicas else None
+        self._lock = threading.Lock()
+        self._last_write_at: Dict[str, float] = {}
+
+    def mark_write(self, client: Optional[str] = None) -> None:
+        """
+        클라이언트의 쓰기 발생 시각을 기록합니다.
+        클라이언트를 알 수 없는 쓰기(백그라운드 작업, 로그인 등)는 기록하지 않습니다.
+        """
+        if client is None or self.sticky_seconds <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._last_write_at[client] = now
+            if len(self._last_write_at) > MAX_STICKY_CLIENTS:
+                self._last_write_at = {
+                    key: at for key, at in self._last_write_at.items()
+                    if now - at < self.sticky_seconds
+                }
+
+    def in_sticky_window(self, client: Optional[str] = None) -> bool:
+        """클라이언트의 마지막 쓰기 이후 고정 시간 내인지 확인합니다."""
+        if client is None or self.sticky_seconds <= 0:
+            return False
+        last_write_at = self._last_write_at.get(client)
+        return last_write_at is not None and time.monotonic() - last_write_at < self.sticky_seconds
+
+    def select_replica(self) -> Engine:
+        """
+        전략에 따라 읽기에 사용할 복제본 엔진을 선택합니다.
+
+        Returns:
+            Engine: 선택된 복제본 엔진 (복제본이 없으면 주 엔진)
+        """
+        if not self.replicas:
+            return self.primary
+
+        if self.strategy == "least_loaded":
+            return min(self.replicas, key=_checked_out_connections)
+
+        with self._lock:
+            return next(self._cycle)
+
+
+def _checked_out_connections(engine: Engine) -> int:
+    """엔진 풀에서 현재 사용 중인 연결 수를 반환합니다."""
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if callable(checkedout) else 0
+
+
+class RoutingSession(Session):
+    """
+    ReplicaRouter를 사용해 쿼리별로 바인딩 엔진을 선택하는 세션
+
+    다음 경우에는 주 엔진을 사용합니다.
+    - flush 및 INSERT/UPDATE/DELETE 문
+    - SELECT ... FOR UPDATE, 텍스트 SQL
+    - 같은 세션(요청)에서 이미 쓰기가 발생한 경우
+    - 같은 클라이언트의 마지막 쓰기 이후 sticky_seconds가 지나지 않은 경우
+    - use_primary()로 주 엔진 사용을 강제한 경우
+    """
+
+    def __init__(self, router: Optional[ReplicaRouter] = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.router = router
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.router is None:
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+        if self._is_write(clause):
+            self.info[USE_PRIMARY_KEY] = True
+            self.router.mark_write(current_replica_client())
+            return self.router.primary
+
+        if (
+            self.info.get(USE_PRIMARY_KEY)
+            or self.router.in_sticky_window(current_replica_client())
+            or isinstance(clause, TextClause)
+            or getattr(clause, "_for_update_arg", None) is not None
+        ):
+            return self.router.primary
+
+        return self.router.select_replica()
+
+    def _is_write(self, clause: Any) -> bool:
+        """flush 중이거나 DML 문인지 확인합니다."""
+        return self._flushing or isinstance(clause, _WRITE_STATEMENTS)
+
+
+def use_primary(session: Any) -> None:
+    """
+    세션의 이후 모든 쿼리를 주 엔진으로 고정합니다.
+
+    Args:
+        session: AsyncSession 또는 Session
+    """
+    session.info[USE_PRIMARY_KEY] = True
@@ -5,28 +5,119 @@
 
 from typing import AsyncGenerator
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
 from fastapi_template.app.common.config import config_settings
+from fastapi_template.app.common.database.database_routing import ReplicaRouter, RoutingSession
+from fastapi_template.app.common.database.database_sharding import ShardMap
+from fastapi_template.app.common.database.database_sqlite import (
+    SerializedAsyncSession,
+    SQLiteWriteQueue,
+    apply_sqlite_pragmas,
+    build_sqlite_pragmas,
+    enable_sqlite_foreign_keys,
+    is_sqlite_url,
+    sqlite_engine_options,
+)
+from fastapi_template.app.common.database.database_unit_of_work import UnitOfWork
+
+
+def to_async_database_url(url: str) -> str:
+    """
+    동기 데이터베이스 URL을 비동기 드라이버 URL로 변환합니다.
+    SQLite와 PostgreSQL 모두 지원
+    """
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://")
+    if url.startswith("sqlite:///"):
+        # SQLite는 asyncio 지원을 위해 aiosqlite 드라이버 사용
+        return url.replace("sqlite:///", "sqlite+aiosqlite:///")
+    return url
+
+
+def create_database_engine(url: str) -> AsyncEngine:
+    """
+    기본 설정으로 비동기 엔진을 생성합니다 (고성능 모드가 아닌 주 DB, 복제본, 샤드).
+    SQLite는 ON DELETE CASCADE가 동작하도록 연결마다 외래 키 제약을 활성화합니다.
+    """
+    async_engine = create_async_engine(
+        url,
+        pool_pre_ping=True,
+        echo=config_settings.DB_ECHO_LOG,
+        query_cache_size=config_settings.DB_QUERY_CACHE_SIZE,
+    )
+    if is_sqlite_url(url):
+        enable_sqlite_foreign_keys(async_engine)
+    return async_engine
+
 
 # 비동기 데이터베이스 URL 처리
-# SQLite와 PostgreSQL 모두 지원
-ASYNC_SQLALCHEMY_DATABASE_URL = config_settings.DATABASE_URL
-if ASYNC_SQLALCHEMY_DATABASE_URL.startswith("postgresql://"):
-    ASYNC_SQLALCHEMY_DATABASE_URL = ASYNC_SQLALCHEMY_DATABASE_URL.replace(
-        "postgresql://", "postgresql+asyncpg://"
+ASYNC_SQLALCHEMY_DATABASE_URL = to_async_database_url(config_settings.DATABASE_URL)
+
+# SQLite 고성능 모드 여부 (WAL, PRAGMA 튜닝, 전용 풀, 쓰기 직렬화)
+SQLITE_PERFORMANCE_MODE = bool(
+    is_sqlite_url(ASYNC_SQLALCHEMY_DATABASE_URL) and config_settings.SQLITE_PERFORMANCE_MODE
+)
+
+# 비동기 엔진 생성
+if SQLITE_PERFORMANCE_MODE:
+    async_engine = create_async_engine(
+        ASYNC_SQLALCHEMY_DATABASE_URL,
+        echo=config_settings.DB_ECHO_LOG,
+        query_cache_size=config_settings.DB_QUERY_CACHE_SIZE,
+        **sqlite_engine_options(ASYNC_SQLALCHEMY_DATABASE_URL, config_settings.SQLITE_POOL_SIZE),
     )
-elif ASYNC_SQLALCHEMY_DATABASE_URL.startswith("sqlite:///"):
-    # SQLite는 asyncio 지원을 위해 aiosqlite 드라이버 사용
-    ASYNC_SQLALCHEMY_DATABASE_URL = ASYNC_SQLALCHEMY_DATABASE_URL.replace(
-        "sqlite:///", "sqlite+aiosqlite:///"
+    apply_sqlite_pragmas(
+        async_engine,
+        build_sqlite_pragmas(
+            synchronous=config_settings.SQLITE_SYNCHRONOUS,
+            mmap_size=config_settings.SQLITE_MMAP_SIZE,
+            cache_size=config_settings.SQLITE_CACHE_SIZE,
+            busy_timeout=config_settings.SQLITE_BUSY_TIMEOUT,
+        ),
     )
+else:
+    async_engine = create_database_engine(ASYNC_SQLALCHEMY_DATABASE_URL)
 
-# 비동기 엔진 생성
-async_engine = create_async_engine(
-    ASYNC_SQLALCHEMY_DATABASE_URL, pool_pre_ping=True, echo=config_settings.DB_ECHO_LOG
-)
+# 읽기 전용 복제본 엔진 생성 (DATABASE_REPLICA_URLS가 설정된 경우)
+ASYNC_REPLICA_DATABASE_URLS = [
+    to_async_database_url(url) for url in (config_settings.DATABASE_REPLICA_URLS or [])
+]
+replica_async_engines = [create_database_engine(url) for url in ASYNC_REPLICA_DATABASE_URLS]
+
+# 복제본이 있으면 읽기/쓰기 라우팅 세션 사용
+replica_router = None
+session_options = {"class_": AsyncSession}
+if replica_async_engines:
+    replica_router = ReplicaRouter(
+        primary=async_engine.sync_engine,
+        replicas=[replica.sync_engine for replica in replica_async_engines],
+        strategy=config_settings.DATABASE_REPLICA_STRATEGY,
+        sticky_seconds=config_settings.DATABASE_REPLICA_STICKY_SECONDS,
+    )
+    session_options.update(sync_session_class=RoutingSession, router=replica_router)
+
+# 샤드 엔진 생성 (DATABASE_SHARD_URLS가 설정된 경우)
+ASYNC_SHARD_DATABASE_URLS = [
+    to_async_database_url(url) for url in (config_settings.DATABASE_SHARD_URLS or [])
+]
+shard_async_engines = [create_database_engine(url) for url in ASYNC_SHARD_DATABASE_URLS]
+
+# 샤드가 있으면 샤드 키(소유자 ID)로 샤드를 선택하는 샤딩 세션 사용
+# (사용자 등 샤드가 아닌 모델은 주 DB에 저장)
+shard_map = None
+if shard_async_engines:
+    if replica_router is not None:
+        raise ValueError("DATABASE_SHARD_URLS와 DATABASE_REPLICA_URLS는 함께 사용할 수 없습니다")
+    shard_map = ShardMap(shard_async_engines, default=async_engine)
+    session_options.update(shard_map.session_options())
+
+# SQLite는 동시에 하나의 쓰기만 허용하므로 쓰기 트랜잭션을 대기열로 직렬화
+sqlite_write_queue = None
+if SQLITE_PERFORMANCE_MODE and config_settings.SQLITE_SERIALIZE_WRITES:
+    sqlite_write_queue = SQLiteWriteQueue()
+    session_options.update(class_=SerializedAsyncSession, write_queue=sqlite_write_queue)
 
 # 비동기 세션 팩토리
 AsyncSessionLocal = async_sessionmaker(
@@ -34,11 +125,13 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
-    class_=AsyncSession,
+    **session_options,
 )
 
 # 동기 엔진 (마이그레이션 등의 용도)
 engine = create_engine(config_settings.DATABASE_URL, pool_pre_ping=True)
+if is_sqlite_url(config_settings.DATABASE_URL):
+    enable_sqlite_foreign_keys(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -49,3 +142,18 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+async def get_transactional_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    요청 전체를 하나의 트랜잭션으로 묶는 비동기 데이터베이스 세션 제공 (Unit of Work)
+
+    엔드포인트가 정상 종료되면 한 번 커밋하고, 예외가 발생하면 전체를 롤백합니다.
+    응답을 보내기 전에 커밋되도록 scope="function"으로 사용합니다.
+
+    Example:
+        db: AsyncSession = Depends(get_transactional_db, scope="function")
+    """
+    async with AsyncSessionLocal() as session:
+        async with UnitOfWork(session):
+            yield session
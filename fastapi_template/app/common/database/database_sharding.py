@@ -0,0 +1,455 @@
+"""
+# File: fastapi_template/app/common/database/database_sharding.py
+# Description: 사용자 소유 데이터의 수평 샤딩
+# - __shard_key__가 선언된 모델(예: Item.owner_id)은 샤드 키 값으로 샤드 DB를 선택
+# - 그 외 모델(사용자, 토큰 등)은 기본(default) DB에 저장
+# - 샤드 키/ID 조건이 없는 조회는 모든 샤드에서 실행하여 합침 (scatter-gather)
+"""
+
+import asyncio
+import heapq
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, func, insert, select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BindParameter, ColumnClause
+
+from fastapi_template.app.common.database.database_index_advisor import _conjuncts
+
+# 샤드가 아닌 모델을 저장하는 기본 DB의 샤드 ID
+DEFAULT_SHARD = "default"
+
+# 삽입한 객체를 다시 조회할 때 IN 조건 하나에 넣을 최대 ID 수
+LOAD_BATCH_SIZE = 500
+
+# 샤드 모델의 전역 ID 할당 테이블 (기본 DB, 일반 스키마와 별도로 관리)
+sequence_metadata = MetaData()
+shard_sequence = Table(
+    "shard_sequence",
+    sequence_metadata,
+    Column("name", String(64), primary_key=True),
+    Column("next_value", Integer, nullable=False),
+)
+
+
+def shard_key_of(mapper: Any) -> Optional[str]:
+    """모델에 선언된 샤드 키 컬럼명 (샤드 모델이 아니면 None)"""
+    return getattr(getattr(mapper, "class_", None), "__shard_key__", None)
+
+
+class ShardMap:
+    """
+    샤드 키 값과 샤드 엔진의 대응 및 샤드 선택 규칙
+
+    샤드 모델의 행은 샤드 키 값 % 샤드 수 번째 샤드에 저장되며 (샤드 키가 None이면 첫 샤드),
+    ID는 모든 샤드에서 고유하도록 "할당 번호 * 샤드 수 + 샤드 번호"로 부여하므로
+    ID만으로도 행이 있는 샤드를 알 수 있습니다.
+    샤드 수를 바꾸면 기존 행의 위치가 달라지므로 데이터를 다시 배치해야 합니다.
+
+    Example:
+        class Item(BaseModel):
+            __shard_key__ = "owner_id"
+
+        shard_map = ShardMap([shard0_engine, shard1_engine], default=async_engine)
+        await shard_map.create_all(Base)
+        AsyncSessionLocal = async_sessionmaker(async_engine, **shard_map.session_options())
+    """
+
+    def __init__(self, shards: Sequence[AsyncEngine], default: AsyncEngine):
+        """
+        Args:
+            shards: 샤드 모델을 저장할 샤드 엔진 목록 (비동기 엔진, 순서가 샤드 번호)
+            default: 샤드가 아닌 모델과 ID 할당 테이블을 저장할 기본 엔진
+        """
+        if not shards:
+            raise ValueError("샤드 엔진이 하나 이상 필요합니다")
+        self.shard_ids = [f"shard{index}" for index in range(len(shards))]
+        self.engines: Dict[str, AsyncEngine] = {
+            DEFAULT_SHARD: default,
+            **dict(zip(self.shard_ids, shards)),
+        }
+
+    # 샤드 선택
+
+    def shard_for(self, key: Optional[int]) -> str:
+        """샤드 키 값(owner_id/user_id)이 속한 샤드"""
+        if key is None:
+            return self.shard_ids[0]
+        return self.shard_ids[int(key) % len(self.shard_ids)]
+
+    def shard_of_id(self, id: int) -> str:
+        """샤드 모델 ID가 속한 샤드"""
+        return self.shard_ids[int(id) % len(self.shard_ids)]
+
+    def make_id(self, ticket: int, shard_id: str) -> int:
+        """할당 번호와 샤드로 전역 고유 ID 생성 (shard_of_id(id) == shard_id)"""
+        return ticket * len(self.shard_ids) + self.shard_ids.index(shard_id)
+
+    def choose_shard(self, mapper: Any, instance: Any, clause: Any = None, **kw: Any) -> str:
+        """저장(flush)할 객체의 샤드"""
+        key = shard_key_of(mapper)
+        if key is None:
+            return DEFAULT_SHARD
+        if instance is None:
+            raise ValueError(
+                f"{mapper.class_.__name__}의 샤드를 알 수 없습니다. "
+                "샤드 키 조건을 지정하거나 bind_arguments={'shard_id': ...}를 사용하세요."
+            )
+        return self.shard_for(getattr(instance, key))
+
+    def choose_identity(self, mapper: Any, primary_key: Any, **kw: Any) -> List[str]:
+        """기본 키로 조회할 객체의 샤드 (session.get, 지연 로딩)"""
+        if shard_key_of(mapper) is None:
+            return [DEFAULT_SHARD]
+        return [self.shard_of_id(primary_key[0])]
+
+    def choose_execute(self, orm_context: Any) -> List[str]:
+        """
+        실행할 문장의 샤드 목록
+
+        샤드 모델의 문장은 WHERE 최상위 AND 조건의 샤드 키/ID 비교(=, IN)로 샤드를 좁히고,
+        비교가 없거나 OR/NOT 안에 샤드 키/ID 비교가 있으면 모든 샤드에서 실행합니다
+        (결과는 샤드 순서로 이어 붙임).
+        """
+        mapper = orm_context.bind_mapper
+        key = shard_key_of(mapper)
+        if key is None:
+            return [DEFAULT_SHARD]
+
+        statement = orm_context.statement
+        if orm_context.is_insert:
+            raise ValueError(
+                f"{mapper.class_.__name__} 대량 INSERT는 샤드별로 나누어 실행해야 합니다 "
+                "(BaseRepository.bulk_create 사용)"
+            )
+
+        table = mapper.local_table
+        by_key = {table.c[key]: self.shard_for, table.c.id: self.shard_of_id}
+        comparisons, nested = _where_comparisons(statement, orm_context.parameters)
+        if any(column.shares_lineage(c) for column in nested for c in by_key):
+            return list(self.shard_ids)
+        shards: List[str] = []
+        for column, values in comparisons:
+            choose = next((f for c, f in by_key.items() if column.shares_lineage(c)), None)
+            if choose is not None:
+                shards.extend(choose(value) for value in values if value is not None)
+        return list(dict.fromkeys(shards)) or list(self.shard_ids)
+
+    def session_options(self) -> Dict[str, Any]:
+        """async_sessionmaker에 전달할 샤딩 세션 옵션"""
+        return {"sync_session_class": ShardRoutingSession, "shard_map": self}
+
+    # 전역 ID 할당
+
+    def allocate_tickets(self, session: Any, name: str, count: int) -> range:
+        """
+        ID 할당 번호 count개를 예약합니다.
+
+        SQLite는 쓰기가 하나씩만 가능하므로 세션의 기본 DB 트랜잭션에서 예약하고
+        (별도 연결은 세션이 가진 쓰기 잠금을 기다림), 그 외 DB는 할당 행의 잠금이
+        세션 트랜잭션 동안 유지되지 않도록 별도 트랜잭션에서 예약합니다.
+        flush 중에 호출되며, SerializedAsyncSession은 flush 전에 쓰기 대기열을 획득합니다.
+        """
+        default = self.engines[DEFAULT_SHARD].sync_engine
+        statement = _reserve_statement(name, count)
+        if default.dialect.name == "sqlite":
+            connection = session.connection(bind_arguments={"shard_id": DEFAULT_SHARD})
+            return _reserved(connection.execute(statement), name, count)
+        with default.begin() as connection:
+            return _reserved(connection.execute(statement), name, count)
+
+    async def reserve_tickets(self, db: AsyncSession, name: str, count: int) -> range:
+        """
+        allocate_tickets의 AsyncSession 버전
+
+        SQLite에서는 db.execute로 예약하므로, 쓰기 대기열을 사용하는 세션
+        (SerializedAsyncSession)은 기본 DB의 쓰기 잠금보다 대기열을 먼저 획득합니다.
+        """
+        default = self.engines[DEFAULT_SHARD]
+        statement = _reserve_statement(name, count)
+        if default.dialect.name == "sqlite":
+            result = await db.execute(statement, bind_arguments={"shard_id": DEFAULT_SHARD})
+            return _reserved(result, name, count)
+        async with default.begin() as connection:
+            return _reserved(await connection.execute(statement), name, count)
+
+    def assign_ids(self, session: Any, mapper: Any, objects: Sequence[Any]) -> None:
+        """
+        flush할 샤드 모델 객체에 샤드를 반영한 전역 ID를 부여합니다.
+
+        롤백된 트랜잭션에서 예약한 번호는 다시 할당될 수 있으므로, 이미 ID가 있어도
+        항상 새로 부여합니다 (샤드 모델의 ID는 직접 지정할 수 없음).
+        """
+        if objects:
+            tickets = self.allocate_tickets(session, mapper.local_table.name, len(objects))
+            self._apply_ids(mapper, objects, tickets)
+
+    def _apply_ids(self, mapper: Any, objects: Sequence[Any], tickets: range) -> None:
+        key = shard_key_of(mapper)
+        for ticket, obj in zip(tickets, objects):
+            _set(obj, "id", self.make_id(ticket, self.shard_for(_get(obj, key))))
+
+    async def split(
+        self, db: AsyncSession, model: Any, rows: Sequence[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        대량 삽입할 행에 ID를 부여하고 샤드별로 나눔
+
+        Example:
+            for shard_id, shard_rows in (await shard_map.split(db, Item, rows)).items():
+                await db.execute(insert(Item.__table__), shard_rows, bind_arguments={"shard_id": shard_id})
+        """
+        mapper = sa_inspect(model)
+        tickets = await self.reserve_tickets(db, mapper.local_table.name, len(rows))
+        self._apply_ids(mapper, rows, tickets)
+        key = shard_key_of(mapper)
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(self.shard_for(row.get(key)), []).append(row)
+        return groups
+
+    async def insert(
+        self,
+        db: AsyncSession,
+        model: Any,
+        rows: Sequence[Dict[str, Any]],
+        *,
+        batch_size: Optional[int] = None,
+        return_objects: bool = True,
+    ) -> List[Any]:
+        """
+        샤드 모델 행을 샤드별로 나누어 삽입합니다 (커밋은 호출자가 수행).
+
+        샤딩 세션은 ORM 대량 INSERT(insert(Model).returning(Model))를 지원하지 않으므로
+        테이블 INSERT로 삽입한 뒤, 미리 부여한 ID로 객체를 다시 조회합니다.
+
+        Args:
+            db: 샤딩 세션
+            model: 샤드 모델 클래스
+            rows: 삽입할 행 (ID가 부여됨)
+            batch_size: INSERT 한 번에 넣을 최대 행 수 (기본값: 샤드별 전체)
+            return_objects: 삽입한 객체를 조회하여 반환할지 여부
+
+        Returns:
+            List: 행 순서대로 삽입된 객체 (return_objects=False면 빈 목록)
+        """
+        table = sa_inspect(model).local_table
+        for shard_id, shard_rows in (await self.split(db, model, rows)).items():
+            size = batch_size or len(shard_rows)
+            for start in range(0, len(shard_rows), size):
+                await db.execute(
+                    insert(table), shard_rows[start:start + size], bind_arguments={"shard_id": shard_id}
+                )
+        if not return_objects:
+            return []
+
+        ids = [row["id"] for row in rows]
+        loaded: Dict[int, Any] = {}
+        for start in range(0, len(ids), LOAD_BATCH_SIZE):
+            # ID 조건으로 해당 샤드에서만 조회
+            result = await db.scalars(select(model).where(model.id.in_(ids[start:start + LOAD_BATCH_SIZE])))
+            loaded.update((obj.id, obj) for obj in result)
+        return [loaded[id] for id in ids]
+
+    # 스키마
+
+    async def create_all(self, base: Any) -> None:
+        """
+        기본 DB에 샤드가 아닌 테이블과 ID 할당 테이블을, 각 샤드 DB에 샤드 테이블을 생성합니다.
+        (이미 있는 테이블은 건너뜀)
+
+        샤드 테이블은 다른 DB에 있는 테이블을 참조할 수 없으므로 외래 키 없이 생성하며,
+        사용자 삭제 시 샤드 행은 ON DELETE CASCADE 대신 명시적으로 삭제해야 합니다.
+
+        Args:
+            base: 선언적 기본 클래스 (예: Base)
+        """
+        metadata = base.metadata
+        sharded = {
+            mapper.local_table.name: mapper.local_table
+            for mapper in base.registry.mappers
+            if shard_key_of(mapper) is not None
+        }
+        async with self.engines[DEFAULT_SHARD].begin() as conn:
+            await conn.run_sync(
+                metadata.create_all,
+                tables=[table for table in metadata.sorted_tables if table.name not in sharded],
+            )
+            await conn.run_sync(sequence_metadata.create_all)
+            existing = set((await conn.execute(select(shard_sequence.c.name))).scalars())
+            missing = [{"name": name, "next_value": 1} for name in sharded if name not in existing]
+            if missing:
+                await conn.execute(shard_sequence.insert(), missing)
+
+        shard_metadata = MetaData()
+        for table in sharded.values():
+            copy = table.to_metadata(shard_metadata)
+            # 테이블 DDL 이벤트(전문 검색 인덱스 등)도 샤드 테이블에서 실행
+            copy.dispatch._update(table.dispatch, only_propagate=False)
+            for constraint in list(copy.foreign_key_constraints):
+                copy.constraints.discard(constraint)
+            copy.foreign_keys.clear()
+            for column in copy.columns:
+                column.foreign_keys.clear()
+        for shard_id in self.shard_ids:
+            async with self.engines[shard_id].begin() as conn:
+                await conn.run_sync(shard_metadata.create_all)
+
+    # scatter-gather
+
+    async def gather(
+        self,
+        query: Any,
+        *,
+        key: Optional[Callable[[Any], Any]] = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        모든 샤드에서 쿼리를 동시에 실행하고 결과 행을 합칩니다.
+
+        key가 주어지면 샤드별로 정렬된 결과를 정렬 순서대로 병합하고 offset/limit을 적용합니다.
+        각 샤드에는 offset + limit행만 요청하므로 깊은 오프셋일수록 비용이 커집니다 (커서 권장).
+
+        Args:
+            query: 정렬(order_by)이 적용된 select (offset/limit 미적용)
+            key: 결과 행의 정렬 키 (쿼리의 order_by와 같은 순서)
+            descending: 내림차순 정렬 여부
+            offset: 병합 결과에서 건너뛸 행 수
+            limit: 반환할 최대 행 수
+
+        Returns:
+            List[Row]: 병합된 결과 행
+        """
+        if limit is not None:
+            query = query.limit(offset + limit)
+
+        async def run(shard_id: str) -> List[Any]:
+            async with AsyncSession(self.engines[shard_id], expire_on_commit=False) as session:
+                return list((await session.execute(query)).all())
+
+        results = await asyncio.gather(*(run(shard_id) for shard_id in self.shard_ids))
+        if key is None:
+            rows = [row for result in results for row in result]
+        else:
+            rows = list(heapq.merge(*results, key=key, reverse=descending))
+        stop = None if limit is None else offset + limit
+        return rows[offset:stop]
+
+    async def count(self, query: Any) -> int:
+        """모든 샤드에서 쿼리 결과 행 수를 세어 합산"""
+        counted = select(func.count()).select_from(query.order_by(None).subquery())
+        return sum(row[0] for row in await self.gather(counted))
+
+
+class ShardRoutingSession(ShardedSession):
+    """
+    ShardMap으로 모델/문장별 샤드를 선택하는 세션
+
+    - 샤드가 아닌 모델, 텍스트 SQL: 기본 DB
+    - 샤드 모델 객체 저장: 샤드 키 값의 샤드 (ID는 flush 전에 전역 고유 값으로 부여)
+    - 샤드 모델 조회/수정/삭제: WHERE의 샤드 키/ID 조건으로 선택, 없으면 모든 샤드
+    """
+
+    def __init__(self, shard_map: ShardMap, **kwargs: Any):
+        super().__init__(
+            shard_chooser=shard_map.choose_shard,
+            identity_chooser=shard_map.choose_identity,
+            execute_chooser=shard_map.choose_execute,
+            shards={shard_id: engine.sync_engine for shard_id, engine in shard_map.engines.items()},
+            **kwargs,
+        )
+        self.shard_map = shard_map
+
+    def get_bind(self, mapper=None, *, shard_id=None, instance=None, clause=None, **kw):
+        if shard_id is None and mapper is None and instance is None:
+            # 매퍼가 없는 문장(텍스트 SQL 등)과 db.get_bind()는 기본 DB
+            shard_id = DEFAULT_SHARD
+        return super().get_bind(mapper, shard_id=shard_id, instance=instance, clause=clause, **kw)
+
+    def flush(self, objects: Optional[Iterable[Any]] = None) -> None:
+        pending: Dict[Any, List[Any]] = {}
+        for obj in self.new:
+            mapper = sa_inspect(obj).mapper
+            if shard_key_of(mapper) is not None:
+                pending.setdefault(mapper, []).append(obj)
+        for mapper, objs in pending.items():
+            self.shard_map.assign_ids(self, mapper, objs)
+        super().flush(objects)
+
+
+def shard_map_of(db: Any) -> Optional[ShardMap]:
+    """세션이 샤딩 세션이면 ShardMap, 아니면 None"""
+    return getattr(getattr(db, "sync_session", db), "shard_map", None)
+
+
+def _reserve_statement(name: str, count: int) -> Any:
+    return (
+        shard_sequence.update()
+        .where(shard_sequence.c.name == name)
+        .values(next_value=shard_sequence.c.next_value + count)
+        .returning(shard_sequence.c.next_value)
+    )
+
+
+def _reserved(result: Any, name: str, count: int) -> range:
+    end = result.scalar_one_or_none()
+    if end is None:
+        raise RuntimeError(f"{name} ID 할당 행이 없습니다 (ShardMap.create_all 실행 필요)")
+    return range(end - count, end)
+
+
+def _get(obj: Any, name: str) -> Any:
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name)
+
+
+def _set(obj: Any, name: str, value: Any) -> None:
+    if isinstance(obj, dict):
+        obj[name] = value
+    else:
+        setattr(obj, name, value)
+
+
+def _where_comparisons(statement: Any, parameters: Any) -> Tuple[List[Any], List[Any]]:
+    """
+    WHERE 최상위 AND 조건의 "컬럼 = 값", "컬럼 IN (값, ...)" 비교 목록 [(컬럼, [값, ...])]과
+    그 밖의 조건(OR, NOT, 하위 쿼리 등) 안에서 비교된 컬럼 목록
+
+    OR/NOT 안의 비교는 샤드를 좁히지 못하므로 최상위 AND 조건만 샤드 선택에 사용합니다.
+    """
+    criteria = getattr(statement, "whereclause", None)
+    if criteria is None:
+        return [], []
+    params = parameters if isinstance(parameters, dict) else {}
+
+    def value_of(bind: Any) -> Any:
+        if bind.callable is None and bind.value is None and bind.key in params:
+            return params[bind.key]
+        return bind.effective_value
+
+    def comparison_of(condition: Any) -> Optional[Tuple[Any, List[Any]]]:
+        if getattr(condition, "operator", None) not in (operators.eq, operators.in_op):
+            return None
+        for column, other in ((condition.left, condition.right), (condition.right, condition.left)):
+            if isinstance(column, ColumnClause) and isinstance(other, BindParameter):
+                value = value_of(other)
+                return column, list(value) if isinstance(value, (list, tuple, set)) else [value]
+        return None
+
+    comparisons = []
+    nested = []
+
+    def visit_binary(binary: Any) -> None:
+        nested.extend(c for c in (binary.left, binary.right) if isinstance(c, ColumnClause))
+
+    for condition in _conjuncts(criteria):
+        comparison = comparison_of(condition)
+        if comparison is not None:
+            comparisons.append(comparison)
+        else:
+            visitors.traverse(condition, {}, {"binary": visit_binary})
+    return comparisons, nested
@@ -0,0 +1,321 @@
+"""
+# File: fastapi_template/app/common/database/database_slow_query.py
+# Description: 느린 쿼리 기록
+# - before/after_cursor_execute 이벤트로 실행 시간을 측정하여 기준 시간 이상인 쿼리만 기록
+# - 요청 경로(라우트)와 호출한 리포지토리/서비스 메서드를 함께 기록, 파라미터 값은 기본적으로 가림
+# - 선택적으로 문장별 실행 계획(EXPLAIN, 실행 없음)을 별도 연결에서 한 번만 수집
+# - 최근 기록을 문장별로 합산한 상위 N개 보고서 제공
+"""
+
+import asyncio
+import logging
+import re
+import sys
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Set
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청의 ASGI scope (QueryContextMiddleware가 설정)
+_request_scope: ContextVar[Optional[Dict[str, Any]]] = ContextVar("request_scope", default=None)
+
+# 호출 위치로 기록할 모듈 (리포지토리, 서비스)
+_CALLER_MODULE = re.compile(r"(^|\.)app\.(services|common\.repositories)\.")
+
+_STARTED_KEY = "slow_query_started"
+
+_EXPLAIN_PREFIX = {
+    "postgresql": "EXPLAIN (ANALYZE off)",
+    "sqlite": "EXPLAIN QUERY PLAN",
+}
+
+
+class SlowQuery(NamedTuple):
+    """기준 시간 이상 걸린 쿼리 한 건"""
+
+    statement: str
+    parameters: Any
+    duration_ms: float
+    route: Optional[str]
+    caller: Optional[str]
+    at: float
+
+
+class SlowQueryStats(NamedTuple):
+    """문장별 느린 쿼리 합계"""
+
+    statement: str
+    calls: int
+    total_ms: float
+    max_ms: float
+    route: Optional[str]
+    caller: Optional[str]
+    parameters: Any
+    plan: Optional[str]
+
+
+class QueryContextMiddleware:
+    """
+    느린 쿼리를 요청 경로와 연결하기 위해 현재 요청의 scope를 컨텍스트 변수에 저장하는 ASGI 미들웨어
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_scope.reset(token)
+
+
+def current_route() -> Optional[str]:
+    """현재 요청의 라우트 (예: "PUT /api/v1/items/{item_id}"), 요청 밖이면 None"""
+    scope = _request_scope.get()
+    if scope is None:
+        return None
+    return route_of(scope)
+
+
+def route_of(scope: Dict[str, Any]) -> str:
+    """요청 scope의 라우트 템플릿 (라우트가 매칭되지 않았으면 실제 경로)"""
+    route = scope.get("route")
+    path = getattr(route, "path_format", None) or getattr(route, "path", None) or scope.get("path")
+    return f"{scope.get('method')} {scope.get('root_path', '')}{path}"
+
+
+def _frames() -> Iterator[Any]:
+    """현재 스택과, 비동기 세션을 기다리는 부모 greenlet(코루틴 호출 체인)의 스택"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+    parent = greenlet.getcurrent().parent
+    frame = parent.gr_frame if parent is not None else None
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+
+def current_caller() -> Optional[str]:
+    """쿼리를 실행한 가장 안쪽의 공개 리포지토리/서비스 메서드 (예: "ItemRepository.get")"""
+    for frame in _frames():
+        code = frame.f_code
+        if code.co_name.startswith("_"):
+            continue
+        if not _CALLER_MODULE.search(frame.f_globals.get("__name__", "")):
+            continue
+        owner = frame.f_locals.get("self")
+        if owner is not None:
+            return f"{type(owner).__name__}.{code.co_name}"
+        return getattr(code, "co_qualname", code.co_name)
+    return None
+
+
+def redact(parameters: Any) -> Any:
+    """파라미터 값을 타입 이름으로 바꿉니다. (executemany는 행 수만 기록)"""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f"<{len(parameters)} rows>"
+        return [type(value).__name__ for value in parameters]
+    return parameters
+
+
+class SlowQueryLog:
+    """
+    느린 쿼리 기록기
+
+    attach()한 엔진에서 threshold_ms 이상 걸린 쿼리를 로그로 남기고 최근 history건을 보관합니다.
+    report()는 보관된 기록을 문장별로 합산하여 총 소요 시간이 긴 순서로 반환합니다.
+
+    Example:
+        slow_query_log.configure(threshold_ms=200, explain=True)
+        slow_query_log.attach(async_engine)
+        ...
+        for stats in slow_query_log.report(limit=10):
+            print(stats.total_ms, stats.statement, stats.plan)
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = 200.0,
+        *,
+        explain: bool = False,
+        redact_parameters: bool = True,
+        history: int = 1000,
+    ):
+        """
+        Args:
+            threshold_ms: 기록할 최소 실행 시간(밀리초)
+            explain: 느린 문장의 실행 계획 수집 여부 (PostgreSQL, SQLite)
+            redact_parameters: 파라미터 값을 가릴지 여부
+            history: 보관할 최근 기록 수
+        """
+        self._engines: Dict[Any, AsyncEngine] = {}
+        self._plans: Dict[str, str] = {}
+        self._explaining: Set[asyncio.Task] = set()
+        self.configure(
+            threshold_ms=threshold_ms,
+            explain=explain,
+            redact_parameters=redact_parameters,
+            history=history,
+        )
+
+    def configure(
+        self,
+        *,
+        threshold_ms: float,
+        explain: bool = False,
+        redact_parameters: bool = True,
+        history: int = 1000,
+    ) -> None:
+        """설정을 변경합니다. (보관된 기록은 삭제)"""
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self.redact_parameters = redact_parameters
+        self._entries: Deque[SlowQuery] = deque(maxlen=history)
+        self._plans.clear()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._engines)
+
+    def attach(self, *engines: AsyncEngine) -> None:
+        """엔진의 쿼리 실행 시간 측정을 시작합니다."""
+        for engine in engines:
+            sync_engine = engine.sync_engine
+            if sync_engine in self._engines:
+                continue
+            event.listen(sync_engine, "before_cursor_execute", self._before)
+            event.listen(sync_engine, "after_cursor_execute", self._after)
+            event.listen(sync_engine, "handle_error", self._handle_error)
+            self._engines[sync_engine] = engine
+
+    def detach(self) -> None:
+        """모든 엔진의 측정을 중지합니다. (보관된 기록은 유지)"""
+        for sync_engine in self._engines:
+            event.remove(sync_engine, "before_cursor_execute", self._before)
+            event.remove(sync_engine, "after_cursor_execute", self._after)
+            event.remove(sync_engine, "handle_error", self._handle_error)
+        self._engines.clear()
+
+    def clear(self) -> None:
+        """보관된 기록과 실행 계획을 삭제합니다."""
+        self._entries.clear()
+        self._plans.clear()
+
+    def entries(self) -> List[SlowQuery]:
+        """보관된 최근 기록 (오래된 순)"""
+        return list(self._entries)
+
+    def _before(
+        self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+    def _after(
+        self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        started = conn.info.get(_STARTED_KEY)
+        if not started:
+            return
+        duration_ms = (time.perf_counter() - started.pop()) * 1000
+        if duration_ms < self.threshold_ms or statement.startswith("EXPLAIN"):
+            return
+
+        entry = SlowQuery(
+            statement=statement,
+            parameters=redact(parameters) if self.redact_parameters else parameters,
+            duration_ms=duration_ms,
+            route=current_route(),
+            caller=current_caller(),
+            at=time.time(),
+        )
+        self._entries.append(entry)
+        logger.warning(
+            f"느린 쿼리 {duration_ms:.1f}ms [{entry.route or '-'}] {entry.caller or '-'}: "
+            f"{statement} {entry.parameters}"
+        )
+
+        if self.explain and not executemany and statement not in self._plans:
+            self._schedule_explain(conn, statement, parameters)
+
+    def _handle_error(self, context: Any) -> None:
+        # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시간만 제거 (기록하지 않음)
+        conn = context.connection
+        started = conn.info.get(_STARTED_KEY) if conn is not None else None
+        if started:
+            started.pop()
+
+    def _schedule_explain(self, conn: Connection, statement: str, parameters: Any) -> None:
+        """실행 중인 연결 대신 별도 연결에서 실행 계획을 수집하도록 예약합니다."""
+        engine = self._engines.get(conn.engine)
+        prefix = _EXPLAIN_PREFIX.get(conn.dialect.name)
+        if engine is None or prefix is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # 같은 문장에 대해 한 번만 수집
+        self._plans[statement] = ""
+        task = loop.create_task(self._explain(engine, prefix, statement, parameters))
+        self._explaining.add(task)
+        task.add_done_callback(self._explaining.discard)
+
+    async def _explain(self, engine: AsyncEngine, prefix: str, statement: str, parameters: Any) -> None:
+        try:
+            async with engine.connect() as conn:
+                result = await conn.exec_driver_sql(f"{prefix} {statement}", parameters)
+                self._plans[statement] = "\n".join(str(row[-1]) for row in result)
+        except Exception as exc:
+            logger.warning(f"느린 쿼리 실행 계획 수집 실패: {exc}")
+            self._plans.pop(statement, None)
+
+    async def wait_for_plans(self) -> None:
+        """예약된 실행 계획 수집이 끝날 때까지 기다립니다."""
+        if self._explaining:
+            await asyncio.gather(*self._explaining, return_exceptions=True)
+
+    def report(self, limit: int = 20) -> List[SlowQueryStats]:
+        """
+        보관된 기록을 문장별로 합산한 상위 limit개를 반환합니다.
+
+        Args:
+            limit: 반환할 최대 문장 수
+
+        Returns:
+            List[SlowQueryStats]: 총 소요 시간이 긴 순서의 문장별 합계
+                (route/caller/parameters는 가장 최근 기록 기준)
+        """
+        totals: Dict[str, SlowQueryStats] = {}
+        for entry in self._entries:
+            previous = totals.get(entry.statement)
+            totals[entry.statement] = SlowQueryStats(
+                statement=entry.statement,
+                calls=(previous.calls if previous else 0) + 1,
+                total_ms=(previous.total_ms if previous else 0.0) + entry.duration_ms,
+                max_ms=max(previous.max_ms if previous else 0.0, entry.duration_ms),
+                route=entry.route,
+                caller=entry.caller,
+                parameters=entry.parameters,
+                plan=self._plans.get(entry.statement) or None,
+            )
+        return sorted(totals.values(), key=lambda stats: -stats.total_ms)[:limit]
+
+
+# 애플리케이션 전역 느린 쿼리 기록기 (lifespan에서 설정 후 attach)
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,213 @@
+"""
+# File: fastapi_template/app/common/database/database_sqlite.py
+# Description: SQLite(aiosqlite) 고성능 모드 설정
+# - 연결 시 PRAGMA 튜닝 적용 (WAL, synchronous, mmap, cache 등)
+# - SQLite에 맞는 커넥션 풀 선택
+# - 쓰기 작업 직렬화로 "database is locked" 오류 방지
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Delete, Insert, Update, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+_WRITE_STATEMENTS = (Insert, Update, Delete)
+
+
+def is_sqlite_url(url: str) -> bool:
+    """SQLite 데이터베이스 URL인지 확인합니다."""
+    return url.startswith("sqlite")
+
+
+def is_sqlite_memory_url(url: str) -> bool:
+    """인메모리 SQLite 데이터베이스 URL인지 확인합니다."""
+    return is_sqlite_url(url) and make_url(url).database in (None, "", ":memory:")
+
+
+def build_sqlite_pragmas(
+    *,
+    synchronous: str = "NORMAL",
+    mmap_size: int = 268435456,
+    cache_size: int = -64000,
+    busy_timeout: int = 5000,
+    wal: bool = True,
+) -> Dict[str, Any]:
+    """
+    연결마다 적용할 PRAGMA 목록을 생성합니다.
+
+    Args:
+        synchronous: 동기화 수준 (WAL 모드에서는 NORMAL 권장)
+        mmap_size: 메모리 매핑 크기(바이트)
+        cache_size: 페이지 캐시 크기 (음수는 KiB 단위)
+        busy_timeout: 잠금 대기 시간(밀리초)
+        wal: WAL 저널 모드 사용 여부
+
+    Returns:
+        Dict[str, Any]: PRAGMA 이름과 값
+    """
+    pragmas: Dict[str, Any] = {}
+    if wal:
+        pragmas["journal_mode"] = "WAL"
+    pragmas.update(
+        {
+            "synchronous": synchronous,
+            "mmap_size": mmap_size,
+            "cache_size": cache_size,
+            "busy_timeout": busy_timeout,
+            "temp_store": "MEMORY",
+            "foreign_keys": "ON",
+        }
+    )
+    return pragmas
+
+
+def sqlite_engine_options(url: str, pool_size: int = 5) -> Dict[str, Any]:
+    """
+    SQLite에 맞는 create_async_engine 옵션을 반환합니다.
+
+    - 인메모리 DB: 모든 세션이 같은 연결을 공유하도록 StaticPool 사용
+    - 파일 DB: PRAGMA와 페이지 캐시를 재사용하도록 연결을 유지하는 큐 풀 사용
+
+    Args:
+        url: 비동기 SQLite URL
+        pool_size: 파일 DB에서 유지할 연결 수
+
+    Returns:
+        Dict[str, Any]: 엔진 생성 옵션
+    """
+    if is_sqlite_memory_url(url):
+        return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": 0,
+        "connect_args": {"check_same_thread": False},
+    }
+
+
+def apply_sqlite_pragmas(engine: AsyncEngine, pragmas: Dict[str, Any]) -> None:
+    """
+    엔진의 모든 새 연결에 PRAGMA를 적용하도록 이벤트를 등록합니다.
+
+    Args:
+        engine: 비동기 SQLite 엔진
+        pragmas: build_sqlite_pragmas()가 생성한 PRAGMA 목록
+    """
+    memory = is_sqlite_memory_url(str(engine.url))
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                # 인메모리 DB는 WAL을 지원하지 않음
+                if memory and name == "journal_mode":
+                    continue
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+class SQLiteWriteQueue:
+    """
+    SQLite 쓰기 트랜잭션을 한 번에 하나씩 실행하도록 직렬화하는 대기열
+
+    SQLite는 동시에 하나의 쓰기 트랜잭션만 허용하므로, 쓰기를 시작하는 세션은
+    먼저 대기열의 잠금을 획득하고 커밋/롤백 후 반납합니다. 잠금 대기는 FIFO 순서입니다.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """쓰기 권한을 획득합니다."""
+        await self._lock.acquire()
+
+    def release(self) -> None:
+        """쓰기 권한을 반납합니다."""
+        if self._lock.locked():
+            self._lock.release()
+
+    def locked(self) -> bool:
+        """현재 쓰기 작업이 진행 중인지 확인합니다."""
+        return self._lock.locked()
+
+
+class SerializedAsyncSession(AsyncSession):
+    """
+    쓰기 작업을 SQLiteWriteQueue로 직렬화하는 AsyncSession
+
+    flush 대상 객체가 있거나 INSERT/UPDATE/DELETE 문을 실행할 때 쓰기 권한을 획득하고,
+    commit/rollback/close 시 반납합니다.
+    """
+
+    def __init__(self, *args: Any, write_queue: Optional[SQLiteWriteQueue] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.write_queue = write_queue
+        self._holds_writer = False
+
+    def _has_pending_changes(self) -> bool:
+        return bool(self.new or self.dirty or self.deleted)
+
+    async def _acquire_writer(self) -> None:
+        if self.write_queue is not None and not self._holds_writer:
+            await self.write_queue.acquire()
+            self._holds_writer = True
+
+    def _release_writer(self) -> None:
+        if self.write_queue is not None and self._holds_writer:
+            self._holds_writer = False
+            self.write_queue.release()
+
+    async def execute(self, statement, *args: Any, **kwargs: Any):
+        if isinstance(statement, _WRITE_STATEMENTS):
+            await self._acquire_writer()
+        return await super().execute(statement, *args, **kwargs)
+
+    async def flush(self, objects=None) -> None:
+        if self._has_pending_changes():
+            await self._acquire_writer()
+        await super().flush(objects)
+
+    async def commit(self) -> None:
+        if self._has_pending_changes():
+            await self._acquire_writer()
+        try:
+            await super().commit()
+        finally:
+            self._release_writer()
+
+    async def rollback(self) -> None:
+        try:
+            await super().rollback()
+        finally:
+            self._release_writer()
+
+    async def close(self) -> None:
+        try:
+            await super().close()
+        finally:
+            self._release_writer()
+
+
+def enable_sqlite_foreign_keys(engine: Any) -> None:
+    """
+    엔진의 모든 새 연결에서 외래 키 제약(ON DELETE CASCADE 포함)을 활성화합니다.
+
+    SQLite는 연결마다 PRAGMA foreign_keys=ON을 실행해야 외래 키를 검사하므로,
+    고성능 모드가 아닌 SQLite 엔진(주 DB, 복제본, 샤드)에도 적용합니다.
+
+    Args:
+        engine: SQLite 엔진 (동기 또는 비동기)
+    """
+
+    @event.listens_for(getattr(engine, "sync_engine", engine), "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA foreign_keys=ON")
+        finally:
+            cursor.close()
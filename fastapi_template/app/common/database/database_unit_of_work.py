@@ -0,0 +1,117 @@
+"""
+# File: fastapi_template/app/common/database/database_unit_of_work.py
+# Description: 요청 단위 트랜잭션 (Unit of Work)
+# - 요청 전체를 하나의 트랜잭션으로 묶고 마지막에 한 번만 커밋
+# - 단위 작업 안에서 리포지토리/서비스의 commit(db)은 flush만 수행
+# - 세이브포인트(SAVEPOINT)로 블록 단위 부분 롤백 지원
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
+
+logger = logging.getLogger(__name__)
+
+# 세션 info에 저장되는 단위 작업 키
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+AfterTransaction = Callable[[], Awaitable[Any]]
+
+
+class UnitOfWork:
+    """
+    세션의 모든 쓰기를 하나의 트랜잭션으로 묶는 단위 작업
+
+    블록이 정상 종료되면 한 번 커밋하고, 예외가 발생하면 전체를 롤백합니다.
+    블록 안에서 commit(db)은 flush만 수행하므로 쓰기가 여러 번이어도 커밋(fsync)은
+    한 번이며, 중간에 실패해도 일부만 반영된 상태가 남지 않습니다.
+    이미 단위 작업 안인 세션으로 다시 진입하면 바깥 단위 작업에 합류합니다.
+
+    Example:
+        async with UnitOfWork(db) as uow:
+            await ItemService.create_item(db, item, owner_id)
+            async with uow.savepoint():
+                ...  # 예외가 발생하면 이 블록의 변경만 롤백
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._after_transaction: List[AfterTransaction] = []
+        self._joined = False
+
+    async def __aenter__(self) -> "UnitOfWork":
+        current = current_unit_of_work(self.session)
+        if current is not None:
+            self._joined = True
+            return current
+        self.session.info[UNIT_OF_WORK_KEY] = self
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        if self._joined:
+            return False
+
+        self.session.info.pop(UNIT_OF_WORK_KEY, None)
+        try:
+            if exc_type is None:
+                try:
+                    await self.session.commit()
+                except BaseException:
+                    await self.session.rollback()
+                    raise
+            else:
+                await self.session.rollback()
+        finally:
+            await self._run_after_transaction()
+        return False
+
+    def savepoint(self) -> AsyncSessionTransaction:
+        """
+        세이브포인트를 시작합니다.
+
+        `async with uow.savepoint():` 블록에서 예외가 발생하면 블록 안의 변경만 롤백되고
+        예외는 그대로 전파됩니다. 블록 밖의 변경은 단위 작업이 끝날 때 함께 커밋됩니다.
+        """
+        return self.session.begin_nested()
+
+    def after_transaction(self, callback: AfterTransaction) -> None:
+        """트랜잭션이 끝난 뒤(커밋 또는 롤백) 실행할 콜백을 등록합니다."""
+        self._after_transaction.append(callback)
+
+    async def _run_after_transaction(self) -> None:
+        callbacks, self._after_transaction = self._after_transaction, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                logger.exception("단위 작업 종료 후 콜백 실행 실패")
+
+
+def current_unit_of_work(db: AsyncSession) -> Optional[UnitOfWork]:
+    """세션이 속한 단위 작업을 반환합니다. (없으면 None)"""
+    return db.info.get(UNIT_OF_WORK_KEY)
+
+
+async def commit(db: AsyncSession) -> None:
+    """
+    쓰기를 확정합니다.
+
+    단위 작업 안이면 flush만 수행하고 커밋은 단위 작업이 끝날 때 한 번 실행합니다.
+    단위 작업 밖이면 바로 커밋합니다.
+    """
+    if current_unit_of_work(db) is None:
+        await db.commit()
+    else:
+        await db.flush()
+
+
+async def rollback(db: AsyncSession) -> None:
+    """
+    실패한 쓰기 후 트랜잭션을 정리합니다.
+
+    단위 작업 안이면 아무것도 하지 않습니다. 같은 요청의 이전 쓰기를 되돌릴지는
+    예외 전파 여부에 따라 단위 작업이 결정합니다.
+    """
+    if current_unit_of_work(db) is None:
+        await db.rollback()
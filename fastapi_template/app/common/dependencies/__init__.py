@@ -10,6 +10,7 @@ from app.common.dependencies.auth import (
     get_current_admin_user,
     oauth2_scheme,
 )
+from app.common.dependencies.loaders import get_loaders
 
 # 다른 의존성 타입들이 추가될 수 있음
 # 예: from app.common.dependencies.rate_limit import rate_limiter
@@ -19,4 +20,5 @@ __all__ = [
     "get_current_active_user",
     "get_current_admin_user",
     "oauth2_scheme",
+    "get_loaders",
 ]
@@ -0,0 +1,21 @@
+"""
+# File: fastapi_template/app/common/dependencies/loaders.py
+# Description: 요청 범위 데이터 로더 의존성
+# - 요청마다 DataLoaders를 생성하여 기본 키 조회를 일괄 처리
+"""
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.database import get_db
+from fastapi_template.app.common.repositories.repositories_loader import DataLoaders
+
+
+async def get_loaders(db: AsyncSession = Depends(get_db)) -> DataLoaders:
+    """
+    현재 요청의 데이터 로더를 제공하는 의존성 함수
+
+    FastAPI는 한 요청 안에서 의존성 결과를 재사용하므로
+    같은 요청의 모든 핸들러/의존성이 같은 로더(캐시)를 공유합니다.
+    """
+    return DataLoaders(db)
@@ -4,24 +4,57 @@ import logging
 from typing import Callable
 from functools import wraps
 
+from fastapi_template.app.common.database.database_query_stats import current_query_stats
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class RequestLoggingMiddleware:
+    """
+    요청마다 로그 한 줄 기록
+    - QueryStatsMiddleware 안쪽에 등록하면 요청의 쿼리 수, DB 시간, 로드된 객체 수도 함께 기록
+    - 쿼리 통계가 있으면 스트리밍 응답 본문까지 전송한 뒤 기록
+    """
+
     async def __call__(self, request: Request, call_next):
         start_time = time.time()
         
         response = await call_next(request)
         
+        stats = current_query_stats()
+        if stats is None:
+            self._log(request, response.status_code, start_time)
+            return response
+
+        body = response.body_iterator
+
+        async def body_then_log():
+            try:
+                async for chunk in body:
+                    yield chunk
+            finally:
+                self._log(request, response.status_code, start_time, stats)
+
+        response.body_iterator = body_then_log()
+        return response
+
+    @staticmethod
+    def _log(request: Request, status_code: int, start_time: float, stats=None):
         process_time = time.time() - start_time
+        queries = ""
+        if stats is not None:
+            queries = (
+                f" Queries: {stats.statements}"
+                f" DB: {stats.duration_ms:.1f}ms"
+                f" Objects: {stats.objects}"
+            )
         logger.info(
             f"Path: {request.url.path} "
             f"Method: {request.method} "
-            f"Status: {response.status_code} "
+            f"Status: {status_code} "
             f"Duration: {process_time:.3f}s"
+            f"{queries}"
         )
-        
-        return response
 
 def log_execution_time():
     def decorator(func: Callable):
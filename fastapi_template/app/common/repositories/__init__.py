@@ -4,12 +4,15 @@
 """
 
 from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+from fastapi_template.app.common.repositories.repositories_loader import DataLoaders, ModelLoader
 from fastapi_template.app.common.repositories.repositories_user import UserRepository
 from fastapi_template.app.common.repositories.repositories_auth import AuthRepository
 from fastapi_template.app.common.repositories.repository_file import FileRepository
 
 __all__ = [
     "BaseRepository",
+    "DataLoaders",
+    "ModelLoader",
     "UserRepository",
     "AuthRepository",
     "FileRepository",
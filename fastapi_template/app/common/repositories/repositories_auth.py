@@ -3,20 +3,30 @@
 # Description: 인증 관련 리포지토리 클래스
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import re
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Union
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from fastapi_template.app.common.database.database_unit_of_work import commit
 from fastapi_template.app.db.models import Token, User
 from fastapi_template.app.common.repositories.repositories_base import BaseRepository
 from fastapi_template.app.db.schemas.token import TokenCreate, TokenUpdate
 
 
+# PostgreSQL 파티션 범위 표현식의 상한 (FOR VALUES FROM (...) TO ('...'))
+_PARTITION_UPPER_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+
 class AuthRepository(BaseRepository[Token, TokenCreate, TokenUpdate]):
     """인증 토큰 관리를 위한 리포지토리 클래스"""
 
+    # clean_expired_tokens에서 한 트랜잭션으로 삭제할 최대 토큰 수
+    cleanup_batch_size: int = 5000
+
     def __init__(self):
         super().__init__(Token)
 
@@ -119,25 +129,112 @@ class AuthRepository(BaseRepository[Token, TokenCreate, TokenUpdate]):
         if token_type:
             query = query.where(Token.type == token_type)
         result = await db.execute(query)
-        await db.commit()
+        await commit(db)
+        await self.invalidate_cache(db=db)
         return result.rowcount
 
-    async def clean_expired_tokens(self, db: AsyncSession) -> int:
+    async def clean_expired_tokens(
+        self,
+        db: AsyncSession,
+        *,
+        batch_size: Optional[int] = None,
+        pause: float = 0.0,
+        now: Optional[datetime] = None,
+    ) -> int:
         """
-        만료된 토큰을 삭제합니다.
+        만료된 토큰을 배치 단위로 나누어 삭제합니다.
+        
+        한 번의 DELETE로 전체를 삭제하면 잠금과 WAL이 오래 유지되므로
+        batch_size개씩 삭제하고 배치마다 커밋하며, 배치 사이에 pause초 동안 양보합니다.
         
         Args:
             db: 데이터베이스 세션
+            batch_size: 배치당 삭제할 토큰 수 (기본값: cleanup_batch_size)
+            pause: 배치 사이 대기 시간(초)
+            now: 만료 기준 시각 (기본값: 현재 UTC 시각)
             
         Returns:
             int: 삭제된 토큰 수
         """
-        now = datetime.utcnow()
-        query = delete(Token).where(Token.expires_at < now)
-        result = await db.execute(query)
+        batch_size = batch_size or self.cleanup_batch_size
+        now = now or datetime.utcnow()
+
+        deleted = 0
+        while True:
+            count = await self.delete_expired_batch(db, now=now, batch_size=batch_size)
+            deleted += count
+            if count < batch_size:
+                break
+            await asyncio.sleep(pause)
+
+        if deleted:
+            await self.invalidate_cache()
+        return deleted
+
+    async def delete_expired_batch(
+        self, db: AsyncSession, *, now: datetime, batch_size: int
+    ) -> int:
+        """
+        만료된 토큰을 최대 batch_size개 삭제하고 커밋합니다.
+        
+        PostgreSQL에서는 다른 트랜잭션이 사용 중인 행을 건너뛰어(SKIP LOCKED) 대기하지 않습니다.
+        
+        Returns:
+            int: 삭제된 토큰 수
+        """
+        expired = select(Token.id).where(Token.expires_at < now).limit(batch_size)
+        if db.get_bind().dialect.name == "postgresql":
+            expired = expired.with_for_update(skip_locked=True)
+        result = await db.execute(
+            delete(Token)
+            .where(Token.id.in_(expired.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
         await db.commit()
         return result.rowcount
 
+    async def drop_expired_partitions(self, db: AsyncSession, *, now: Optional[datetime] = None) -> int:
+        """
+        시간 범위로 파티션된 토큰 테이블에서 상한이 지난 파티션을 통째로 삭제합니다. (PostgreSQL)
+        
+        행 단위 DELETE 없이 DETACH 후 DROP하므로 WAL과 테이블 팽창이 발생하지 않습니다.
+        token 테이블이 expires_at 기준 PARTITION BY RANGE로 생성된 경우에만 동작합니다.
+        
+        Returns:
+            int: 삭제된 파티션 수
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return 0
+
+        now = now or datetime.utcnow()
+        result = await db.execute(
+            text(
+                "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+                "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(:parent)"
+            ),
+            {"parent": Token.__tablename__},
+        )
+
+        dropped = 0
+        for name, bound in result.all():
+            match = _PARTITION_UPPER_BOUND.search(bound or "")
+            if not match:
+                continue
+            upper = datetime.fromisoformat(match.group(1))
+            if upper.tzinfo is not None:
+                upper = upper.astimezone(timezone.utc).replace(tzinfo=None)
+            if upper > now:
+                continue
+            await db.execute(text(f'ALTER TABLE "{Token.__tablename__}" DETACH PARTITION "{name}"'))
+            await db.execute(text(f'DROP TABLE "{name}"'))
+            await db.commit()
+            dropped += 1
+
+        if dropped:
+            await self.invalidate_cache()
+        return dropped
+
     async def is_token_valid(
         self, db: AsyncSession, *, token_value: str, token_type: Optional[str] = None
     ) -> bool:
@@ -181,6 +278,7 @@ class AuthRepository(BaseRepository[Token, TokenCreate, TokenUpdate]):
         token.expires_at = base_time + timedelta(hours=extension_hours)
         
         db.add(token)
-        await db.commit()
+        await commit(db)
         await db.refresh(token)
+        await self.invalidate_cache(ids=[token.id], db=db)
         return token 
\ No newline at end of file
@@ -3,15 +3,43 @@
 # Description: 기본 데이터베이스 리포지토리 클래스
 """
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+import hashlib
+import json
+from uuid import uuid4
+from typing import (
+    Any, AsyncIterator, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+)
 from pydantic import BaseModel
-from sqlalchemy import delete, select, update
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from sqlalchemy.sql import Select
 
 from fastapi_template.app.db.models import Base
+from fastapi_template.app.common.cache.cache_base import CacheBackend
+from fastapi_template.app.common.database.database_sharding import shard_key_of, shard_map_of
+from fastapi_template.app.common.database.database_unit_of_work import (
+    commit,
+    current_unit_of_work,
+    rollback,
+)
+from fastapi_template.app.common.schemas.pagination_schema import CursorParams
+from fastapi_template.app.common.utils.orm_utils import load_fields, relationship_options
+from fastapi_template.app.common.utils.pagination import (
+    apply_keyset_pagination,
+    paginate_by_cursor,
+)
 
 ModelType = TypeVar("ModelType", bound=Base)
+
+# ON CONFLICT를 지원하는 dialect별 INSERT 생성 함수
+_UPSERT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
@@ -21,6 +49,29 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     기본 리포지토리 클래스 - CRUD 작업 구현
     """
 
+    # 커서 페이지네이션에서 허용하는 정렬 필드 (하위 클래스에서 재정의)
+    sort_fields: Tuple[str, ...] = ("id",)
+    # bulk_create 배치당 행 수
+    bulk_batch_size: int = 1000
+    # bulk_create에서 PostgreSQL COPY를 사용할 최소 행 수
+    copy_threshold: int = 10000
+    # stream_multi에서 서버 측 커서로 한 번에 가져올 행 수
+    stream_chunk_size: int = 1000
+    # get_many에서 IN 절 하나에 넣을 최대 ID 수
+    in_batch_size: int = 500
+    # 로딩 전략을 지정하지 않은 관계의 지연 로딩을 예외로 처리 (N+1 방지)
+    raise_on_lazy_load: bool = True
+    # 조회 결과 캐시 (cache_backend와 cache_schema를 모두 지정한 모델만 사용)
+    cache_backend: Optional[CacheBackend] = None
+    # 캐시 직렬화에 사용할 응답 스키마 (스키마 필드만 캐시됨)
+    cache_schema: Optional[Type[BaseModel]] = None
+    # get 결과 캐시 유효기간(초)
+    cache_ttl: int = 60
+    # get_multi 결과를 캐시할 필터 필드 (None이면 목록 캐시 안 함, ()이면 필터 없는 목록만)
+    cache_list_filters: Optional[Tuple[str, ...]] = None
+    # get_multi 결과 캐시 유효기간(초)
+    cache_list_ttl: int = 30
+
     def __init__(self, model: Type[ModelType]):
         """
         모델 클래스를 인자로 받아 초기화합니다.
@@ -29,21 +80,87 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             model: SQLAlchemy 모델 클래스
         """
         self.model = model
+        self._get_statement: Optional[Select] = None
 
-    async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+    async def get(
+        self,
+        db: AsyncSession,
+        id: Any,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        load: Optional[Dict[str, str]] = None,
+    ) -> Optional[ModelType]:
         """
         ID로 데이터를 조회합니다.
         
         Args:
             db: 데이터베이스 세션
             id: 조회할 데이터의 ID
+            fields: 조회할 컬럼 (생략하면 지연 로딩 컬럼을 제외한 전체)
+            load: 관계별 로딩 전략 (예: {"items": "selectin"})
             
         Returns:
             Optional[ModelType]: 조회된 데이터 또는 None
         """
-        query = select(self.model).where(self.model.id == id)
-        result = await db.execute(query)
-        return result.scalars().first()
+        if fields or load:
+            query = self._apply_options(
+                select(self.model).where(self.model.id == id), fields, load
+            )
+            result = await db.execute(query)
+            return result.unique().scalars().first()
+
+        if self._cache_usable(db):
+            return await self._get_cached(db, id)
+        return await self._get_by_id(db, id)
+
+    async def _get_by_id(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        """옵션 없는 ID 조회 - 미리 생성한 문장을 바인드 파라미터로 재사용"""
+        if self._get_statement is None:
+            self._get_statement = self._apply_options(
+                select(self.model).where(self.model.id == bindparam("id"))
+            )
+        result = await db.execute(self._get_statement, {"id": id})
+        return result.unique().scalars().first()
+
+    async def _get_cached(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        """캐시에서 조회하고, 없으면 DB에서 조회한 결과를 캐시합니다."""
+        key = self._cache_key("id", id)
+        cached = await self.cache_backend.get(key)
+        if cached is not None:
+            return await self._from_cache(db, json.loads(cached))
+
+        marker = await self.cache_backend.get(self._cache_key("marker"))
+        obj = await self._get_by_id(db, id)
+        if obj is not None:
+            await self._store_if_unchanged(marker, key, self._cache_dump(obj), self.cache_ttl)
+        return obj
+
+    async def get_many(
+        self, db: AsyncSession, ids: Sequence[Any], *, load: Optional[Dict[str, str]] = None
+    ) -> List[ModelType]:
+        """
+        여러 ID의 데이터를 WHERE id IN (...)으로 조회합니다.
+        
+        중복 ID는 제거하며, in_batch_size 단위로 나누어 조회합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            ids: 조회할 데이터의 ID 목록
+            load: 관계별 로딩 전략 (예: {"items": "selectin"})
+            
+        Returns:
+            List[ModelType]: 조회된 데이터 목록 (순서 보장 없음, 없는 ID는 제외)
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        objs: List[ModelType] = []
+        for start in range(0, len(unique_ids), self.in_batch_size):
+            chunk = unique_ids[start:start + self.in_batch_size]
+            query = self._apply_options(
+                select(self.model).where(self.model.id.in_(chunk)), load=load
+            )
+            result = await db.execute(query)
+            objs.extend(result.unique().scalars().all())
+        return objs
 
     async def get_multi(
         self,
@@ -51,24 +168,139 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         *,
         skip: int = 0,
         limit: int = 100,
+        order_by: str = "id",
+        descending: bool = False,
+        after: Optional[Sequence[Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        load: Optional[Dict[str, str]] = None,
         **kwargs
     ) -> List[ModelType]:
         """
         여러 데이터를 조회합니다.
         
+        항상 ORDER BY (order_by, id)로 정렬하여 결과 순서가 결정적이며,
+        after가 주어지면 OFFSET 대신 키셋(seek) 조건으로 다음 행부터 조회합니다.
+        
         Args:
             db: 데이터베이스 세션
-            skip: 건너뛸 레코드 수
+            skip: 건너뛸 레코드 수 (오프셋 모드)
             limit: 조회할 최대 레코드 수
+            order_by: 정렬 기준 필드
+            descending: 내림차순 여부
+            after: 이전 페이지 마지막 행의 키 (order_by 값, id)
+            fields: 조회할 컬럼 (예: schema_fields(Model, ResponseSchema))
+            load: 관계별 로딩 전략 (예: {"items": "selectin"})
             **kwargs: 필터링 조건 (필드명=값)
             
         Returns:
             List[ModelType]: 조회된 데이터 목록
         """
-        query = self._build_query(**kwargs)
-        query = query.offset(skip).limit(limit)
+        list_key = marker = None
+        if not fields and not load and self._list_cacheable(db, kwargs):
+            list_key = self._list_cache_key(
+                skip=skip, limit=limit, order_by=order_by, descending=descending,
+                after=after, filters=kwargs,
+            )
+            cached = await self.cache_backend.get(list_key)
+            if cached is not None:
+                return [await self._from_cache(db, data) for data in json.loads(cached)]
+            marker = await self.cache_backend.get(self._cache_key("marker"))
+
+        query = self._apply_options(self._build_query(**kwargs), fields, load)
+        query = apply_keyset_pagination(
+            query,
+            getattr(self.model, order_by),
+            self.model.id,
+            limit=limit,
+            after=after,
+            descending=descending,
+        )
+        if skip:
+            query = query.offset(skip)
         result = await db.execute(query)
-        return result.scalars().all()
+        objs = result.unique().scalars().all()
+
+        if list_key is not None:
+            await self._store_if_unchanged(
+                marker, list_key, [self._cache_dump(obj) for obj in objs], self.cache_list_ttl
+            )
+        return objs
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        params: CursorParams,
+        fields: Optional[Sequence[str]] = None,
+        load: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        커서 기반으로 한 페이지를 조회합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            params: 커서 페이지네이션 파라미터
+            fields: 조회할 컬럼 (정렬 필드 포함 필요)
+            load: 관계별 로딩 전략 (예: {"items": "selectin"})
+            **kwargs: 필터링 조건 (필드명=값)
+            
+        Returns:
+            Tuple[List[ModelType], Optional[str]]: 조회된 데이터 목록과 다음 페이지 커서
+        """
+        query = self._apply_options(self._build_query(**kwargs), fields, load)
+        return await paginate_by_cursor(db, query, self.model, params, self.sort_fields)
+
+    async def stream_multi(
+        self,
+        db: AsyncSession,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        order_by: str = "id",
+        descending: bool = False,
+        chunk_size: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        여러 데이터를 서버 측 커서로 스트리밍 조회합니다.
+        
+        get_multi와 달리 결과 전체를 메모리에 올리지 않고 AsyncSession.stream()과
+        yield_per로 chunk_size 행씩 가져오므로, 행 수와 관계없이 메모리 사용량이 일정합니다.
+        내보내기, 백그라운드 작업 등 대량 조회에 사용합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            columns: 조회할 컬럼 (지정하면 모델 객체 대신 Row를 반환)
+            order_by: 정렬 기준 필드
+            descending: 내림차순 여부
+            chunk_size: 한 번에 가져올 행 수 (기본값: stream_chunk_size)
+            **kwargs: 필터링 조건 (필드명=값)
+            
+        Yields:
+            Any: 모델 객체 (columns 지정 시 Row)
+        """
+        entities = [getattr(self.model, column) for column in columns or ()]
+        query = self._build_query(*entities, **kwargs)
+
+        order_columns = [getattr(self.model, order_by)]
+        if order_by != "id":
+            order_columns.append(self.model.id)
+        if descending:
+            order_columns = [column.desc() for column in order_columns]
+        query = query.order_by(*order_columns).execution_options(
+            yield_per=chunk_size or self.stream_chunk_size
+        )
+
+        if entities:
+            result = await db.stream(query)
+        else:
+            result = await db.stream_scalars(query)
+        try:
+            async for row in result:
+                yield row
+        finally:
+            # 반복을 중간에 멈춰도 서버 측 커서를 닫음
+            await result.close()
 
     async def create(
         self, db: AsyncSession, *, obj_in: Union[CreateSchemaType, Dict[str, Any]]
@@ -86,8 +318,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in_data = obj_in.dict() if isinstance(obj_in, BaseModel) else obj_in
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
-        await db.commit()
+        await commit(db)
         await db.refresh(db_obj)
+        await self.invalidate_cache(ids=(), db=db)
         return db_obj
 
     async def update(
@@ -100,6 +333,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         데이터를 수정합니다.
         
+        UPDATE ... RETURNING을 지원하는 데이터베이스에서는 수정과 결과 조회를
+        한 번의 쿼리로 처리하고, 지원하지 않으면 수정 후 refresh로 다시 조회합니다.
+        
         Args:
             db: 데이터베이스 세션
             db_obj: 수정할 기존 데이터
@@ -108,26 +344,49 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             ModelType: 수정된 데이터
         """
-        obj_data = db_obj.__dict__
         if isinstance(obj_in, BaseModel):
             # Pydantic 모델의 수정할 값만 필터링
             update_data = obj_in.dict(exclude_unset=True)
         else:
             update_data = obj_in
 
+        if self._supports_returning(db, "update_returning"):
+            columns = self.model.__table__.columns
+            values = {field: value for field, value in update_data.items() if field in columns}
+            if not values:
+                return db_obj
+            stmt = (
+                update(self.model)
+                .where(self.model.id == db_obj.id)
+                .values(**values)
+                .returning(self.model)
+                # 세션의 db_obj도 수정된 값으로 갱신
+                .execution_options(populate_existing=True)
+            )
+            result = await db.scalars(stmt)
+            updated = result.first()
+            await commit(db)
+            await self.invalidate_cache(ids=[db_obj.id], db=db)
+            return updated if updated is not None else db_obj
+
+        obj_data = db_obj.__dict__
         for field in obj_data:
             if field in update_data:
                 setattr(db_obj, field, update_data[field])
 
         db.add(db_obj)
-        await db.commit()
+        await commit(db)
         await db.refresh(db_obj)
+        await self.invalidate_cache(ids=[db_obj.id], db=db)
         return db_obj
 
     async def delete(self, db: AsyncSession, *, id: Any) -> Optional[ModelType]:
         """
         데이터를 삭제합니다.
         
+        DELETE ... RETURNING을 지원하는 데이터베이스에서는 조회 없이 한 번의 쿼리로 삭제하고,
+        지원하지 않으면 조회 후 삭제합니다.
+        
         Args:
             db: 데이터베이스 세션
             id: 삭제할 데이터의 ID
@@ -135,52 +394,370 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Optional[ModelType]: 삭제된 데이터 또는 None
         """
+        if self._supports_returning(db, "delete_returning"):
+            stmt = (
+                delete(self.model)
+                .where(self.model.id == id)
+                .returning(self.model)
+            )
+            result = await db.scalars(stmt)
+            obj = result.first()
+            if obj is None:
+                await rollback(db)
+                return None
+            await commit(db)
+            await self.invalidate_cache(ids=[id], db=db)
+            return obj
+
         obj = await self.get(db=db, id=id)
         if obj:
             await db.delete(obj)
-            await db.commit()
+            await commit(db)
+            await self.invalidate_cache(ids=[id], db=db)
         return obj
 
-    def _build_query(self, **kwargs) -> Select:
+    @staticmethod
+    def _supports_returning(db: AsyncSession, feature: str) -> bool:
+        """
+        데이터베이스가 RETURNING을 지원하는지 확인합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            feature: dialect 기능 이름 (update_returning, delete_returning)
+        """
+        return bool(getattr(db.get_bind().dialect, feature, False))
+
+    def _cache_enabled(self) -> bool:
+        """조회 결과 캐시를 사용하는 리포지토리인지 확인합니다."""
+        return self.cache_backend is not None and self.cache_schema is not None
+
+    def _cache_key(self, *parts: Any) -> str:
+        """모델별 캐시 키를 생성합니다. (repo:<테이블>:...)"""
+        return ":".join(["repo", self.model.__tablename__, *(str(part) for part in parts)])
+
+    def _cache_usable(self, db: AsyncSession) -> bool:
+        """
+        이 세션의 조회에 캐시를 사용할 수 있는지 확인합니다.
+        
+        단위 작업 안에서는 커밋 전의 값을 캐시하거나 자신의 쓰기 이전 값을
+        캐시에서 읽지 않도록 캐시를 사용하지 않습니다.
+        """
+        return self._cache_enabled() and current_unit_of_work(db) is None
+
+    def _list_cacheable(self, db: AsyncSession, filters: Dict[str, Any]) -> bool:
+        """get_multi 필터가 목록 캐시 대상(cache_list_filters)인지 확인합니다."""
+        if not self._cache_usable(db) or self.cache_list_filters is None:
+            return False
+        used = {field for field, value in filters.items() if value is not None}
+        return used <= set(self.cache_list_filters)
+
+    def _list_cache_key(self, **params: Any) -> str:
+        """get_multi 파라미터로부터 목록 캐시 키를 생성합니다."""
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return self._cache_key("list", hashlib.sha1(payload.encode("utf-8")).hexdigest())
+
+    def _cache_dump(self, obj: ModelType) -> Dict[str, Any]:
+        """모델 객체를 응답 스키마 필드만 담은 JSON 호환 딕셔너리로 변환합니다."""
+        return self.cache_schema.model_validate(obj, from_attributes=True).model_dump(mode="json")
+
+    async def _from_cache(self, db: AsyncSession, data: Dict[str, Any]) -> ModelType:
+        """
+        캐시된 데이터를 세션에 연결된 모델 객체로 복원합니다. (SQL 실행 없음)
+        
+        응답 스키마에 없는 컬럼은 로드되지 않은 상태이므로 접근하면 예외가 발생합니다.
+        """
+        values = self.cache_schema.model_validate(data).model_dump()
+        columns = {attr.key for attr in sa_inspect(self.model).column_attrs}
+        obj = self.model(**{key: value for key, value in values.items() if key in columns})
+        make_transient_to_detached(obj)
+        return await db.merge(obj, load=False)
+
+    async def _store_if_unchanged(
+        self, marker: Optional[str], key: str, value: Any, ttl: int
+    ) -> None:
+        """
+        DB 조회를 시작한 뒤 쓰기가 없었을 때만 결과를 캐시합니다.
+        
+        조회 중에 다른 요청이 수정하고 캐시를 무효화했다면, 조회한 값은 이미
+        오래된 값이므로 저장하지 않습니다. (쓰기마다 marker가 바뀜)
+        """
+        if await self.cache_backend.get(self._cache_key("marker")) != marker:
+            return
+        await self.cache_backend.set(key, json.dumps(value), ttl=ttl)
+
+    async def invalidate_cache(
+        self, ids: Optional[Sequence[Any]] = None, *, db: Optional[AsyncSession] = None
+    ) -> None:
+        """
+        쓰기 후 캐시를 무효화합니다.
+        
+        리포지토리 메서드를 거치지 않고 데이터를 수정한 경우에도 커밋 후 호출합니다.
+        
+        Args:
+            ids: 수정/삭제된 데이터의 ID 목록 (None이면 모든 ID 캐시 삭제, ()이면 목록 캐시만)
+            db: 쓰기에 사용한 세션 (단위 작업 안이면 트랜잭션이 끝난 뒤 무효화)
+        """
+        if not self._cache_enabled():
+            return
+        uow = current_unit_of_work(db) if db is not None else None
+        if uow is not None:
+            uow.after_transaction(lambda: self.invalidate_cache(ids=ids))
+            return
+
+        # 진행 중인 조회가 오래된 값을 캐시하지 못하도록 marker 갱신
+        await self.cache_backend.set(
+            self._cache_key("marker"), uuid4().hex, ttl=max(self.cache_ttl, self.cache_list_ttl)
+        )
+        if ids is None:
+            await self.cache_backend.clear_pattern(self._cache_key("id", "*"))
+        else:
+            for id in ids:
+                await self.cache_backend.delete(self._cache_key("id", id))
+        if self.cache_list_filters is not None:
+            await self.cache_backend.clear_pattern(self._cache_key("list", "*"))
+
+    def _apply_options(
+        self,
+        query: Select,
+        fields: Optional[Sequence[str]] = None,
+        load: Optional[Dict[str, str]] = None,
+    ) -> Select:
+        """
+        쿼리에 컬럼 선택(load_only)과 관계 로딩 전략 옵션을 적용합니다.
+        
+        조회하지 않은 컬럼이나 로딩 전략을 지정하지 않은 관계에 접근하면
+        지연 로딩 대신 예외가 발생합니다. (raise_on_lazy_load)
+        """
+        options = relationship_options(self.model, load, self.raise_on_lazy_load)
+        if fields:
+            options.append(load_fields(self.model, fields))
+        return query.options(*options) if options else query
+
+    def _build_query(self, *entities: Any, **kwargs) -> Select:
         """
         필터링 조건으로 쿼리를 생성합니다.
         
         Args:
+            *entities: 조회할 컬럼 (생략하면 모델 전체)
             **kwargs: 필터링 조건 (필드명=값)
             
         Returns:
             Select: 생성된 쿼리 객체
         """
-        query = select(self.model)
+        query = select(*entities) if entities else select(self.model)
         for field, value in kwargs.items():
             if hasattr(self.model, field) and value is not None:
                 query = query.where(getattr(self.model, field) == value)
         return query
 
     async def bulk_create(
-        self, db: AsyncSession, *, obj_in_list: List[Union[CreateSchemaType, Dict[str, Any]]]
-    ) -> List[ModelType]:
+        self,
+        db: AsyncSession,
+        *,
+        obj_in_list: List[Union[CreateSchemaType, Dict[str, Any]]],
+        batch_size: Optional[int] = None,
+        return_objects: bool = True,
+    ) -> Union[List[ModelType], int]:
         """
         여러 데이터를 한 번에 생성합니다.
         
+        행마다 add/refresh하지 않고 batch_size 단위의 INSERT ... RETURNING
+        (return_objects=False면 RETURNING 없는 executemany)으로 삽입하며,
+        PostgreSQL(asyncpg)에서 RETURNING이 필요 없고 행 수가 copy_threshold 이상이면
+        COPY를 사용합니다. 모든 배치는 하나의 트랜잭션으로 커밋됩니다.
+        
         Args:
             db: 데이터베이스 세션
             obj_in_list: 생성할 데이터 목록
+            batch_size: 배치당 행 수 (기본값: bulk_batch_size)
+            return_objects: 생성된 객체 반환 여부
             
         Returns:
-            List[ModelType]: 생성된 데이터 목록
+            Union[List[ModelType], int]: 생성된 데이터 목록 (return_objects=False면 생성된 행 수)
         """
-        db_objs = []
-        for obj_in in obj_in_list:
-            obj_in_data = obj_in.dict() if isinstance(obj_in, BaseModel) else obj_in
-            db_obj = self.model(**obj_in_data)
-            db.add(db_obj)
-            db_objs.append(db_obj)
+        rows = [
+            obj_in.dict() if isinstance(obj_in, BaseModel) else dict(obj_in)
+            for obj_in in obj_in_list
+        ]
+        if not rows:
+            return [] if return_objects else 0
+
+        batch_size = batch_size or self.bulk_batch_size
+
+        shard_map = shard_map_of(db)
+        if shard_map is not None and shard_key_of(sa_inspect(self.model)) is not None:
+            # 샤드 모델은 전역 ID를 부여하고 샤드별로 나누어 삽입 (COPY 미사용)
+            db_objs = await shard_map.insert(
+                db, self.model, rows, batch_size=batch_size, return_objects=return_objects
+            )
+            await commit(db)
+            await self.invalidate_cache(ids=(), db=db)
+            return db_objs if return_objects else len(rows)
+
+        if not return_objects and len(rows) >= self.copy_threshold and self._supports_copy(db):
+            await self._copy_rows(db, rows)
+            await commit(db)
+            await self.invalidate_cache(ids=(), db=db)
+            return len(rows)
+
+        db_objs: List[ModelType] = []
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            if return_objects:
+                result = await db.scalars(insert(self.model).returning(self.model), batch)
+                db_objs.extend(result.all())
+            else:
+                await db.execute(insert(self.model), batch)
+
+        await commit(db)
+        await self.invalidate_cache(ids=(), db=db)
+        return db_objs if return_objects else len(rows)
+
+    @staticmethod
+    def _supports_copy(db: AsyncSession) -> bool:
+        """COPY를 사용할 수 있는 드라이버(asyncpg)인지 확인합니다."""
+        dialect = db.get_bind().dialect
+        return dialect.name == "postgresql" and dialect.driver == "asyncpg"
+
+    async def _copy_rows(self, db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        """
+        PostgreSQL COPY로 행을 삽입합니다.
+        
+        COPY는 SQLAlchemy 컬럼 기본값을 적용하지 않으므로 Python 측 기본값을 먼저 채웁니다.
+        
+        Args:
+            db: 데이터베이스 세션 (asyncpg)
+            rows: 삽입할 행 목록
+        """
+        table = self.model.__table__
+        columns = [
+            column for column in table.columns
+            if any(column.key in row for row in rows) or (
+                column.default is not None and not column.default.is_sequence
+            )
+        ]
+        records = [
+            tuple(self._column_value(column, row) for column in columns)
+            for row in rows
+        ]
+
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=[column.name for column in columns],
+            schema_name=table.schema,
+        )
+
+    @staticmethod
+    def _column_value(column: Any, row: Dict[str, Any]) -> Any:
+        """행 값 또는 컬럼의 Python 측 기본값을 반환합니다."""
+        if column.key in row:
+            return row[column.key]
+        default = column.default
+        if default is None:
+            return None
+        if default.is_callable:
+            return default.arg(None)
+        return default.arg
+
+    async def bulk_upsert(
+        self,
+        db: AsyncSession,
+        *,
+        obj_in_list: List[Union[CreateSchemaType, Dict[str, Any]]],
+        conflict_columns: Optional[Sequence[str]] = None,
+        update_columns: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+        return_objects: bool = False,
+    ) -> Union[List[ModelType], int]:
+        """
+        여러 데이터를 한 번에 삽입하거나, 충돌 시 수정합니다.
+        
+        조회 후 생성/수정하는 대신 dialect 고유의 INSERT ... ON CONFLICT DO UPDATE를
+        batch_size 단위로 실행하고 한 번만 커밋합니다. (PostgreSQL, SQLite)
+        update_columns가 비어 있으면 ON CONFLICT DO NOTHING으로 기존 행을 유지합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            obj_in_list: 삽입/수정할 데이터 목록
+            conflict_columns: 충돌 대상 컬럼 (고유 제약조건, 기본값: 기본 키)
+            update_columns: 충돌 시 수정할 컬럼 (기본값: 입력된 컬럼 중 충돌 대상 제외)
+            batch_size: 배치당 행 수 (기본값: bulk_batch_size)
+            return_objects: 삽입/수정된 객체 반환 여부
+            
+        Returns:
+            Union[List[ModelType], int]: 삽입/수정된 데이터 목록
+                (return_objects=False면 삽입/수정된 행 수, DO NOTHING으로 건너뛴 행 제외)
+            
+        Raises:
+            NotImplementedError: ON CONFLICT를 지원하지 않는 데이터베이스인 경우
+        """
+        rows = [
+            obj_in.dict() if isinstance(obj_in, BaseModel) else dict(obj_in)
+            for obj_in in obj_in_list
+        ]
+        if not rows:
+            return [] if return_objects else 0
+
+        dialect_name = db.get_bind().dialect.name
+        if dialect_name not in _UPSERT_INSERTS:
+            raise NotImplementedError(f"{dialect_name}은(는) bulk_upsert를 지원하지 않습니다")
+
+        table = self.model.__table__
+        primary_keys = [column.key for column in table.primary_key]
+        if conflict_columns is None:
+            conflict_columns = primary_keys
+        if update_columns is None:
+            input_columns = {key for row in rows for key in row}
+            update_columns = [
+                column.key for column in table.columns
+                if column.key in input_columns and column.key not in conflict_columns
+            ]
+
+        stmt = _UPSERT_INSERTS[dialect_name](self.model)
+        if update_columns:
+            set_ = {column: stmt.excluded[column] for column in update_columns}
+            # ON CONFLICT DO UPDATE는 컬럼의 onupdate를 적용하지 않으므로 직접 추가
+            for column in table.columns:
+                if column.onupdate is not None and column.key not in set_:
+                    set_[column.key] = self._onupdate_value(column)
+            stmt = stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=set_)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+        if return_objects:
+            # 세션에 이미 로드된 객체도 수정된 값으로 갱신
+            stmt = stmt.returning(self.model).execution_options(populate_existing=True)
+        else:
+            stmt = stmt.returning(*(getattr(self.model, key) for key in primary_keys))
+
+        batch_size = batch_size or self.bulk_batch_size
+        db_objs: List[ModelType] = []
+        changed_ids: List[Any] = []
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            if return_objects:
+                result = await db.scalars(stmt, batch)
+                db_objs.extend(result.all())
+            else:
+                result = await db.execute(stmt, batch)
+                changed_ids.extend(row.id for row in result.all())
+
+        await commit(db)
+        if return_objects:
+            changed_ids = [obj.id for obj in db_objs]
+        await self.invalidate_cache(ids=changed_ids, db=db)
+        return db_objs if return_objects else len(changed_ids)
 
-        await db.commit()
-        for db_obj in db_objs:
-            await db.refresh(db_obj)
-        return db_objs
+    @staticmethod
+    def _onupdate_value(column: Any) -> Any:
+        """컬럼의 onupdate 값(SQL 표현식 또는 Python 측 값)을 반환합니다."""
+        onupdate = column.onupdate
+        if onupdate.is_callable:
+            return onupdate.arg(None)
+        return onupdate.arg
 
     async def bulk_update(
         self, db: AsyncSession, *, ids: List[Any], obj_in: Union[UpdateSchemaType, Dict[str, Any]]
@@ -207,7 +784,8 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             .values(**update_data)
         )
         result = await db.execute(stmt)
-        await db.commit()
+        await commit(db)
+        await self.invalidate_cache(ids=ids, db=db)
         return result.rowcount
 
     async def bulk_delete(self, db: AsyncSession, *, ids: List[Any]) -> int:
@@ -223,7 +801,8 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         stmt = delete(self.model).where(self.model.id.in_(ids))
         result = await db.execute(stmt)
-        await db.commit()
+        await commit(db)
+        await self.invalidate_cache(ids=ids, db=db)
         return result.rowcount
 
     async def count(self, db: AsyncSession, **kwargs) -> int:
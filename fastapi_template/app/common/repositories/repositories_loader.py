@@ -0,0 +1,150 @@
+"""
+# File: fastapi_template/app/common/repositories/repositories_loader.py
+# Description: 요청 범위 데이터 로더
+# - 같은 이벤트 루프 틱에 요청된 기본 키 조회를 WHERE id IN (...) 한 번으로 묶음
+# - 중복 ID 제거 및 요청 범위 식별자 캐시
+"""
+
+import asyncio
+from typing import Any, Dict, Generic, List, Optional, Sequence, Set, Type, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository, ModelType
+
+
+class ModelLoader(Generic[ModelType]):
+    """
+    기본 키 조회를 모아서 한 번에 실행하는 로더
+
+    load()는 즉시 조회하지 않고 ID를 대기열에 넣은 뒤, 현재 이벤트 루프 틱이 끝나면
+    대기 중인 모든 ID를 repository.get_many()로 한 번에 조회합니다.
+    조회 결과(없는 ID는 None)는 로더가 살아 있는 동안(요청 범위) 캐시됩니다.
+    """
+
+    def __init__(self, db: AsyncSession, repository: BaseRepository):
+        """
+        Args:
+            db: 데이터베이스 세션
+            repository: 일괄 조회에 사용할 리포지토리
+        """
+        self.db = db
+        self.repository = repository
+        self._cache: Dict[Any, asyncio.Future] = {}
+        self._pending: List[Any] = []
+        self._dispatch_scheduled = False
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, id: Any) -> Optional[ModelType]:
+        """
+        ID로 데이터를 조회합니다.
+
+        Args:
+            id: 조회할 데이터의 ID
+
+        Returns:
+            Optional[ModelType]: 조회된 데이터 또는 None
+        """
+        future = self._cache.get(id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[id] = future
+            self._pending.append(id)
+            if not self._dispatch_scheduled:
+                self._dispatch_scheduled = True
+                loop.call_soon(self._schedule_dispatch)
+        # 한 호출자가 취소되어도 같은 ID를 기다리는 다른 호출자에는 영향 없음
+        return await asyncio.shield(future)
+
+    async def load_many(self, ids: Sequence[Any]) -> List[Optional[ModelType]]:
+        """
+        여러 ID를 한 번의 일괄 조회로 조회합니다.
+
+        Args:
+            ids: 조회할 데이터의 ID 목록
+
+        Returns:
+            List[Optional[ModelType]]: ids와 같은 순서의 조회 결과
+        """
+        return list(await asyncio.gather(*(self.load(id) for id in ids)))
+
+    def prime(self, id: Any, obj: Optional[ModelType]) -> None:
+        """이미 조회한 데이터를 캐시에 저장합니다."""
+        if id not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(obj)
+            self._cache[id] = future
+
+    def clear(self, id: Any = None) -> None:
+        """캐시에서 ID(생략 시 전체)를 제거합니다. 데이터 수정 후 호출합니다."""
+        if id is None:
+            self._cache = {
+                key: future for key, future in self._cache.items() if not future.done()
+            }
+        elif id in self._cache and self._cache[id].done():
+            del self._cache[id]
+
+    def _schedule_dispatch(self) -> None:
+        task = asyncio.ensure_future(self._dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self) -> None:
+        ids, self._pending = self._pending, []
+        self._dispatch_scheduled = False
+
+        try:
+            objs = await self.repository.get_many(self.db, ids)
+        except Exception as exc:
+            # 실패한 조회는 캐시하지 않음
+            for id in ids:
+                future = self._cache.pop(id, None)
+                if future is not None and not future.done():
+                    future.set_exception(exc)
+            return
+
+        found = {obj.id: obj for obj in objs}
+        for id in ids:
+            future = self._cache.get(id)
+            if future is not None and not future.done():
+                future.set_result(found.get(id))
+
+
+class DataLoaders:
+    """
+    요청 범위 로더 모음
+
+    모델(또는 리포지토리)마다 하나의 ModelLoader를 만들어 재사용합니다.
+    요청마다 새로 생성해야 하며, FastAPI에서는 get_loaders 의존성으로 주입합니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._loaders: Dict[Type[Any], ModelLoader] = {}
+
+    def get(self, model_or_repository: Union[Type[ModelType], BaseRepository]) -> ModelLoader[ModelType]:
+        """
+        모델의 로더를 반환합니다.
+
+        Args:
+            model_or_repository: 모델 클래스 또는 get_many를 재정의한 리포지토리
+
+        Returns:
+            ModelLoader: 해당 모델의 요청 범위 로더
+        """
+        if isinstance(model_or_repository, BaseRepository):
+            repository = model_or_repository
+        else:
+            repository = BaseRepository(model_or_repository)
+
+        loader = self._loaders.get(repository.model)
+        if loader is None:
+            loader = ModelLoader(self.db, repository)
+            self._loaders[repository.model] = loader
+        return loader
+
+    def clear(self) -> None:
+        """모든 로더의 캐시를 비웁니다."""
+        for loader in self._loaders.values():
+            loader.clear()
@@ -5,8 +5,10 @@
 
 from typing import Any, Dict, List, Optional, Union
 from sqlalchemy import select
+from sqlalchemy.orm import undefer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from fastapi_template.app.common.database.database_unit_of_work import commit
 from fastapi_template.app.db.models import User
 from fastapi_template.app.common.repositories.repositories_base import BaseRepository
 from fastapi_template.app.db.schemas.user import UserCreate, UserUpdate
@@ -71,8 +73,9 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             is_superuser=obj_in.is_superuser,
         )
         db.add(db_obj)
-        await db.commit()
+        await commit(db)
         await db.refresh(db_obj)
+        await self.invalidate_cache(ids=(), db=db)
         return db_obj
 
     async def update_last_login(self, db: AsyncSession, *, user_id: Any) -> Optional[User]:
@@ -94,8 +97,9 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             
         user.last_login = datetime.utcnow()
         db.add(user)
-        await db.commit()
+        await commit(db)
         await db.refresh(user)
+        await self.invalidate_cache(ids=[user.id], db=db)
         return user
 
     async def authenticate(
@@ -114,7 +118,10 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         """
         from fastapi_template.app.core.security import verify_password
         
-        user = await self.get_by_email(db=db, email=email)
+        # 기본 조회에서 제외되는 hashed_password를 함께 로드
+        query = select(User).options(undefer(User.hashed_password)).where(User.email == email)
+        result = await db.execute(query)
+        user = result.scalars().first()
         if not user:
             return None
         if not verify_password(password, user.hashed_password):
@@ -141,8 +148,9 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             
         user.hashed_password = new_hashed_password
         db.add(user)
-        await db.commit()
+        await commit(db)
         await db.refresh(user)
+        await self.invalidate_cache(ids=[user.id], db=db)
         return user
 
     async def is_active(self, user: User) -> bool:
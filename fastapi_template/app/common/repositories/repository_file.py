@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional, Union
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from fastapi_template.app.common.database.database_unit_of_work import commit
 from fastapi_template.app.db.models import File
 from fastapi_template.app.common.repositories.repositories_base import BaseRepository
 from fastapi_template.app.db.schemas.file import FileCreate, FileUpdate
@@ -102,6 +103,7 @@ class FileRepository(BaseRepository[File, FileCreate, FileUpdate]):
             
         file.size = size
         db.add(file)
-        await db.commit()
+        await commit(db)
         await db.refresh(file)
+        await self.invalidate_cache(ids=[file.id], db=db)
         return file 
\ No newline at end of file
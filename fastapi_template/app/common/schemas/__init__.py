@@ -26,8 +26,11 @@ from app.common.schemas.base_schema import (
 # 페이지네이션 스키마 내보내기
 from app.common.schemas.pagination_schema import (
     PaginationParams,
+    CursorParams,
     PageInfo,
+    CursorPageInfo,
     PaginatedResponse,
+    CursorPaginatedResponse,
 )
 
 __all__ = [
@@ -48,6 +51,9 @@ __all__ = [
     "EventSchema",
     # 페이지네이션 스키마
     "PaginationParams",
+    "CursorParams",
     "PageInfo",
+    "CursorPageInfo",
     "PaginatedResponse",
+    "CursorPaginatedResponse",
 ]
@@ -3,7 +3,7 @@
 # Description: 페이지네이션 관련 스키마 정의
 """
 
-from typing import Annotated, Generic, List, TypeVar
+from typing import Annotated, Generic, List, Literal, Optional, TypeVar
 
 from fastapi import Query
 from pydantic import BaseModel
@@ -20,14 +20,47 @@ class PaginationParams:
 
     def __init__(
         self,
-        page: Annotated[int, Query(1, ge=1, description="페이지 번호")] = 1,
-        page_size: Annotated[int, Query(10, ge=1, le=100, description="페이지당 항목 수")] = 10,
+        page: Annotated[int, Query(ge=1, description="페이지 번호")] = 1,
+        page_size: Annotated[int, Query(ge=1, le=100, description="페이지당 항목 수")] = 10,
     ):
         self.page = page
         self.page_size = page_size
         self.skip = (page - 1) * page_size
 
 
+class CursorParams(PaginationParams):
+    """
+    커서(keyset) 기반 페이지네이션을 함께 지원하는 요청 파라미터
+
+    paging=cursor 이거나 cursor가 주어지면 커서 모드로 동작하고,
+    그렇지 않으면 기존 page/page_size 오프셋 모드로 동작합니다.
+    """
+
+    def __init__(
+        self,
+        page: Annotated[int, Query(ge=1, description="페이지 번호 (오프셋 모드)")] = 1,
+        page_size: Annotated[int, Query(ge=1, le=100, description="페이지당 항목 수")] = 10,
+        paging: Annotated[
+            Literal["offset", "cursor"], Query(description="페이지네이션 방식")
+        ] = "offset",
+        cursor: Annotated[
+            Optional[str], Query(description="이전 응답의 next_cursor (커서 모드)")
+        ] = None,
+        sort_by: Annotated[str, Query(description="정렬 기준 필드")] = "id",
+        descending: Annotated[bool, Query(description="내림차순 정렬 여부")] = False,
+    ):
+        super().__init__(page=page, page_size=page_size)
+        self.paging = paging
+        self.cursor = cursor
+        self.sort_by = sort_by
+        self.descending = descending
+
+    @property
+    def use_cursor(self) -> bool:
+        """커서 모드 여부"""
+        return self.paging == "cursor" or self.cursor is not None
+
+
 class PageInfo(BaseModel):
     """
     페이지 정보 모델
@@ -35,10 +68,11 @@ class PageInfo(BaseModel):
 
     page: int
     page_size: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int]  # None이면 총 개수를 알 수 없음
+    total_pages: Optional[int]
     has_previous: bool
     has_next: bool
+    total_is_exact: bool = True  # False면 추정치 또는 캐시된 값
 
 
 class PaginatedResponse(OutputSchema, Generic[T]):
@@ -51,12 +85,27 @@ class PaginatedResponse(OutputSchema, Generic[T]):
 
     @classmethod
     def create(
-        cls, items: List[T], total_items: int, params: PaginationParams
+        cls,
+        items: List[T],
+        total_items: Optional[int],
+        params: PaginationParams,
+        total_is_exact: bool = True,
+        has_next: Optional[bool] = None,
     ) -> "PaginatedResponse[T]":
         """
         페이지네이션 응답 객체 생성
+
+        total_items가 None(알 수 없음)이면 total_pages도 None이 되며, has_next를 지정하지
+        않으면 현재 페이지가 가득 찼는지로 다음 페이지 존재 여부를 판단합니다.
         """
-        total_pages = (total_items + params.page_size - 1) // params.page_size if total_items > 0 else 0
+        if total_items is None:
+            total_pages = None
+            if has_next is None:
+                has_next = len(items) >= params.page_size
+        else:
+            total_pages = (total_items + params.page_size - 1) // params.page_size if total_items > 0 else 0
+            if has_next is None:
+                has_next = params.page < total_pages
 
         page_info = PageInfo(
             page=params.page,
@@ -64,7 +113,46 @@ class PaginatedResponse(OutputSchema, Generic[T]):
             total_items=total_items,
             total_pages=total_pages,
             has_previous=params.page > 1,
-            has_next=params.page < total_pages,
+            has_next=has_next,
+            total_is_exact=total_is_exact,
+        )
+
+        return cls(items=items, page_info=page_info)
+
+
+class CursorPageInfo(BaseModel):
+    """
+    커서 페이지 정보 모델
+    """
+
+    page_size: int
+    sort_by: str
+    descending: bool
+    has_next: bool
+    next_cursor: Optional[str] = None
+
+
+class CursorPaginatedResponse(OutputSchema, Generic[T]):
+    """
+    커서 기반 페이지네이션 결과 응답 모델
+    """
+
+    items: List[T]
+    page_info: CursorPageInfo
+
+    @classmethod
+    def create(
+        cls, items: List[T], next_cursor: Optional[str], params: CursorParams
+    ) -> "CursorPaginatedResponse[T]":
+        """
+        커서 페이지네이션 응답 객체 생성
+        """
+        page_info = CursorPageInfo(
+            page_size=params.page_size,
+            sort_by=params.sort_by,
+            descending=params.descending,
+            has_next=next_cursor is not None,
+            next_cursor=next_cursor,
         )
 
-        return cls(items=items, page_info=page_info) 
\ No newline at end of file
+        return cls(items=items, page_info=page_info)
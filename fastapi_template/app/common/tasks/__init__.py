@@ -0,0 +1,13 @@
+"""
+# File: fastapi_template/app/common/tasks/__init__.py
+# Description: 백그라운드 작업 모듈 패키지
+"""
+
+from fastapi_template.app.common.tasks.tasks_periodic import PeriodicTask
+from fastapi_template.app.common.tasks.tasks_token_cleanup import CleanupReport, TokenCleanupTask
+
+__all__ = [
+    "PeriodicTask",
+    "CleanupReport",
+    "TokenCleanupTask",
+]
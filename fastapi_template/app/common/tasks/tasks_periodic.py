@@ -0,0 +1,64 @@
+"""
+# File: fastapi_template/app/common/tasks/tasks_periodic.py
+# Description: 주기적으로 실행되는 백그라운드 작업의 기본 클래스
+# - lifespan에서 start()/stop()으로 시작과 종료
+# - 실행 중 예외가 발생해도 로그를 남기고 다음 주기에 다시 실행
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask(ABC):
+    """
+    interval초마다 run_once()를 실행하는 백그라운드 작업
+    """
+
+    name: str = "periodic_task"
+
+    def __init__(self, interval: float, initial_delay: float = 0.0):
+        """
+        Args:
+            interval: 실행 간격(초)
+            initial_delay: 시작 후 첫 실행까지 대기 시간(초)
+        """
+        self.interval = interval
+        self.initial_delay = initial_delay
+        self._task: Optional[asyncio.Task] = None
+
+    @abstractmethod
+    async def run_once(self) -> Any:
+        """작업을 한 번 실행합니다."""
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 작업을 시작합니다."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """작업을 취소하고 종료될 때까지 기다립니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        await asyncio.sleep(self.initial_delay)
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception(f"{self.name} 작업 실행 실패")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,94 @@
+"""
+# File: fastapi_template/app/common/tasks/tasks_token_cleanup.py
+# Description: 만료 토큰 정리 작업
+# - 만료된 토큰을 배치 단위로 삭제 (배치마다 커밋, 배치 사이 양보)
+# - 시간 파티션 사용 시 만료된 파티션을 통째로 삭제 (PostgreSQL)
+# - 실행마다 삭제 행 수와 처리량을 로그로 기록
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Callable, NamedTuple, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_template.app.common.repositories.repositories_auth import AuthRepository
+from fastapi_template.app.common.tasks.tasks_periodic import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+
+class CleanupReport(NamedTuple):
+    """만료 토큰 정리 결과"""
+
+    deleted: int
+    partitions: int
+    elapsed: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.deleted / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class TokenCleanupTask(PeriodicTask):
+    """
+    만료된 토큰을 주기적으로 삭제하는 작업
+    """
+
+    name = "token_cleanup"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        *,
+        interval: float = 3600,
+        batch_size: int = 5000,
+        pause: float = 0.1,
+        partitioned: bool = False,
+        initial_delay: float = 0.0,
+        repository: Optional[AuthRepository] = None,
+    ):
+        """
+        Args:
+            session_factory: 실행마다 새 세션을 만드는 팩토리 (예: AsyncSessionLocal)
+            interval: 실행 간격(초)
+            batch_size: 한 트랜잭션에서 삭제할 토큰 수
+            pause: 배치 사이 대기 시간(초)
+            partitioned: 만료된 시간 파티션을 먼저 삭제할지 여부 (PostgreSQL)
+            initial_delay: 시작 후 첫 실행까지 대기 시간(초)
+            repository: 토큰 리포지토리
+        """
+        super().__init__(interval, initial_delay)
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.pause = pause
+        self.partitioned = partitioned
+        self.repository = repository or AuthRepository()
+
+    async def run_once(self, now: Optional[datetime] = None) -> CleanupReport:
+        """
+        만료된 토큰을 한 번 정리하고 결과를 반환합니다.
+
+        Args:
+            now: 만료 기준 시각 (기본값: 현재 UTC 시각)
+        """
+        now = now or datetime.utcnow()
+        started = time.perf_counter()
+
+        async with self.session_factory() as db:
+            partitions = 0
+            if self.partitioned:
+                partitions = await self.repository.drop_expired_partitions(db, now=now)
+            deleted = await self.repository.clean_expired_tokens(
+                db, batch_size=self.batch_size, pause=self.pause, now=now
+            )
+
+        report = CleanupReport(
+            deleted=deleted, partitions=partitions, elapsed=time.perf_counter() - started
+        )
+        logger.info(
+            f"만료 토큰 정리: {report.deleted}행, 파티션 {report.partitions}개 삭제 "
+            f"({report.elapsed:.2f}초, {report.rows_per_second:,.0f}행/초)"
+        )
+        return report
@@ -10,8 +10,20 @@ from app.common.utils.datetime import (
     parse_datetime,
     add_time,
 )
-from app.common.utils.pagination import PaginationParams, PageInfo, PaginatedResponse
-from app.common.utils.orm_utils import get_python_value
+from app.common.utils.pagination import (
+    PaginationParams,
+    CursorParams,
+    PageInfo,
+    PaginatedResponse,
+    CursorPaginatedResponse,
+)
+from app.common.utils.orm_utils import (
+    get_python_value,
+    load_fields,
+    relationship_options,
+    schema_fields,
+)
+from app.common.utils.statements import HotQueryRegistry, hot_queries
 
 # 참고: 캐싱 관련 기능은 app.common.cache.redis_client에서 임포트하세요
 
@@ -23,5 +35,12 @@ __all__ = [
     "PaginationParams",
     "PageInfo",
     "PaginatedResponse",
+    "CursorParams",
+    "CursorPaginatedResponse",
     "get_python_value",
+    "load_fields",
+    "relationship_options",
+    "schema_fields",
+    "HotQueryRegistry",
+    "hot_queries",
 ]
@@ -0,0 +1,148 @@
+"""
+# File: fastapi_template/app/common/utils/bulk_export.py
+# Description: 스트리밍 대량 내보내기
+# - 서버 측 커서로 조회한 행을 NDJSON/CSV 바이트 청크로 변환
+# - StreamingResponse로 전송하여 행 수와 관계없이 메모리 사용량 일정
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence
+from uuid import UUID
+
+from fastapi.responses import StreamingResponse
+
+# 한 번에 전송할 행 수 (청크가 너무 작으면 전송 횟수가 늘고, 너무 크면 메모리 사용량이 늘어남)
+ROWS_PER_CHUNK = 500
+
+
+class ExportFormat(str, Enum):
+    """내보내기 형식"""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+def _plain_value(value: Any) -> Any:
+    """JSON/CSV로 표현할 수 있는 값으로 변환"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    return value
+
+
+async def _close(rows: AsyncIterator[Any]) -> None:
+    # 전송이 중간에 멈춰도(클라이언트 연결 종료 등) 서버 측 커서를 바로 닫음
+    aclose = getattr(rows, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+async def encode_ndjson(
+    rows: AsyncIterator[Any], columns: Sequence[str], rows_per_chunk: int = ROWS_PER_CHUNK
+) -> AsyncIterator[bytes]:
+    """
+    행을 줄마다 JSON 객체 하나인 NDJSON 청크로 변환
+
+    Args:
+        rows: 컬럼 순서대로 값을 담은 행 (예: stream_multi(columns=...)의 Row)
+        columns: 컬럼명
+        rows_per_chunk: 청크당 행 수
+    """
+    lines = []
+    try:
+        async for row in rows:
+            lines.append(
+                json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=_plain_value)
+            )
+            if len(lines) >= rows_per_chunk:
+                yield ("\n".join(lines) + "\n").encode()
+                lines = []
+    finally:
+        await _close(rows)
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def encode_csv(
+    rows: AsyncIterator[Any], columns: Sequence[str], rows_per_chunk: int = ROWS_PER_CHUNK
+) -> AsyncIterator[bytes]:
+    """
+    행을 헤더가 있는 CSV 청크로 변환 (None은 빈 값)
+
+    Args:
+        rows: 컬럼 순서대로 값을 담은 행 (예: stream_multi(columns=...)의 Row)
+        columns: 컬럼명 (헤더)
+        rows_per_chunk: 청크당 행 수
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    count = 0
+    try:
+        async for row in rows:
+            writer.writerow(["" if value is None else _plain_value(value) for value in row])
+            count += 1
+            if count >= rows_per_chunk:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+                count = 0
+    finally:
+        await _close(rows)
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+EXPORT_ENCODERS: Dict[ExportFormat, Callable[..., AsyncIterator[bytes]]] = {
+    ExportFormat.NDJSON: encode_ndjson,
+    ExportFormat.CSV: encode_csv,
+}
+
+EXPORT_MEDIA_TYPES: Dict[ExportFormat, str] = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def export_response(
+    rows: AsyncIterator[Any],
+    columns: Sequence[str],
+    export_format: ExportFormat,
+    *,
+    filename: Optional[str] = None,
+    rows_per_chunk: int = ROWS_PER_CHUNK,
+) -> StreamingResponse:
+    """
+    행을 NDJSON/CSV로 스트리밍하는 응답 생성
+
+    청크를 하나씩 전송하며, 서버의 쓰기 버퍼가 가득 차면 전송이 끝날 때까지 다음 행을
+    가져오지 않으므로(백프레셔) 느린 클라이언트에도 메모리 사용량이 늘지 않습니다.
+    rows가 세션을 사용하면 세션은 응답 전송이 끝날 때까지 열려 있어야 합니다 (get_db 기본 scope).
+
+    Args:
+        rows: 컬럼 순서대로 값을 담은 행
+        columns: 컬럼명
+        export_format: 내보내기 형식
+        filename: 다운로드 파일명 (확장자 제외, 지정하면 Content-Disposition 추가)
+        rows_per_chunk: 청크당 행 수
+
+    Example:
+        rows = repository.stream_multi(db, columns=columns)
+        return export_response(rows, columns, ExportFormat.CSV, filename="items")
+    """
+    headers = {}
+    if filename is not None:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}.{export_format.value}"'
+    return StreamingResponse(
+        EXPORT_ENCODERS[export_format](rows, columns, rows_per_chunk),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers=headers,
+    )
@@ -0,0 +1,253 @@
+"""
+# File: fastapi_template/app/common/utils/bulk_import.py
+# Description: 스트리밍 대량 가져오기
+# - CSV/NDJSON 요청 본문을 전체를 버퍼링하지 않고 한 레코드씩 파싱
+# - 스키마로 행마다 검증하여 청크 단위로 삽입 (PostgreSQL COPY 또는 배치 executemany)
+# - 행 번호별 오류 보고서 반환
+"""
+
+import codecs
+import csv
+import json
+import logging
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_template.app.common.database.database_unit_of_work import current_unit_of_work, rollback
+
+logger = logging.getLogger(__name__)
+
+# 줄바꿈 없이 이어지는 본문을 무한히 버퍼링하지 않도록 제한하는 레코드 최대 길이(문자)
+MAX_RECORD_LENGTH = 1_000_000
+
+BeforeInsert = Callable[[AsyncSession, List[Dict[str, Any]]], Awaitable[None]]
+
+
+class BulkImportError(ValueError):
+    """본문을 더 이상 읽을 수 없는 오류 (인코딩 오류, 너무 긴 레코드)"""
+
+
+class ParsedRecord(NamedTuple):
+    """파싱된 레코드 한 건 (row는 헤더를 제외한 1부터 시작하는 레코드 번호)"""
+
+    row: int
+    data: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+
+
+class ImportRowError(NamedTuple):
+    """가져오지 못한 행과 오류 목록 ({"loc": [...], "msg": "..."})"""
+
+    row: int
+    errors: List[Dict[str, Any]]
+
+
+class BulkImportReport:
+    """가져오기 결과 (오류는 max_errors개까지만 보관하고 나머지는 개수만 집계)"""
+
+    def __init__(self, max_errors: int = 1000):
+        self.inserted = 0
+        self.failed = 0
+        self.errors: List[ImportRowError] = []
+        self.max_errors = max_errors
+        self.aborted: Optional[str] = None
+
+    @property
+    def errors_truncated(self) -> bool:
+        return self.failed > len(self.errors)
+
+    def fail(self, row: int, errors: List[Dict[str, Any]]) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(ImportRowError(row, errors))
+
+
+async def _iter_lines(
+    chunks: AsyncIterable[bytes], encoding: str, max_record_length: int
+) -> AsyncIterator[str]:
+    """바이트 청크를 점진적으로 디코딩하여 줄 단위(줄바꿈 포함)로 반환"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+            for line in lines:
+                yield line + "\n"
+            if len(pending) > max_record_length:
+                raise BulkImportError(f"레코드가 너무 깁니다 (최대 {max_record_length}자)")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise BulkImportError(f"{encoding}으로 디코딩할 수 없는 본문입니다: {exc.reason}") from exc
+    if pending:
+        yield pending
+
+
+async def iter_ndjson(
+    chunks: AsyncIterable[bytes],
+    encoding: str = "utf-8-sig",
+    max_record_length: int = MAX_RECORD_LENGTH,
+) -> AsyncIterator[ParsedRecord]:
+    """줄마다 JSON 객체 하나인 본문을 레코드 단위로 파싱 (빈 줄은 건너뜀)"""
+    row = 0
+    async for line in _iter_lines(chunks, encoding, max_record_length):
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            yield ParsedRecord(row, None, f"잘못된 JSON입니다: {exc}")
+            continue
+        if not isinstance(data, dict):
+            yield ParsedRecord(row, None, "JSON 객체가 아닙니다")
+            continue
+        yield ParsedRecord(row, data)
+
+
+async def iter_csv(
+    chunks: AsyncIterable[bytes],
+    encoding: str = "utf-8-sig",
+    max_record_length: int = MAX_RECORD_LENGTH,
+) -> AsyncIterator[ParsedRecord]:
+    """
+    첫 레코드를 헤더로 사용하는 CSV 본문을 레코드 단위로 파싱
+
+    따옴표로 감싼 값 안의 줄바꿈을 지원하며, 빈 값은 None으로 변환합니다.
+    """
+    header: Optional[List[str]] = None
+    row = 0
+    buffer: List[str] = []
+    quotes = 0
+    async for line in _iter_lines(chunks, encoding, max_record_length):
+        buffer.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            # 따옴표 안의 줄바꿈: 레코드가 끝날 때까지 다음 줄을 이어 붙임
+            if sum(map(len, buffer)) > max_record_length:
+                raise BulkImportError(f"레코드가 너무 깁니다 (최대 {max_record_length}자)")
+            continue
+        values = next(csv.reader(buffer), [])
+        buffer, quotes = [], 0
+        if not any(value.strip() for value in values):
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield ParsedRecord(row, None, f"열 개수({len(values)})가 헤더({len(header)})와 다릅니다")
+            continue
+        yield ParsedRecord(row, {name: value or None for name, value in zip(header, values)})
+    if buffer:
+        yield ParsedRecord(row + 1, None, "닫히지 않은 따옴표가 있습니다")
+
+
+RECORD_PARSERS: Dict[str, Callable[..., AsyncIterator[ParsedRecord]]] = {
+    "text/csv": iter_csv,
+    "application/x-ndjson": iter_ndjson,
+    "application/ndjson": iter_ndjson,
+    "application/jsonl": iter_ndjson,
+}
+
+
+def get_record_parser(content_type: str) -> Optional[Callable[..., AsyncIterator[ParsedRecord]]]:
+    """Content-Type에 맞는 레코드 파서, 지원하지 않으면 None"""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return RECORD_PARSERS.get(media_type)
+
+
+async def bulk_import(
+    db: AsyncSession,
+    records: AsyncIterable[ParsedRecord],
+    *,
+    schema: Type[BaseModel],
+    repository: Any,
+    chunk_size: int = 10000,
+    max_errors: int = 1000,
+    values: Optional[Dict[str, Any]] = None,
+    before_insert: Optional[BeforeInsert] = None,
+) -> BulkImportReport:
+    """
+    파싱된 레코드를 스키마로 검증하여 청크 단위로 삽입합니다.
+
+    청크마다 repository.bulk_create(return_objects=False)로 삽입하고 커밋하므로
+    (PostgreSQL에서 청크가 copy_threshold 이상이면 COPY) 메모리에는 한 청크만 유지됩니다.
+    삽입에 실패한 청크는 롤백하고 해당 행들을 오류로 기록한 뒤 다음 청크를 계속 처리합니다.
+    본문을 더 이상 읽을 수 없으면 그때까지의 결과와 함께 aborted에 사유를 남깁니다.
+
+    Args:
+        db: 데이터베이스 세션
+        records: 파싱된 레코드 (iter_csv, iter_ndjson)
+        schema: 행 검증 스키마 (예: ItemCreate)
+        repository: 삽입할 모델의 리포지토리 (bulk_create 제공)
+        chunk_size: 한 번에 삽입하고 커밋할 행 수
+        max_errors: 보고서에 보관할 최대 오류 행 수
+        values: 모든 행에 덮어쓸 값 (예: {"owner_id": 1})
+        before_insert: 청크 삽입 직전 같은 트랜잭션에서 실행할 함수 (예: 카운터 갱신)
+
+    Returns:
+        BulkImportReport: 삽입/실패 행 수와 행별 오류
+    """
+    report = BulkImportReport(max_errors)
+    chunk: List[Tuple[int, Dict[str, Any]]] = []
+    try:
+        async for record in records:
+            if record.error is not None:
+                report.fail(record.row, [{"loc": [], "msg": record.error}])
+                continue
+            try:
+                obj = schema.model_validate(record.data)
+            except ValidationError as exc:
+                report.fail(
+                    record.row,
+                    [{"loc": list(error["loc"]), "msg": error["msg"]} for error in exc.errors()],
+                )
+                continue
+            chunk.append((record.row, {**obj.model_dump(), **(values or {})}))
+            if len(chunk) >= chunk_size:
+                await _insert_chunk(db, chunk, repository, report, before_insert)
+                chunk = []
+    except BulkImportError as exc:
+        report.aborted = str(exc)
+
+    if chunk:
+        await _insert_chunk(db, chunk, repository, report, before_insert)
+    return report
+
+
+async def _insert_chunk(
+    db: AsyncSession,
+    chunk: List[Tuple[int, Dict[str, Any]]],
+    repository: Any,
+    report: BulkImportReport,
+    before_insert: Optional[BeforeInsert],
+) -> None:
+    rows = [values for _, values in chunk]
+    try:
+        if before_insert is not None:
+            await before_insert(db, rows)
+        await repository.bulk_create(db, obj_in_list=rows, return_objects=False)
+    except SQLAlchemyError as exc:
+        if current_unit_of_work(db) is not None:
+            raise
+        await rollback(db)
+        logger.warning(f"대량 가져오기 청크 삽입 실패 (행 {chunk[0][0]}~{chunk[-1][0]}): {exc}")
+        for row, _ in chunk:
+            report.fail(row, [{"loc": [], "msg": f"저장 실패: {type(exc).__name__}"}])
+        return
+    report.inserted += len(rows)
@@ -0,0 +1,290 @@
+"""
+# File: fastapi_template/app/common/utils/count_strategy.py
+# Description: 페이지네이션 총 개수 계산 전략
+# - exact: 매 요청마다 SELECT count(*)
+# - window: count(*) OVER ()로 페이지와 총 개수를 한 번에 조회
+# - cached: 정확한 개수를 TTL 동안 캐시
+# - estimate: PostgreSQL 플래너 추정치 (pg_class / EXPLAIN)
+# - counter: 삽입/삭제 시 유지되는 카운터 컬럼 사용
+"""
+
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.schemas.pagination_schema import PaginationParams
+from fastapi_template.app.common.cache.cache_base import CacheBackend
+from fastapi_template.app.common.cache.cache_memory import MemoryCacheBackend
+
+
+class CountResult(NamedTuple):
+    """총 개수 계산 결과"""
+
+    total: Optional[int]  # None이면 알 수 없음
+    exact: bool = True
+
+
+class CountStrategy(ABC):
+    """
+    페이지네이션 총 개수 계산 전략의 기본 클래스
+    """
+
+    name: str = "base"
+
+    @abstractmethod
+    async def count(self, db: AsyncSession, query: Any, **context: Any) -> CountResult:
+        """
+        쿼리 결과의 총 개수를 계산합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            query: 필터가 적용된 select 쿼리 (정렬/페이지네이션 미적용)
+            **context: 전략별 추가 정보 (예: owner_id)
+
+        Returns:
+            CountResult: 총 개수와 정확도
+        """
+
+    async def paginate(
+        self, db: AsyncSession, query: Any, params: PaginationParams, **context: Any
+    ) -> Tuple[List[Any], CountResult]:
+        """
+        한 페이지의 항목과 총 개수를 조회합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            query: 필터와 정렬이 적용된 select 쿼리
+            params: 페이지네이션 파라미터
+            **context: 전략별 추가 정보
+
+        Returns:
+            Tuple[List[Any], CountResult]: 페이지 항목과 총 개수
+        """
+        result = await db.execute(query.offset(params.skip).limit(params.page_size))
+        items = list(result.scalars().all())
+        return items, await self.count(db, query, **context)
+
+
+def _count_query(query: Any) -> Any:
+    """정렬을 제거한 쿼리를 감싸 count(*) 쿼리를 생성합니다."""
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+class ExactCountStrategy(CountStrategy):
+    """매 요청마다 SELECT count(*)를 실행하는 전략"""
+
+    name = "exact"
+
+    async def count(self, db: AsyncSession, query: Any, **context: Any) -> CountResult:
+        result = await db.execute(_count_query(query))
+        return CountResult(total=result.scalar_one(), exact=True)
+
+
+class WindowCountStrategy(ExactCountStrategy):
+    """
+    count(*) OVER ()를 페이지 쿼리에 추가하여 한 번의 쿼리로 총 개수를 얻는 전략
+
+    요청한 페이지가 범위를 벗어나 결과 행이 없으면 총 개수를 알 수 없으므로
+    그 경우에만 count(*)를 추가로 실행합니다.
+    """
+
+    name = "window"
+
+    async def paginate(
+        self, db: AsyncSession, query: Any, params: PaginationParams, **context: Any
+    ) -> Tuple[List[Any], CountResult]:
+        windowed = query.add_columns(func.count().over().label("total_count"))
+        result = await db.execute(windowed.offset(params.skip).limit(params.page_size))
+        rows = result.all()
+
+        if not rows:
+            return [], await self.count(db, query, **context)
+
+        return [row[0] for row in rows], CountResult(total=rows[0][-1], exact=True)
+
+
+class CachedCountStrategy(CountStrategy):
+    """
+    다른 전략의 결과를 TTL 동안 캐시하는 전략
+
+    캐시 키는 컴파일된 SQL과 바인드 파라미터로 생성되므로 필터가 다르면 별도로 캐시됩니다.
+    캐시된 값은 최대 TTL만큼 오래되었을 수 있으므로 exact=False로 표시합니다.
+    쓰기 후 invalidate()로 무효화합니다 (ItemService는 아이템 생성/삭제/가져오기 후 호출).
+    사용자 삭제의 CASCADE처럼 무효화하지 않는 쓰기는 최대 TTL 동안 반영되지 않습니다.
+    """
+
+    name = "cached"
+
+    def __init__(
+        self,
+        inner: Optional[CountStrategy] = None,
+        cache: Optional[CacheBackend] = None,
+        ttl: int = 60,
+        key_prefix: str = "count",
+    ):
+        self.inner = inner or ExactCountStrategy()
+        self.cache = cache or MemoryCacheBackend()
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+    def cache_key(self, query: Any) -> str:
+        """쿼리로부터 캐시 키를 생성합니다."""
+        compiled = query.compile()
+        params = json.dumps(compiled.params, sort_keys=True, default=str)
+        digest = hashlib.sha1(f"{compiled}|{params}".encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}:{digest}"
+
+    async def count(self, db: AsyncSession, query: Any, **context: Any) -> CountResult:
+        key = self.cache_key(query.order_by(None))
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return CountResult(total=int(cached), exact=False)
+
+        counted = await self.inner.count(db, query, **context)
+        if counted.total is not None:
+            await self.cache.set(key, str(counted.total), ttl=self.ttl)
+        return counted
+
+    async def invalidate(self) -> None:
+        """이 전략이 저장한 모든 캐시된 개수를 삭제합니다."""
+        await self.cache.clear_pattern(f"{self.key_prefix}:*")
+
+
+class EstimatedCountStrategy(CountStrategy):
+    """
+    PostgreSQL 플래너 추정치를 사용하는 전략
+
+    - 필터가 없는 쿼리: pg_class.reltuples
+    - 필터가 있는 쿼리: EXPLAIN (FORMAT JSON)의 Plan Rows
+    추정치가 threshold보다 작으면 정확한 개수가 저렴하므로 count(*)를 실행합니다.
+    PostgreSQL이 아닌 데이터베이스에서는 fallback 전략을 사용합니다.
+    """
+
+    name = "estimate"
+
+    def __init__(self, threshold: int = 100000, fallback: Optional[CountStrategy] = None):
+        self.threshold = threshold
+        self.fallback = fallback or ExactCountStrategy()
+
+    async def count(self, db: AsyncSession, query: Any, **context: Any) -> CountResult:
+        if db.get_bind().dialect.name != "postgresql":
+            return await self.fallback.count(db, query, **context)
+
+        estimate = await self._estimate(db, query.order_by(None))
+        if estimate is None or estimate < self.threshold:
+            return await self.fallback.count(db, query, **context)
+        return CountResult(total=estimate, exact=False)
+
+    async def _estimate(self, db: AsyncSession, query: Any) -> Optional[int]:
+        froms = query.get_final_froms()
+        if query.whereclause is None and len(froms) == 1 and hasattr(froms[0], "name"):
+            result = await db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+                {"name": froms[0].name},
+            )
+            reltuples = result.scalar()
+            # 한 번도 ANALYZE되지 않은 테이블은 -1
+            if reltuples is not None and reltuples >= 0:
+                return int(reltuples)
+
+        compiled = query.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True})
+        result = await db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        try:
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except (LookupError, TypeError, ValueError):
+            return None
+
+
+class CounterCountStrategy(CountStrategy):
+    """
+    삽입/삭제 시 유지되는 카운터 컬럼에서 개수를 읽는 전략
+
+    예: User.item_count (counter 전략일 때 ItemService가 아이템 생성/삭제 시 갱신)
+    context에 key_name에 해당하는 값이 없으면 fallback 전략을 사용합니다.
+    """
+
+    name = "counter"
+
+    def __init__(
+        self,
+        counter_column: Any,
+        key_column: Any,
+        key_name: str = "owner_id",
+        fallback: Optional[CountStrategy] = None,
+    ):
+        self.counter_column = counter_column
+        self.key_column = key_column
+        self.key_name = key_name
+        self.fallback = fallback or ExactCountStrategy()
+
+    async def count(self, db: AsyncSession, query: Any, **context: Any) -> CountResult:
+        key = context.get(self.key_name)
+        if key is None:
+            return await self.fallback.count(db, query, **context)
+
+        result = await db.execute(
+            select(self.counter_column).where(self.key_column == key)
+        )
+        return CountResult(total=result.scalar() or 0, exact=True)
+
+
+def build_count_strategy(
+    name: str,
+    *,
+    cache_ttl: int = 60,
+    estimate_threshold: int = 100000,
+    counter_column: Any = None,
+    key_column: Any = None,
+) -> CountStrategy:
+    """
+    이름으로 개수 계산 전략을 생성합니다.
+
+    Args:
+        name: exact, window, cached, estimate, counter
+        cache_ttl: cached 전략의 캐시 유효기간(초)
+        estimate_threshold: estimate 전략에서 추정치를 사용할 최소 행 수
+        counter_column: counter 전략의 카운터 컬럼 (예: User.item_count)
+        key_column: counter 전략에서 카운터 행을 찾을 컬럼 (예: User.id)
+
+    Returns:
+        CountStrategy: 생성된 전략
+
+    Raises:
+        ValueError: 지원하지 않는 전략 이름이거나 counter 전략에 컬럼이 없는 경우
+    """
+    if name == ExactCountStrategy.name:
+        return ExactCountStrategy()
+    if name == WindowCountStrategy.name:
+        return WindowCountStrategy()
+    if name == CachedCountStrategy.name:
+        return CachedCountStrategy(ttl=cache_ttl)
+    if name == EstimatedCountStrategy.name:
+        return EstimatedCountStrategy(threshold=estimate_threshold)
+    if name == CounterCountStrategy.name:
+        if counter_column is None or key_column is None:
+            raise ValueError("counter 전략에는 counter_column과 key_column이 필요합니다")
+        # 카운터가 없는 전체 조회는 플래너 추정치 사용
+        return CounterCountStrategy(
+            counter_column,
+            key_column,
+            fallback=EstimatedCountStrategy(threshold=estimate_threshold),
+        )
+    raise ValueError(
+        f"지원하지 않는 개수 계산 전략: {name}. 지원 전략: {', '.join(COUNT_STRATEGIES)}"
+    )
+
+
+COUNT_STRATEGIES = (
+    ExactCountStrategy.name,
+    WindowCountStrategy.name,
+    CachedCountStrategy.name,
+    EstimatedCountStrategy.name,
+    CounterCountStrategy.name,
+)
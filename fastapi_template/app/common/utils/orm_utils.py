@@ -5,11 +5,21 @@
 # - ORM 모델 조작 도우미 함수
 """
 
-from typing import Any, TypeVar, cast, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, TypeVar, cast
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, lazyload, load_only, raiseload, selectinload
 from sqlalchemy.sql.schema import Column
 
 T = TypeVar("T")
 
+# 관계 로딩 전략 이름과 로더 옵션
+LOAD_STRATEGIES: Dict[str, Any] = {
+    "selectin": selectinload,  # 부모 목록 조회 후 SELECT ... WHERE fk IN (...) 한 번
+    "joined": joinedload,  # 같은 쿼리에서 JOIN으로 조회 (다대일에 적합)
+    "raise": raiseload,  # 접근 시 예외
+    "lazy": lazyload,  # 접근 시 개별 조회 (비동기 세션에서는 사용 불가)
+}
+
 
 def get_python_value(column_value: Any, default_value: Optional[T] = None) -> Any:
     """
@@ -34,3 +44,92 @@ def get_python_value(column_value: Any, default_value: Optional[T] = None) -> An
         return cast(T, column_value._annotations.get("value", default_value))
     
     return column_value
+
+
+def schema_fields(model: Any, schema: Any) -> List[str]:
+    """
+    응답 스키마 필드 중 모델 컬럼에 해당하는 필드명 목록
+
+    Args:
+        model: SQLAlchemy 모델 클래스
+        schema: Pydantic 스키마 클래스
+
+    Returns:
+        List[str]: 스키마와 모델에 모두 있는 컬럼명
+
+    Example:
+        ```python
+        fields = schema_fields(User, UserSchema)  # hashed_password 등 제외
+        ```
+    """
+    columns = set(inspect(model).column_attrs.keys())
+    return [name for name in schema.model_fields if name in columns]
+
+
+def load_fields(model: Any, fields: Sequence[str]) -> Any:
+    """
+    지정한 컬럼만 조회하는 로더 옵션 생성 (기본 키는 항상 포함)
+
+    조회하지 않은 컬럼에 접근하면 지연 로딩 대신 예외가 발생합니다.
+
+    Args:
+        model: SQLAlchemy 모델 클래스
+        fields: 조회할 컬럼명 목록
+
+    Returns:
+        load_only 로더 옵션
+
+    Raises:
+        ValueError: 모델에 없는 컬럼명인 경우
+
+    Example:
+        ```python
+        query = select(Item).options(load_fields(Item, ["id", "title"]))
+        ```
+    """
+    columns = inspect(model).column_attrs
+    unknown = [name for name in fields if name not in columns]
+    if unknown:
+        raise ValueError(f"{model.__name__}에 없는 컬럼: {', '.join(unknown)}")
+    return load_only(*(getattr(model, name) for name in fields), raiseload=True)
+
+
+def relationship_options(
+    model: Any, load: Optional[Mapping[str, str]] = None, raise_by_default: bool = True
+) -> List[Any]:
+    """
+    관계별 로딩 전략 옵션 생성
+
+    지정하지 않은 관계는 raise_by_default가 True이면 raiseload로 설정되어,
+    실수로 발생하는 지연 로딩(N+1)이 쿼리 대신 예외로 드러납니다.
+    (식별자 맵에 이미 있는 다대일 객체 접근처럼 SQL이 필요 없는 경우는 허용)
+
+    Args:
+        model: SQLAlchemy 모델 클래스
+        load: 관계명과 전략 이름 (selectin, joined, raise, lazy)
+        raise_by_default: 지정하지 않은 관계에 raiseload 적용 여부
+
+    Returns:
+        List[Any]: 로더 옵션 목록
+
+    Raises:
+        ValueError: 모델에 없는 관계이거나 지원하지 않는 전략인 경우
+
+    Example:
+        ```python
+        query = select(User).options(*relationship_options(User, {"items": "selectin"}))
+        ```
+    """
+    relationships = inspect(model).relationships
+    options = []
+    for name, strategy in (load or {}).items():
+        if name not in relationships:
+            raise ValueError(f"{model.__name__}에 없는 관계: {name}")
+        if strategy not in LOAD_STRATEGIES:
+            raise ValueError(
+                f"지원하지 않는 로딩 전략: {strategy}. 지원 전략: {', '.join(LOAD_STRATEGIES)}"
+            )
+        options.append(LOAD_STRATEGIES[strategy](getattr(model, name)))
+    if raise_by_default:
+        options.append(raiseload("*", sql_only=True))
+    return options
@@ -3,11 +3,26 @@
 # Description: 페이지네이션 관련 유틸리티
 """
 
-from typing import List, TypeVar, Any, Dict
+import base64
+import hashlib
+import hmac
+import json
+from datetime import datetime
+from typing import List, TypeVar, Any, Dict, Optional, Sequence, Tuple
 
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.exceptions import InvalidParameterError
 from app.common.schemas.pagination_schema import (
     PaginationParams,
+    CursorParams,
+    PageInfo,
+    CursorPageInfo,
+    PaginatedResponse,
+    CursorPaginatedResponse,
 )
+from fastapi_template.app.common.config import config_settings
 
 T = TypeVar("T")
 
@@ -19,12 +34,215 @@ T = TypeVar("T")
 def apply_pagination(query: Any, params: PaginationParams) -> Any:
     """
     쿼리에 페이지네이션 적용
-    
+
     Args:
         query: 데이터베이스 쿼리 객체
         params: 페이지네이션 파라미터
-        
+
     Returns:
         페이지네이션이 적용된 쿼리 객체
     """
     return query.offset(params.skip).limit(params.page_size)
+
+
+def _cursor_signature(payload: bytes) -> str:
+    """커서 페이로드의 HMAC 서명을 생성합니다."""
+    key = str(config_settings.SECRET_KEY).encode("utf-8")
+    digest = hmac.new(key, payload, hashlib.sha256).digest()[:16]
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    return value
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict) and "$dt" in value:
+        return datetime.fromisoformat(value["$dt"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any], sort_by: str, descending: bool) -> str:
+    """
+    정렬 키 값을 서명된 불투명(opaque) 커서 문자열로 인코딩합니다.
+
+    Args:
+        values: 마지막 행의 정렬 키 값 (정렬 필드 값, id)
+        sort_by: 정렬 기준 필드
+        descending: 내림차순 여부
+
+    Returns:
+        str: URL에 안전한 커서 문자열
+    """
+    payload = json.dumps(
+        {"s": sort_by, "d": descending, "v": [_encode_cursor_value(v) for v in values]},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    body = base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+    return f"{body}.{_cursor_signature(payload)}"
+
+
+def decode_cursor(cursor: str, sort_by: str, descending: bool) -> List[Any]:
+    """
+    커서 문자열을 검증하고 정렬 키 값으로 디코딩합니다.
+
+    Args:
+        cursor: encode_cursor()로 생성된 커서
+        sort_by: 현재 요청의 정렬 기준 필드
+        descending: 현재 요청의 내림차순 여부
+
+    Returns:
+        List[Any]: 정렬 키 값 (정렬 필드 값, id)
+
+    Raises:
+        InvalidParameterError: 커서가 변조되었거나 정렬 조건이 다른 경우
+    """
+    try:
+        body, signature = cursor.split(".", 1)
+        payload = base64.urlsafe_b64decode(body + "=" * (-len(body) % 4))
+        valid = hmac.compare_digest(signature, _cursor_signature(payload))
+        data = json.loads(payload) if valid else None
+    except (ValueError, TypeError):
+        data = None
+
+    if not isinstance(data, dict) or not isinstance(data.get("v"), list):
+        raise InvalidParameterError(param_name="cursor", reason="잘못된 커서입니다.")
+    if data.get("s") != sort_by or data.get("d") != descending:
+        raise InvalidParameterError(
+            param_name="cursor", reason="커서의 정렬 조건이 요청과 일치하지 않습니다."
+        )
+
+    return [_decode_cursor_value(v) for v in data["v"]]
+
+
+def apply_keyset_pagination(
+    query: Any,
+    sort_column: Any,
+    id_column: Any,
+    *,
+    limit: int,
+    after: Optional[Sequence[Any]] = None,
+    descending: bool = False,
+) -> Any:
+    """
+    쿼리에 키셋(seek) 페이지네이션 적용
+
+    ORDER BY (sort_column, id) 후 마지막 행의 키 다음부터 조회하므로
+    OFFSET과 달리 깊은 페이지에서도 비용이 일정합니다.
+
+    Args:
+        query: 데이터베이스 쿼리 객체
+        sort_column: 정렬 기준 컬럼
+        id_column: 동점 처리를 위한 고유 컬럼 (기본 키)
+        limit: 조회할 최대 레코드 수
+        after: 이전 페이지 마지막 행의 키 (정렬 필드 값, id)
+        descending: 내림차순 여부
+
+    Returns:
+        키셋 페이지네이션이 적용된 쿼리 객체
+    """
+    same_column = sort_column is id_column
+
+    if after is not None:
+        last_value, last_id = after
+        if same_column:
+            condition = id_column < last_id if descending else id_column > last_id
+        elif descending:
+            condition = or_(
+                sort_column < last_value,
+                and_(sort_column == last_value, id_column < last_id),
+            )
+        else:
+            condition = or_(
+                sort_column > last_value,
+                and_(sort_column == last_value, id_column > last_id),
+            )
+        query = query.where(condition)
+
+    order_columns = [id_column] if same_column else [sort_column, id_column]
+    if descending:
+        order_columns = [column.desc() for column in order_columns]
+
+    return query.order_by(*order_columns).limit(limit)
+
+
+def resolve_sort_column(model: Any, sort_by: str, allowed_fields: Sequence[str]) -> Any:
+    """
+    정렬 기준 필드명을 모델 컬럼으로 변환합니다.
+
+    Raises:
+        InvalidParameterError: 허용되지 않은 정렬 필드인 경우
+    """
+    if sort_by not in allowed_fields:
+        raise InvalidParameterError(
+            param_name="sort_by",
+            param_value=sort_by,
+            reason=f"허용된 정렬 필드: {', '.join(allowed_fields)}",
+        )
+    return getattr(model, sort_by)
+
+
+async def paginate_by_cursor(
+    db: AsyncSession,
+    query: Any,
+    model: Any,
+    params: CursorParams,
+    allowed_sort_fields: Sequence[str] = ("id",),
+    shard_map: Optional[Any] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    커서 기반으로 한 페이지를 조회합니다.
+
+    page_size + 1개를 조회하여 다음 페이지 존재 여부를 판단하므로
+    별도의 COUNT 쿼리가 필요하지 않습니다.
+    shard_map이 주어지면 모든 샤드에서 같은 키셋 조건으로 조회하여 정렬 순서대로 병합합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        query: 필터가 적용된 select 쿼리
+        model: 조회 대상 모델 (id 컬럼 필요)
+        params: 커서 페이지네이션 파라미터
+        allowed_sort_fields: 정렬 가능한 필드 목록
+        shard_map: 모든 샤드에서 조회할 때의 ShardMap
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: 조회된 항목과 다음 페이지 커서
+    """
+    sort_column = resolve_sort_column(model, params.sort_by, allowed_sort_fields)
+    after = (
+        decode_cursor(params.cursor, params.sort_by, params.descending)
+        if params.cursor
+        else None
+    )
+
+    query = apply_keyset_pagination(
+        query,
+        sort_column,
+        model.id,
+        limit=params.page_size + 1,
+        after=after,
+        descending=params.descending,
+    )
+    if shard_map is not None:
+        gathered = await shard_map.gather(
+            query,
+            key=lambda row: (getattr(row[0], params.sort_by), row[0].id),
+            descending=params.descending,
+        )
+        rows = [row[0] for row in gathered]
+    else:
+        result = await db.execute(query)
+        # 컬렉션 joinedload가 포함된 쿼리도 처리할 수 있도록 unique() 적용
+        rows = list(result.unique().scalars().all())
+
+    next_cursor = None
+    if len(rows) > params.page_size:
+        rows = rows[: params.page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            [getattr(last, params.sort_by), last.id], params.sort_by, params.descending
+        )
+
+    return rows, next_cursor
@@ -0,0 +1,84 @@
+"""
+# File: fastapi_template/app/common/utils/statements.py
+# Description: 자주 실행되는 쿼리 문장 레지스트리
+# - 바인드 파라미터(bindparam)로 미리 생성한 문장을 재사용
+# - 호출마다 select(...).where(...)를 새로 만들고 캐시 키를 다시 계산하는 비용 제거
+"""
+
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Executable
+
+StatementBuilder = Callable[[], Executable]
+
+
+class HotQueryRegistry:
+    """
+    자주 실행되는 쿼리를 한 번만 생성해 재사용하는 레지스트리
+
+    등록된 생성 함수는 최초 사용 시 한 번만 호출됩니다. 같은 문장 객체를 재사용하면
+    SQLAlchemy가 캐시 키를 문장에 저장해 두므로, 실행 시 컴파일 캐시에서 바로 조회됩니다.
+    값은 문장에 넣지 않고 bindparam으로 선언한 뒤 실행 시 전달합니다.
+    """
+
+    def __init__(self):
+        self._builders: Dict[str, StatementBuilder] = {}
+        self._statements: Dict[str, Executable] = {}
+
+    def register(self, name: str) -> Callable[[StatementBuilder], StatementBuilder]:
+        """
+        문장 생성 함수를 등록하는 데코레이터
+
+        Example:
+            @hot_queries.register("user.get_by_id")
+            def _user_by_id():
+                return select(User).where(User.id == bindparam("user_id"))
+
+        Args:
+            name: 쿼리 이름 (같은 이름으로 다시 등록하면 교체)
+        """
+
+        def decorator(builder: StatementBuilder) -> StatementBuilder:
+            self._builders[name] = builder
+            self._statements.pop(name, None)
+            return builder
+
+        return decorator
+
+    def get(self, name: str) -> Executable:
+        """
+        등록된 문장을 반환합니다. (최초 호출 시 생성)
+
+        Raises:
+            KeyError: 등록되지 않은 쿼리 이름인 경우
+        """
+        statement = self._statements.get(name)
+        if statement is None:
+            if name not in self._builders:
+                raise KeyError(f"등록되지 않은 쿼리: {name}")
+            statement = self._statements[name] = self._builders[name]()
+        return statement
+
+    async def execute(self, db: AsyncSession, name: str, **params: Any) -> Result:
+        """
+        등록된 문장을 바인드 파라미터와 함께 실행합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            name: 쿼리 이름
+            **params: 바인드 파라미터 값
+
+        Returns:
+            Result: 실행 결과
+        """
+        return await db.execute(self.get(name), params)
+
+    def names(self) -> List[str]:
+        """등록된 쿼리 이름 목록"""
+        return sorted(self._builders)
+
+
+# 애플리케이션 전역 레지스트리
+hot_queries = HotQueryRegistry()
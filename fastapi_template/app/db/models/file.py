@@ -13,12 +13,17 @@ class File(BaseModel):
     """
     파일 모델
     """
+    # 샤딩 사용 시 소유자 ID로 샤드 DB 선택 (DATABASE_SHARD_URLS, 소유자가 없으면 첫 샤드)
+    __shard_key__ = "user_id"
+    
     name: Mapped[str] = mapped_column(index=True)
     path: Mapped[str] = mapped_column(index=True)
     type: Mapped[str] = mapped_column(index=True)
     mime_type: Mapped[str]
     size: Mapped[int] = mapped_column(nullable=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), nullable=True, index=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), nullable=True, index=True
+    )
     
     # 관계 설정
     owner = relationship("User", back_populates="files")
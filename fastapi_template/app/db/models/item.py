@@ -6,20 +6,37 @@
 # - 모델 메서드
 """
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fastapi_template.app.common.database.database_base import BaseModel
+from fastapi_template.app.common.database.database_fulltext import FullTextIndex
 
 class Item(BaseModel):
     """아이템 모델"""
     
+    # 샤딩 사용 시 소유자 ID로 샤드 DB 선택 (DATABASE_SHARD_URLS)
+    __shard_key__ = "owner_id"
+
+    __table_args__ = (
+        # 사용자별 아이템 목록/개수 조회 (owner_id 필터 + id 정렬, 키셋 페이지네이션)
+        Index("ix_item_owner_id_id", "owner_id", "id"),
+        # 사용자별 생성일 정렬 커서 페이지네이션
+        Index("ix_item_owner_id_created_at_id", "owner_id", "created_at", "id"),
+    )
+    
     title: Mapped[str] = mapped_column(index=True, nullable=False)
     description: Mapped[str | None] = mapped_column(default=None)
-    owner_id: Mapped[int] = mapped_column(ForeignKey("user.id"), nullable=False)
+    owner_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     
     # 관계 설정
     owner = relationship("User", back_populates="items")
 
     def __repr__(self) -> str:
         return f"Item(id={self.id}, title={self.title}, owner_id={self.owner_id})"
+
+
+# 제목/설명 전문 검색 인덱스 (SQLite FTS5 / PostgreSQL tsvector, 트리거로 동기화)
+# create_all 시 함께 생성되며, 기존 DB에는 마이그레이션으로 생성
+item_search_index = FullTextIndex(Item.__table__, ("title", "description"), weights=(4.0, 1.0))
+item_search_index.attach()
@@ -4,7 +4,7 @@
 """
 
 from datetime import datetime
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fastapi_template.app.common.database.database_base import BaseModel
@@ -14,10 +14,15 @@ class Token(BaseModel):
     """
     인증 토큰 모델
     """
+    __table_args__ = (
+        # 사용자별·타입별 토큰 조회/폐기 (user_id 단독 조회도 이 인덱스 사용)
+        Index("ix_token_user_id_type_expires_at", "user_id", "type", "expires_at"),
+    )
+
     token: Mapped[str] = mapped_column(unique=True, index=True)
-    type: Mapped[str] = mapped_column(index=True)  # access, refresh 등
+    type: Mapped[str]  # access, refresh 등
     expires_at: Mapped[datetime] = mapped_column(index=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"))
     
     # 관계 설정
     owner = relationship("User", back_populates="tokens")
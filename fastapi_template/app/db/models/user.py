@@ -13,16 +13,28 @@ class User(BaseModel):
     """
     email: Mapped[str] = mapped_column(unique=True, index=True)
     username: Mapped[str] = mapped_column(index=True)
-    hashed_password: Mapped[str] = mapped_column(nullable=False)
+    # 인증/비밀번호 변경에서만 필요하므로 기본 조회에서 제외 (필요 시 undefer, 실수로 접근하면 예외)
+    hashed_password: Mapped[str] = mapped_column(
+        nullable=False, deferred=True, deferred_raiseload=True
+    )
     is_active: Mapped[bool] = mapped_column(default=True)
     is_admin: Mapped[bool] = mapped_column(default=False)
+    # 소유 아이템 수 (페이지네이션 counter 전략에서 사용, 그 전략일 때만 ItemService가 아이템 생성/삭제 시 갱신)
+    item_count: Mapped[int] = mapped_column(default=0, server_default="0")
     
     # 관계 설정 - 사용자가 삭제되면 연관된 아이템도 함께 삭제
-    items = relationship("Item", back_populates="owner", cascade="all, delete-orphan")
+    # passive_deletes: 자식 행을 로드하지 않고 DB의 ON DELETE CASCADE로 삭제
+    items = relationship(
+        "Item", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True
+    )
     # 파일 관계 설정
-    files = relationship("File", back_populates="owner", cascade="all, delete-orphan")
+    files = relationship(
+        "File", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True
+    )
     # 토큰 관계 설정
-    tokens = relationship("Token", back_populates="owner", cascade="all, delete-orphan")
+    tokens = relationship(
+        "Token", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self) -> str:
         return f"User(id={self.id}, email={self.email}, username={self.username})"
@@ -6,11 +6,12 @@
 # - 데이터 직렬화/역직렬화
 """
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pydantic import Field
 
 from app.common.schemas.base_schema import (
     CreateSchema,
+    OutputSchema,
     ReadSchema,
     UpdateSchema,
     InternalSchema,
@@ -53,3 +54,20 @@ class Item(ReadSchema, ItemBase, TimeStampMixin):
 
     id: int = Field(..., description="아이템 ID")
     owner_id: int = Field(..., description="소유자 ID")
+
+
+class ItemImportRowError(OutputSchema):
+    """가져오지 못한 행의 오류 (시스템 → 외부)"""
+
+    row: int = Field(..., description="헤더를 제외한 1부터 시작하는 레코드 번호")
+    errors: List[Dict[str, Any]] = Field(..., description="오류 목록 (loc, msg)")
+
+
+class ItemImportResult(OutputSchema):
+    """아이템 대량 가져오기 결과 (시스템 → 외부)"""
+
+    inserted: int = Field(..., description="저장된 행 수")
+    failed: int = Field(..., description="실패한 행 수")
+    errors: List[ItemImportRowError] = Field(..., description="행별 오류 (ITEM_IMPORT_MAX_ERRORS개까지)")
+    errors_truncated: bool = Field(..., description="보관 한도를 넘어 생략된 오류가 있는지 여부")
+    aborted: Optional[str] = Field(None, description="본문을 끝까지 읽지 못한 경우 중단 사유")
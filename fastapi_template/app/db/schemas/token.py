@@ -3,6 +3,7 @@
 # Description: JWT 토큰 관련 Pydantic 스키마 정의
 """
 
+from datetime import datetime
 from typing import Optional, List
 from pydantic import Field
 
@@ -22,3 +23,18 @@ class TokenPayload(InternalSchema):
     sub: Optional[int] = Field(None, description="토큰 주체(사용자 ID)")
     exp: Optional[int] = Field(None, description="토큰 만료 시간")
     scopes: List[str] = Field(default=[], description="토큰 접근 범위")
+
+
+class TokenCreate(InternalSchema):
+    """저장 토큰 생성 스키마 (시스템 내부용)"""
+
+    token: str = Field(..., description="토큰 값")
+    type: str = Field(..., description="토큰 타입 (access, refresh 등)")
+    expires_at: datetime = Field(..., description="만료 시간")
+    user_id: int = Field(..., description="소유자 ID")
+
+
+class TokenUpdate(InternalSchema):
+    """저장 토큰 수정 스키마 (시스템 내부용)"""
+
+    expires_at: Optional[datetime] = Field(None, description="만료 시간")
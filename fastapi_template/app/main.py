@@ -10,9 +10,22 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import api_router
-from app.common.database import Base, engine
+from app.common.database import Base, IndexAdvisor, async_engine, engine
+from app.common.database.database_session import (
+    AsyncSessionLocal,
+    replica_async_engines,
+    replica_router,
+    shard_async_engines,
+    shard_map,
+)
+from app.common.database.database_query_stats import QueryStatsMiddleware, install_query_stats
+from app.common.database.database_routing import ReplicaStickinessMiddleware
+from app.common.database.database_slow_query import QueryContextMiddleware, slow_query_log
+from app.common.tasks import TokenCleanupTask
 from app.common.exceptions import add_exception_handlers
+from app.common.middleware import RequestLoggingMiddleware
 from app.common.cache.redis_client import get_redis_connection
+from app.services.item_service import ItemService
 from fastapi_template.app.common.config import config_settings
 
 # 로거 설정
@@ -39,11 +52,60 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Redis 연결 실패: {e}")
 
+    # 샤드 DB 스키마와 ID 할당 테이블 생성 (이미 있는 테이블은 건너뜀)
+    if shard_map is not None:
+        await shard_map.create_all(Base)
+
+    # 개발용 인덱스 추천 도구 (실행된 쿼리 기록)
+    index_advisor = None
+    if config_settings.DB_INDEX_ADVISOR:
+        index_advisor = IndexAdvisor(async_engine)
+        index_advisor.start()
+
+    # 느린 쿼리 기록 (주 엔진, 복제본 엔진과 샤드 엔진)
+    if config_settings.DB_SLOW_QUERY_LOG:
+        slow_query_log.configure(
+            threshold_ms=config_settings.DB_SLOW_QUERY_THRESHOLD_MS,
+            explain=config_settings.DB_SLOW_QUERY_EXPLAIN,
+            redact_parameters=config_settings.DB_SLOW_QUERY_REDACT_PARAMS,
+            history=config_settings.DB_SLOW_QUERY_HISTORY,
+        )
+        slow_query_log.attach(async_engine, *replica_async_engines, *shard_async_engines)
+
+    # 만료 토큰 정리 작업
+    token_cleanup = None
+    if config_settings.TOKEN_CLEANUP_ENABLED:
+        token_cleanup = TokenCleanupTask(
+            AsyncSessionLocal,
+            interval=config_settings.TOKEN_CLEANUP_INTERVAL,
+            batch_size=config_settings.TOKEN_CLEANUP_BATCH_SIZE,
+            pause=config_settings.TOKEN_CLEANUP_BATCH_PAUSE,
+            partitioned=config_settings.TOKEN_CLEANUP_PARTITIONED,
+        )
+        token_cleanup.start()
+
     yield
 
     # 애플리케이션 종료 시 수행할 작업
     logger.info("애플리케이션 종료 중...")
 
+    # 대기 중인 그룹 커밋 요청 기록
+    if config_settings.ITEM_GROUP_COMMIT_ENABLED:
+        await ItemService.get_group_writer().stop()
+
+    if token_cleanup is not None:
+        await token_cleanup.stop()
+
+    slow_query_log.detach()
+
+    if index_advisor is not None:
+        index_advisor.stop()
+        for suggestion in await index_advisor.suggest():
+            logger.warning(
+                f"인덱스 추천: {suggestion.ddl} "
+                f"({suggestion.reason}, {suggestion.calls}회) - {suggestion.statement}"
+            )
+
 
 # 애플리케이션 생성
 app = FastAPI(
@@ -68,6 +130,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 쓰기 직후의 복제본 읽기 고정을 쓰기를 한 클라이언트(인증 정보)로 한정
+if replica_router is not None:
+    app.add_middleware(ReplicaStickinessMiddleware)
+
+# 느린 쿼리를 요청 라우트와 연결
+if config_settings.DB_SLOW_QUERY_LOG:
+    app.add_middleware(QueryContextMiddleware)
+
+# 요청 로그 (쿼리 통계가 있으면 같은 줄에 기록되도록 QueryStatsMiddleware 안쪽에 등록)
+app.middleware("http")(RequestLoggingMiddleware())
+
+# 요청별 쿼리 수, DB 시간, 로드된 객체 수를 요청 로그와 Server-Timing 헤더로 노출
+if config_settings.DB_QUERY_STATS:
+    install_query_stats()
+    app.add_middleware(QueryStatsMiddleware, header=config_settings.DB_QUERY_STATS_HEADER)
+
 # API 라우터 등록
 app.include_router(api_router, prefix=config_settings.API_V1_STR)
 
@@ -6,66 +6,437 @@
 # - 아이템 필터링 및 정렬
 """
 
+from collections import Counter
+from functools import lru_cache
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete
+from sqlalchemy import and_, bindparam, update, delete
+
+from app.common.exceptions import NotFoundError, PermissionDeniedError
+from app.common.utils.count_strategy import (
+    CachedCountStrategy,
+    CounterCountStrategy,
+    CountResult,
+    CountStrategy,
+    build_count_strategy,
+)
+from app.common.utils.orm_utils import load_fields, schema_fields
+from app.common.utils.pagination import (
+    CursorParams,
+    PaginationParams,
+    apply_keyset_pagination,
+    decode_cursor,
+    encode_cursor,
+    paginate_by_cursor,
+)
+from app.common.utils.statements import hot_queries
+from app.db.models.item import Item, item_search_index
+from app.db.models.user import User
+from fastapi_template.app.common.config import config_settings
+from fastapi_template.app.common.database.database_fulltext import search_terms
+from fastapi_template.app.common.database.database_group_commit import GroupCommitWriter
+from fastapi_template.app.common.database.database_sharding import shard_map_of
+from fastapi_template.app.common.database.database_session import AsyncSessionLocal
+from fastapi_template.app.common.database.database_unit_of_work import (
+    commit,
+    current_unit_of_work,
+    rollback,
+)
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+from fastapi_template.app.common.utils.bulk_import import BulkImportReport, ParsedRecord, bulk_import
+from app.db.schemas.item import Item as ItemSchema, ItemCreate, ItemUpdate
+
+
+@hot_queries.register("item.get_by_id")
+def _item_by_id():
+    return select(Item).where(Item.id == bindparam("item_id"))
+
+
+def _item_id(row: Any) -> int:
+    """샤드별 조회 결과 병합 키 (id 순)"""
+    return row[0].id
 
-from app.common.exceptions import NotFoundError
-from app.db.models.item import Item
-from app.db.schemas.item import ItemCreate, ItemUpdate
 
 class ItemService:
+    # 커서 페이지네이션에서 허용하는 정렬 필드
+    SORT_FIELDS = ("id", "created_at", "title")
+    # 내보내기 시 조회할 컬럼 (응답 스키마 필드만)
+    EXPORT_FIELDS = tuple(schema_fields(Item, ItemSchema))
+
+    @staticmethod
+    def _select_items(fields: Optional[Sequence[str]] = None):
+        """아이템 조회 쿼리 (fields가 주어지면 해당 컬럼만 로드)"""
+        query = select(Item)
+        if fields:
+            query = query.options(load_fields(Item, fields))
+        return query
+
     @staticmethod
-    async def get_item(db: AsyncSession, item_id: int):
+    async def get_item(db: AsyncSession, item_id: int, fields: Optional[Sequence[str]] = None):
         """ID로 아이템 조회"""
-        result = await db.execute(select(Item).filter(Item.id == item_id))
+        if not fields:
+            result = await hot_queries.execute(db, "item.get_by_id", item_id=item_id)
+            return result.scalars().first()
+        result = await db.execute(ItemService._select_items(fields).filter(Item.id == item_id))
         return result.scalars().first()
 
     @staticmethod
-    async def get_items(db: AsyncSession, skip: int = 0, limit: int = 100):
-        """아이템 목록 조회"""
-        result = await db.execute(select(Item).offset(skip).limit(limit))
+    async def get_items(
+        db: AsyncSession, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None
+    ):
+        """아이템 목록 조회 (샤딩 사용 시 모든 샤드에서 조회하여 id 순으로 병합)"""
+        query = ItemService._select_items(fields).order_by(Item.id)
+        shard_map = shard_map_of(db)
+        if shard_map is not None:
+            rows = await shard_map.gather(query, key=_item_id, offset=skip, limit=limit)
+            return [row[0] for row in rows]
+        result = await db.execute(query.offset(skip).limit(limit))
         return result.scalars().all()
         
     @staticmethod
-    async def get_user_items(db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100):
+    async def get_user_items(
+        db: AsyncSession,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+    ):
         """특정 사용자의 아이템 목록 조회"""
         result = await db.execute(
-            select(Item).filter(Item.owner_id == user_id).offset(skip).limit(limit)
+            ItemService._select_items(fields)
+            .filter(Item.owner_id == user_id)
+            .order_by(Item.id)
+            .offset(skip)
+            .limit(limit)
         )
         return result.scalars().all()
 
+    @staticmethod
+    @lru_cache()
+    def get_count_strategy() -> CountStrategy:
+        """설정(PAGINATION_COUNT_STRATEGY)에 따른 아이템 총 개수 계산 전략"""
+        return build_count_strategy(
+            config_settings.PAGINATION_COUNT_STRATEGY,
+            cache_ttl=config_settings.PAGINATION_COUNT_CACHE_TTL,
+            estimate_threshold=config_settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD,
+            counter_column=User.item_count,
+            key_column=User.id,
+        )
+
+    @staticmethod
+    def maintains_item_count() -> bool:
+        """
+        소유자 아이템 수 카운터(User.item_count)를 유지하는지 여부
+
+        카운터는 counter 전략에서만 읽으므로, 다른 전략에서는 아이템 쓰기마다 사용자 행을
+        갱신(잠금)하지 않습니다. counter 전략으로 바꿀 때는 카운터를 다시 계산해야 합니다.
+        """
+        return config_settings.PAGINATION_COUNT_STRATEGY == CounterCountStrategy.name
+
+    @staticmethod
+    async def _item_count_changed(db: AsyncSession):
+        """
+        아이템이 추가/삭제된 뒤 cached 전략이 캐시한 총 개수 무효화
+        (단위 작업 안이면 트랜잭션이 끝난 뒤)
+        """
+        strategy = ItemService.get_count_strategy()
+        if not isinstance(strategy, CachedCountStrategy):
+            return
+        uow = current_unit_of_work(db)
+        if uow is not None:
+            uow.after_transaction(strategy.invalidate)
+            return
+        await strategy.invalidate()
+
+    @staticmethod
+    async def get_items_page(
+        db: AsyncSession,
+        params: PaginationParams,
+        owner_id: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ):
+        """오프셋 기반 아이템 목록과 총 개수 조회 (owner_id가 주어지면 해당 사용자의 아이템만)"""
+        query = ItemService._select_items(fields).order_by(Item.id)
+        if owner_id is not None:
+            query = query.filter(Item.owner_id == owner_id)
+        shard_map = shard_map_of(db)
+        if shard_map is not None and owner_id is None:
+            # 모든 샤드에서 조회하여 병합하고, 총 개수는 샤드별 개수의 합
+            rows = await shard_map.gather(
+                query, key=_item_id, offset=params.skip, limit=params.page_size
+            )
+            return [row[0] for row in rows], CountResult(total=await shard_map.count(query))
+        return await ItemService.get_count_strategy().paginate(
+            db, query, params, owner_id=owner_id
+        )
+
+    @staticmethod
+    async def get_items_by_cursor(
+        db: AsyncSession,
+        params: CursorParams,
+        owner_id: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ):
+        """커서 기반 아이템 목록 조회 (owner_id가 주어지면 해당 사용자의 아이템만)"""
+        query = ItemService._select_items(fields)
+        shard_map = None
+        if owner_id is not None:
+            query = query.filter(Item.owner_id == owner_id)
+        else:
+            shard_map = shard_map_of(db)
+        return await paginate_by_cursor(
+            db, query, Item, params, ItemService.SORT_FIELDS, shard_map=shard_map
+        )
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        text: str,
+        params: CursorParams,
+        owner_id: Optional[int] = None,
+        prefix: bool = True,
+    ) -> Tuple[List[Item], Optional[str]]:
+        """
+        제목/설명 전문 검색 (관련도 순, 커서 기반 페이지네이션)
+        - SQLite FTS5(bm25) 또는 PostgreSQL tsvector + GIN(ts_rank_cd) 인덱스 사용
+        - 모든 단어를 포함하는 아이템만 조회하며, prefix면 마지막 단어는 접두어로 검색
+        - 커서는 (순위, id) 키셋이며 같은 검색어/prefix에서만 유효
+        """
+        query, score = item_search_index.apply(
+            select(Item), db.get_bind().dialect.name, text, prefix=prefix
+        )
+        if query is None:
+            return [], None
+        if owner_id is not None:
+            query = query.filter(Item.owner_id == owner_id)
+
+        # 다른 검색어의 커서를 사용하지 않도록 검색 조건을 정렬 키에 포함
+        sort_key = f"{params.sort_by}:{' '.join(search_terms(text))}:{int(prefix)}"
+        after = decode_cursor(params.cursor, sort_key, False) if params.cursor else None
+        query = apply_keyset_pagination(
+            query.add_columns(score), score, Item.id, limit=params.page_size + 1, after=after
+        )
+        shard_map = shard_map_of(db) if owner_id is None else None
+        if shard_map is not None:
+            # 샤드별 상위 결과를 순위 순으로 병합 (순위는 샤드별 통계로 계산됨)
+            rows = await shard_map.gather(
+                query, key=lambda row: (row[1], row[0].id), limit=params.page_size + 1
+            )
+        else:
+            rows = (await db.execute(query)).all()
+
+        next_cursor = None
+        if len(rows) > params.page_size:
+            rows = rows[: params.page_size]
+            last_item, last_score = rows[-1]
+            next_cursor = encode_cursor([last_score, last_item.id], sort_key, False)
+        return [item for item, _ in rows], next_cursor
+
+    @staticmethod
+    @lru_cache()
+    def get_group_writer() -> GroupCommitWriter:
+        """아이템 생성 그룹 커밋 작성기 (ITEM_GROUP_COMMIT_ENABLED일 때 create_item에서 사용)"""
+        return GroupCommitWriter(
+            AsyncSessionLocal,
+            Item,
+            max_batch_size=config_settings.ITEM_GROUP_COMMIT_MAX_BATCH,
+            max_delay=config_settings.ITEM_GROUP_COMMIT_MAX_DELAY_MS / 1000,
+            after_insert=ItemService._increment_item_counts,
+        )
+
+    @staticmethod
+    async def _increment_item_counts(db: AsyncSession, items: Sequence[Item]):
+        """그룹 커밋된 아이템의 소유자별 아이템 수 카운터 갱신 (같은 트랜잭션)"""
+        if not ItemService.maintains_item_count():
+            return
+        counts = Counter(item.owner_id for item in items)
+        users = User.__table__
+        await db.execute(
+            update(users)
+            .where(users.c.id == bindparam("owner_id"))
+            .values(item_count=users.c.item_count + bindparam("count"), updated_at=users.c.updated_at),
+            [{"owner_id": owner_id, "count": count} for owner_id, count in counts.items()],
+        )
+
     @staticmethod
     async def create_item(db: AsyncSession, item: ItemCreate, owner_id: int):
-        """새 아이템 생성"""
+        """
+        새 아이템 생성
+        - ITEM_GROUP_COMMIT_ENABLED이고 단위 작업 밖이면 동시 요청과 모아 한 트랜잭션으로 커밋
+        """
+        if config_settings.ITEM_GROUP_COMMIT_ENABLED and current_unit_of_work(db) is None:
+            db_item = await ItemService.get_group_writer().submit(
+                {**item.dict(), "owner_id": owner_id}
+            )
+            await ItemService._item_count_changed(db)
+            return db_item
+
         db_item = Item(**item.dict(), owner_id=owner_id)
         db.add(db_item)
-        await db.commit()
+        await ItemService._change_item_count(db, owner_id, 1)
+        await commit(db)
         await db.refresh(db_item)
+        await ItemService._item_count_changed(db)
         return db_item
 
     @staticmethod
-    async def update_item(db: AsyncSession, item_id: int, item: ItemUpdate):
-        """아이템 정보 업데이트"""
+    async def _change_item_count(db: AsyncSession, owner_id: int, delta: int):
+        """
+        소유자 아이템 수 카운터 갱신 (같은 트랜잭션, counter 전략일 때만)
+        - 사용자 정보가 바뀐 것은 아니므로 updated_at은 그대로 유지
+        """
+        if not ItemService.maintains_item_count():
+            return
+        await db.execute(
+            update(User)
+            .where(User.id == owner_id)
+            .values(item_count=User.item_count + delta, updated_at=User.updated_at)
+        )
+
+    @staticmethod
+    @lru_cache()
+    def get_bulk_repository() -> BaseRepository:
+        """아이템 대량 가져오기/내보내기용 리포지토리 (bulk_create, stream_multi)"""
+        return BaseRepository(Item)
+
+    @staticmethod
+    def stream_items(db: AsyncSession, owner_id: Optional[int] = None) -> AsyncIterator[Any]:
+        """
+        내보내기용 아이템 스트리밍 조회 (owner_id가 주어지면 해당 사용자의 아이템만)
+        - 서버 측 커서로 EXPORT_FIELDS 컬럼만 id 순으로 조회 (행 수와 관계없이 메모리 일정)
+        """
+        return ItemService.get_bulk_repository().stream_multi(
+            db, columns=ItemService.EXPORT_FIELDS, owner_id=owner_id
+        )
+
+    @staticmethod
+    async def import_items(
+        db: AsyncSession, records: AsyncIterable[ParsedRecord], owner_id: int
+    ) -> BulkImportReport:
+        """
+        파싱된 레코드를 ItemCreate로 검증하여 대량으로 가져오기
+        - ITEM_IMPORT_CHUNK_SIZE행마다 삽입, 소유자 아이템 수 카운터 갱신(counter 전략), 커밋
+        - 검증/저장에 실패한 행은 행 번호와 함께 결과에 포함
+        """
+
+        async def increment_item_count(session: AsyncSession, rows: List[Dict[str, Any]]):
+            await ItemService._change_item_count(session, owner_id, len(rows))
+
+        report = await bulk_import(
+            db,
+            records,
+            schema=ItemCreate,
+            repository=ItemService.get_bulk_repository(),
+            chunk_size=config_settings.ITEM_IMPORT_CHUNK_SIZE,
+            max_errors=config_settings.ITEM_IMPORT_MAX_ERRORS,
+            values={"owner_id": owner_id},
+            before_insert=increment_item_count if ItemService.maintains_item_count() else None,
+        )
+        await ItemService._item_count_changed(db)
+        return report
+
+    @staticmethod
+    def _write_condition(item_id: int, user_id: Optional[int] = None, is_admin: bool = False):
+        """수정/삭제 대상 조건 (user_id가 주어지고 관리자가 아니면 소유자 조건 추가)"""
+        condition = Item.id == item_id
+        if user_id is not None and not is_admin:
+            condition = and_(condition, Item.owner_id == user_id)
+        return condition
+
+    @staticmethod
+    async def _raise_write_error(db: AsyncSession, item_id: int):
+        """
+        수정/삭제된 행이 없을 때 원인을 구분하여 예외 발생
+        (드문 경로에서만 추가 조회)
+        """
+        exists = await db.scalar(select(Item.id).filter(Item.id == item_id))
+        if exists is None:
+            raise NotFoundError(f"Item with ID {item_id} not found")
+        raise PermissionDeniedError("Not enough permissions")
+
+    @staticmethod
+    async def update_item(
+        db: AsyncSession,
+        item_id: int,
+        item: ItemUpdate,
+        user_id: Optional[int] = None,
+        is_admin: bool = False,
+    ):
+        """아이템 정보 업데이트 (RETURNING 지원 시 한 번의 쿼리로 수정 및 조회)"""
         update_data = item.dict(exclude_unset=True)
+        condition = ItemService._write_condition(item_id, user_id, is_admin)
         
-        query = update(Item).where(Item.id == item_id).values(**update_data)
-        result = await db.execute(query)
-        await db.commit()
+        query = update(Item).where(condition).values(**update_data)
         
+        if db.get_bind().dialect.update_returning:
+            result = await db.execute(
+                query.returning(Item).execution_options(populate_existing=True)
+            )
+            db_item = result.scalars().first()
+            if db_item is None:
+                await rollback(db)
+                await ItemService._raise_write_error(db, item_id)
+            await commit(db)
+            return db_item
+        
+        result = await db.execute(query)
         if result.rowcount == 0:
-            raise NotFoundError(f"Item with ID {item_id} not found")
+            await rollback(db)
+            await ItemService._raise_write_error(db, item_id)
+        await commit(db)
         
         return await ItemService.get_item(db, item_id)
 
     @staticmethod
-    async def delete_item(db: AsyncSession, item_id: int):
-        """아이템 삭제"""
-        query = delete(Item).where(Item.id == item_id)
-        result = await db.execute(query)
-        await db.commit()
+    async def update_user_item(
+        db: AsyncSession, item_id: int, item: ItemUpdate, user_id: int, is_admin: bool = False
+    ):
+        """
+        사용자 권한으로 아이템 업데이트
+        - 소유자/관리자 조건을 UPDATE의 WHERE 절에 포함하여 한 번의 쿼리로 처리
+        - 수정된 행이 없을 때만 조회하여 NotFoundError/PermissionDeniedError 구분
+        """
+        return await ItemService.update_item(db, item_id, item, user_id=user_id, is_admin=is_admin)
+
+    @staticmethod
+    async def delete_item(
+        db: AsyncSession, item_id: int, user_id: Optional[int] = None, is_admin: bool = False
+    ):
+        """아이템 삭제 (RETURNING 지원 시 한 번의 쿼리로 삭제 및 소유자 조회)"""
+        condition = ItemService._write_condition(item_id, user_id, is_admin)
+        query = delete(Item).where(condition)
         
-        if result.rowcount == 0:
-            raise NotFoundError(f"Item with ID {item_id} not found")
+        if db.get_bind().dialect.delete_returning:
+            result = await db.execute(query.returning(Item.owner_id))
+            owner_id = result.scalar_one_or_none()
+            deleted = owner_id is not None
+        else:
+            # 소유자는 카운터를 갱신할 때만 먼저 조회
+            owner_id = None
+            if ItemService.maintains_item_count():
+                owner_id = await db.scalar(select(Item.owner_id).where(condition))
+            result = await db.execute(query)
+            deleted = result.rowcount > 0
         
-        return True 
\ No newline at end of file
+        if not deleted:
+            await rollback(db)
+            await ItemService._raise_write_error(db, item_id)
+        
+        await ItemService._change_item_count(db, owner_id, -1)
+        await commit(db)
+        await ItemService._item_count_changed(db)
+        
+        return True
+
+    @staticmethod
+    async def delete_user_item(
+        db: AsyncSession, item_id: int, user_id: int, is_admin: bool = False
+    ):
+        """
+        사용자 권한으로 아이템 삭제
+        - 소유자/관리자 조건을 DELETE의 WHERE 절에 포함하여 한 번의 쿼리로 처리
+        - 삭제된 행이 없을 때만 조회하여 NotFoundError/PermissionDeniedError 구분
+        """
+        return await ItemService.delete_item(db, item_id, user_id=user_id, is_admin=is_admin)
@@ -3,28 +3,106 @@
 # Description: 사용자 관련 비즈니스 로직 구현
 """
 
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete
+from sqlalchemy import bindparam, func, update, delete
+from sqlalchemy.orm import undefer
 
 from app.common.auth import get_password_hash, verify_password
+from app.common.exceptions import NotFoundError
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+from fastapi_template.app.common.repositories.repositories_loader import DataLoaders
+from app.common.utils.count_strategy import CounterCountStrategy, CountStrategy, build_count_strategy
+from app.common.utils.orm_utils import load_fields, schema_fields
+from app.common.utils.pagination import CursorParams, PaginationParams, paginate_by_cursor
+from app.common.utils.statements import hot_queries
+from app.db.models.file import File
+from app.db.models.item import Item
+from app.db.models.token import Token
 from app.db.models.user import User
-from app.db.schemas.user import UserCreate, UserUpdate
+from app.db.schemas.user import User as UserSchema, UserCreate, UserUpdate
+from fastapi_template.app.common.config import config_settings
+from fastapi_template.app.common.database.database_session import AsyncSessionLocal
+from fastapi_template.app.common.database.database_sharding import shard_map_of
+from fastapi_template.app.common.database.database_unit_of_work import commit, rollback
+
+
+@hot_queries.register("user.get_by_id")
+def _user_by_id():
+    return select(User).where(User.id == bindparam("user_id"))
+
+
+@hot_queries.register("user.get_by_email")
+def _user_by_email():
+    return select(User).where(User.email == bindparam("email"))
 
 
 class UserService:
+    # 커서 페이지네이션에서 허용하는 정렬 필드
+    SORT_FIELDS = ("id", "created_at", "email", "username")
+    # 목록 조회 시 로드할 컬럼 (응답 스키마 필드만)
+    LIST_FIELDS = tuple(schema_fields(User, UserSchema))
+
     @staticmethod
-    async def get_user(db: AsyncSession, user_id: int):
-        """사용자 ID로 사용자 조회"""
-        result = await db.execute(select(User).filter(User.id == user_id))
+    async def get_user(
+        db: AsyncSession, user_id: int, loaders: Optional[DataLoaders] = None
+    ):
+        """
+        사용자 ID로 사용자 조회
+        - loaders가 주어지면 같은 요청의 다른 조회와 묶어 IN 쿼리 한 번으로 처리
+        """
+        if loaders is not None:
+            return await loaders.get(User).load(user_id)
+        result = await hot_queries.execute(db, "user.get_by_id", user_id=user_id)
         return result.scalars().first()
 
     @staticmethod
     async def get_user_by_email(db: AsyncSession, email: str):
         """이메일로 사용자 조회"""
-        result = await db.execute(select(User).filter(User.email == email))
+        result = await hot_queries.execute(db, "user.get_by_email", email=email)
         return result.scalars().first()
 
+    @staticmethod
+    @lru_cache()
+    def get_count_strategy() -> CountStrategy:
+        """설정(PAGINATION_COUNT_STRATEGY)에 따른 사용자 총 개수 계산 전략"""
+        strategy = config_settings.PAGINATION_COUNT_STRATEGY
+        # 사용자 목록에는 유지되는 카운터가 없으므로 counter 전략은 추정치로 대체
+        return build_count_strategy(
+            "estimate" if strategy == CounterCountStrategy.name else strategy,
+            cache_ttl=config_settings.PAGINATION_COUNT_CACHE_TTL,
+            estimate_threshold=config_settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD,
+        )
+
+    @staticmethod
+    async def get_users_page(db: AsyncSession, params: PaginationParams):
+        """오프셋 기반 사용자 목록과 총 개수 조회"""
+        query = select(User).options(load_fields(User, UserService.LIST_FIELDS)).order_by(User.id)
+        return await UserService.get_count_strategy().paginate(db, query, params)
+
+    @staticmethod
+    async def get_users_by_cursor(db: AsyncSession, params: CursorParams):
+        """커서 기반 사용자 목록 조회"""
+        query = select(User).options(load_fields(User, UserService.LIST_FIELDS))
+        return await paginate_by_cursor(db, query, User, params, UserService.SORT_FIELDS)
+
+    @staticmethod
+    @lru_cache()
+    def get_bulk_repository() -> BaseRepository:
+        """사용자 내보내기용 리포지토리 (stream_multi)"""
+        return BaseRepository(User)
+
+    @staticmethod
+    def stream_users(db: AsyncSession) -> AsyncIterator[Any]:
+        """
+        내보내기용 사용자 스트리밍 조회
+        - 서버 측 커서로 LIST_FIELDS 컬럼만 id 순으로 조회 (hashed_password 등 제외)
+        """
+        return UserService.get_bulk_repository().stream_multi(db, columns=UserService.LIST_FIELDS)
+
     @staticmethod
     async def create_user(db: AsyncSession, user: UserCreate):
         """새 사용자 생성"""
@@ -36,14 +114,17 @@ class UserService:
             is_active=True,
         )
         db.add(db_user)
-        await db.commit()
+        await commit(db)
         await db.refresh(db_user)
         return db_user
 
     @staticmethod
     async def authenticate_user(db: AsyncSession, email: str, password: str):
-        """사용자 인증"""
-        user = await UserService.get_user_by_email(db, email)
+        """사용자 인증 (기본 조회에서 제외되는 hashed_password를 함께 로드)"""
+        result = await db.execute(
+            select(User).options(undefer(User.hashed_password)).filter(User.email == email)
+        )
+        user = result.scalars().first()
         if not user or not verify_password(password, user.hashed_password):
             return None
         return user
@@ -59,7 +140,110 @@ class UserService:
             )
 
         query = update(User).where(User.id == user_id).values(**update_data)
+
+        if db.get_bind().dialect.update_returning:
+            # 수정과 결과 조회를 한 번의 쿼리로 처리
+            result = await db.execute(
+                query.returning(User).execution_options(populate_existing=True)
+            )
+            db_user = result.scalars().first()
+            await commit(db)
+            return db_user
+
         await db.execute(query)
-        await db.commit()
+        await commit(db)
 
         return await UserService.get_user(db, user_id)
+
+    @staticmethod
+    async def delete_user(db: AsyncSession, user_id: int) -> bool:
+        """
+        사용자 삭제
+        - 아이템/파일/토큰은 로드하지 않고 DB의 ON DELETE CASCADE로 함께 삭제
+        - 샤딩 사용 시 샤드 DB의 아이템/파일은 CASCADE되지 않으므로 사용자의 샤드에서 직접 삭제
+        """
+        if shard_map_of(db) is not None:
+            for model, owner_column in ((Item, Item.owner_id), (File, File.user_id)):
+                await db.execute(
+                    delete(model)
+                    .where(owner_column == user_id)
+                    .execution_options(synchronize_session=False)
+                )
+        query = delete(User).where(User.id == user_id).execution_options(synchronize_session=False)
+        if db.get_bind().dialect.delete_returning:
+            result = await db.execute(query.returning(User.id))
+            deleted = result.scalar_one_or_none() is not None
+        else:
+            result = await db.execute(query)
+            deleted = result.rowcount > 0
+        if not deleted:
+            await rollback(db)
+            raise NotFoundError(f"User with ID {user_id} not found")
+
+        await commit(db)
+        return True
+
+    @staticmethod
+    async def should_delete_in_background(db: AsyncSession, user: User) -> bool:
+        """
+        아이템이 많아 한 트랜잭션으로 삭제하면 잠금이 길어지는 사용자인지 확인
+        - counter 전략이면 User.item_count, 아니면 기준 개수까지만 세어 확인
+        """
+        threshold = config_settings.USER_DELETE_BACKGROUND_THRESHOLD
+        if config_settings.PAGINATION_COUNT_STRATEGY == CounterCountStrategy.name:
+            return (user.item_count or 0) >= threshold
+        owned = select(Item.id).where(Item.owner_id == user.id).limit(threshold).subquery()
+        return await db.scalar(select(func.count()).select_from(owned)) >= threshold
+
+    @staticmethod
+    async def deactivate_user(db: AsyncSession, user_id: int) -> None:
+        """사용자 비활성화 - 삭제가 끝날 때까지 로그인과 쓰기를 막음"""
+        await db.execute(update(User).where(User.id == user_id).values(is_active=False))
+        await commit(db)
+
+    @staticmethod
+    async def delete_user_in_chunks(
+        db: AsyncSession, user_id: int, chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        대용량 계정 삭제
+        - 자식 행을 chunk_size개씩 짧은 트랜잭션으로 나누어 삭제한 뒤 사용자를 삭제
+        - 한 번의 CASCADE로 수십만 행을 삭제할 때의 긴 잠금과 WAL 급증을 방지
+
+        Returns:
+            int: 삭제된 자식 행 수
+        """
+        chunk_size = chunk_size or config_settings.USER_DELETE_CHUNK_SIZE
+        await UserService.deactivate_user(db, user_id)
+
+        deleted = 0
+        for model, owner_column in (
+            (Item, Item.owner_id),
+            (File, File.user_id),
+            (Token, Token.user_id),
+        ):
+            while True:
+                chunk = (
+                    select(model.id)
+                    .where(owner_column == user_id)
+                    .limit(chunk_size)
+                    .scalar_subquery()
+                )
+                result = await db.execute(
+                    delete(model)
+                    .where(model.id.in_(chunk))
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+                deleted += result.rowcount
+                if result.rowcount < chunk_size:
+                    break
+
+        await UserService.delete_user(db, user_id)
+        return deleted
+
+    @staticmethod
+    async def purge_user(user_id: int, chunk_size: Optional[int] = None) -> int:
+        """백그라운드 작업용 - 별도 세션을 열어 delete_user_in_chunks 실행"""
+        async with AsyncSessionLocal() as db:
+            return await UserService.delete_user_in_chunks(db, user_id, chunk_size)
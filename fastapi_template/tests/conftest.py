@@ -7,7 +7,9 @@ import os
 import sys
 from unittest import mock
 import uuid
+from contextlib import contextmanager
 from pathlib import Path
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -24,7 +26,17 @@ os.environ["DB_ECHO_LOG"] = "False"
 # Mock 설정
 sys.modules['fastapi_template.app.common.config.config_settings'] = mock.MagicMock(
     DATABASE_URL="sqlite+aiosqlite:///./test.db",
-    DB_ECHO_LOG=False
+    DB_ECHO_LOG=False,
+    DB_QUERY_CACHE_SIZE=1200,
+    DATABASE_REPLICA_URLS=[],
+    DATABASE_SHARD_URLS=[],
+    SQLITE_PERFORMANCE_MODE=True,
+    SQLITE_SYNCHRONOUS="NORMAL",
+    SQLITE_MMAP_SIZE=268435456,
+    SQLITE_CACHE_SIZE=-64000,
+    SQLITE_BUSY_TIMEOUT=5000,
+    SQLITE_POOL_SIZE=5,
+    SQLITE_SERIALIZE_WRITES=True
 )
 
 @pytest.fixture(scope="session")
@@ -63,3 +75,121 @@ async def test_session(test_db_engine):
     
     async with async_session() as session:
         yield session
+
+@pytest.fixture
+async def engine():
+    """공통 모델(tests.models) 테이블이 있는 인메모리 DB 엔진"""
+    from tests.models import RepoBase
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(RepoBase.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db(engine):
+    """engine fixture의 세션"""
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine):
+    """실행된 SQL 문 기록"""
+    executed = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def commits(engine):
+    """실행된 커밋 수 기록"""
+    count = []
+
+    @event.listens_for(engine.sync_engine, "commit")
+    def record(conn):
+        count.append(conn)
+
+    yield count
+    event.remove(engine.sync_engine, "commit", record)
+
+
+@pytest.fixture
+def query_budget():
+    """
+    쿼리 수 예산 검사 (N+1 감지)
+
+    블록 안에서 실행된 SQL 문 수가 예산을 넘으면 실행된 SQL과 함께 테스트를 실패시킵니다.
+
+        with query_budget(engine, 2) as executed:
+            await repository.get_multi(db, load={"items": "selectin"})
+    """
+    @contextmanager
+    def budget(engine, max_queries):
+        sync_engine = getattr(engine, "sync_engine", engine)
+        executed = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+
+        event.listen(sync_engine, "before_cursor_execute", record)
+        try:
+            yield executed
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", record)
+
+        if len(executed) > max_queries:
+            pytest.fail(
+                f"쿼리 예산 초과: {len(executed)}개 실행 (최대 {max_queries}개)\n"
+                + "\n".join(executed)
+            )
+
+    return budget
+
+
+@pytest.fixture(autouse=True)
+def endpoint_query_budget(request):
+    """
+    엔드포인트 쿼리 예산 검사
+
+    @pytest.mark.endpoint_query_budget(N)이 붙은 테스트에서 QueryStatsMiddleware가 처리한 요청 중
+    SQL 문을 N개보다 많이 실행한 요청이 있으면 라우트별 통계와 함께 테스트를 실패시킵니다.
+    처리된 요청이 없으면(앱에 QueryStatsMiddleware가 없는 경우 등) 검사하지 못했으므로 실패시킵니다.
+
+        @pytest.mark.endpoint_query_budget(3)
+        async def test_read_items(client):
+            await client.get("/api/v1/items/")
+    """
+    marker = request.node.get_closest_marker("endpoint_query_budget")
+    if marker is None:
+        yield None
+        return
+
+    from fastapi_template.app.common.database.database_query_stats import (
+        install_query_stats,
+        observe_requests,
+    )
+
+    max_queries = marker.args[0] if marker.args else marker.kwargs["max_queries"]
+    install_query_stats()
+    with observe_requests() as served:
+        yield served
+
+    if not served:
+        pytest.fail(
+            "엔드포인트 쿼리 예산을 검사할 요청이 없습니다 "
+            "(QueryStatsMiddleware를 거친 요청이 있어야 함)"
+        )
+    over_budget = [r for r in served if r.stats.statements > max_queries]
+    if over_budget:
+        pytest.fail(
+            f"엔드포인트 쿼리 예산 초과 (최대 {max_queries}개)\n"
+            + "\n".join(f"{r.route} ({r.status}): {r.stats}" for r in over_budget)
+        )
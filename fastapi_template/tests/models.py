@@ -0,0 +1,34 @@
+"""
+테스트 공통 모델
+
+리포지토리/데이터베이스 유틸리티 테스트에서 함께 사용하는 모델입니다.
+테이블은 conftest의 engine fixture가 생성합니다.
+"""
+
+from datetime import datetime, UTC
+
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.orm import DeclarativeBase
+
+
+class RepoBase(DeclarativeBase):
+    pass
+
+
+class Widget(RepoBase):
+    __tablename__ = "widget"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    owner_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
+
+
+class Gadget(RepoBase):
+    __tablename__ = "gadget"
+
+    id = Column(Integer, primary_key=True)
+    sku = Column(String, unique=True, nullable=False)
+    name = Column(String, nullable=False)
+    stock = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=None, onupdate=lambda: datetime(2030, 1, 1))
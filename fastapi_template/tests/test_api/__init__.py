@@ -0,0 +1 @@
+"""API 라우트 테스트 패키지"""
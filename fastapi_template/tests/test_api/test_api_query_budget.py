@@ -0,0 +1,178 @@
+"""
+API 엔드포인트 쿼리 예산 테스트
+
+인증 의존성(get_current_user)은 테스트 사용자로 대체하므로 예산에 토큰 조회는 포함되지 않습니다.
+"""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.api.routes import items_router, users_router
+from app.common.database import get_db, get_transactional_db
+from app.common.dependencies.auth import get_current_user
+from app.common.exceptions import add_exception_handlers
+from app.db.models.item import Item
+from app.db.models.user import User
+from app.services import item_service, user_service
+from app.services.item_service import ItemService
+from app.services.user_service import UserService
+from fastapi_template.app.common.database.database_query_stats import (
+    QueryStatsMiddleware,
+    install_query_stats,
+)
+from fastapi_template.app.common.database.database_unit_of_work import UnitOfWork
+
+ADMIN_ID = 1
+OWNER_ID = 2
+
+
+@pytest.fixture(autouse=True)
+def settings(monkeypatch):
+    """기본 설정 (exact 개수 계산 전략, 그룹 커밋 미사용)"""
+    for settings in (item_service.config_settings, user_service.config_settings):
+        monkeypatch.setattr(settings, "PAGINATION_COUNT_STRATEGY", "exact")
+        monkeypatch.setattr(settings, "PAGINATION_COUNT_CACHE_TTL", 60)
+        monkeypatch.setattr(settings, "ITEM_GROUP_COMMIT_ENABLED", False)
+        monkeypatch.setattr(settings, "USER_DELETE_BACKGROUND_THRESHOLD", 10000)
+    ItemService.get_count_strategy.cache_clear()
+    UserService.get_count_strategy.cache_clear()
+    yield
+    ItemService.get_count_strategy.cache_clear()
+    UserService.get_count_strategy.cache_clear()
+
+
+@pytest.fixture
+async def engine():
+    """관리자, 사용자와 사용자의 아이템 5개가 있는 인메모리 엔진"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Item.metadata.create_all)
+    async with AsyncSession(engine) as db:
+        db.add_all([
+            User(id=ADMIN_ID, email="admin@example.com", username="admin", hashed_password="x", is_admin=True),
+            User(id=OWNER_ID, email="owner@example.com", username="owner", hashed_password="x"),
+            *(Item(id=i, title=f"item-{i}", owner_id=OWNER_ID) for i in range(1, 6)),
+        ])
+        await db.commit()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def login(engine):
+    """요청을 보낼 사용자 선택 (login(ADMIN_ID))"""
+    current = {}
+
+    async def as_user(user_id: int):
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            current["user"] = await db.get(User, user_id)
+
+    as_user.current = current
+    return as_user
+
+
+@pytest.fixture
+async def client(engine, login):
+    """아이템/사용자 라우터를 QueryStatsMiddleware와 함께 등록한 앱의 클라이언트"""
+    install_query_stats()
+    app = FastAPI()
+    add_exception_handlers(app)
+    app.add_middleware(QueryStatsMiddleware)
+    app.include_router(users_router, prefix="/api/v1/users")
+    app.include_router(items_router, prefix="/api/v1/items")
+
+    async def test_db():
+        async with AsyncSession(engine) as session:
+            yield session
+
+    async def test_transactional_db():
+        async with AsyncSession(engine) as session:
+            async with UnitOfWork(session):
+                yield session
+
+    app.dependency_overrides[get_db] = test_db
+    app.dependency_overrides[get_transactional_db] = test_transactional_db
+    app.dependency_overrides[get_current_user] = lambda: login.current["user"]
+
+    await login(OWNER_ID)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test/api/v1") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+@pytest.mark.endpoint_query_budget(2)
+async def test_list_items(client):
+    """아이템 목록: 페이지 조회와 총 개수"""
+    response = await client.get("/items/", params={"page": 1, "page_size": 3})
+    assert response.status_code == 200
+    assert response.json()["page_info"]["total_items"] == 5
+
+    response = await client.get("/items/", params={"paging": "cursor", "page_size": 3})
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.endpoint_query_budget(1)
+async def test_read_item(client):
+    """아이템 조회: 기본 키 조회 한 번"""
+    response = await client.get("/items/1")
+    assert response.status_code == 200
+    assert response.json()["title"] == "item-1"
+
+
+@pytest.mark.asyncio
+@pytest.mark.endpoint_query_budget(2)
+async def test_write_items(client):
+    """아이템 생성/수정/삭제: 생성은 INSERT와 재조회, 수정/삭제는 RETURNING 한 문장"""
+    response = await client.post("/items/", json={"title": "new"})
+    assert response.status_code == 201
+    item_id = response.json()["id"]
+
+    response = await client.put(f"/items/{item_id}", json={"description": "updated"})
+    assert response.status_code == 200
+    assert response.json()["description"] == "updated"
+
+    response = await client.delete(f"/items/{item_id}")
+    assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+@pytest.mark.endpoint_query_budget(2)
+async def test_list_users(client, login):
+    """사용자 목록 (관리자): 페이지 조회와 총 개수"""
+    await login(ADMIN_ID)
+    response = await client.get("/users/", params={"page": 1, "page_size": 10})
+    assert response.status_code == 200
+    assert response.json()["page_info"]["total_items"] == 2
+
+    response = await client.get("/users/", params={"paging": "cursor", "page_size": 1})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.endpoint_query_budget(1)
+async def test_read_user(client):
+    """사용자 조회: 기본 키 조회 한 번"""
+    response = await client.get(f"/users/{OWNER_ID}")
+    assert response.status_code == 200
+    assert response.json()["username"] == "owner"
+
+
+@pytest.mark.asyncio
+@pytest.mark.endpoint_query_budget(3)
+async def test_write_users(client, login):
+    """사용자 수정/삭제 (관리자)"""
+    await login(ADMIN_ID)
+    response = await client.put(f"/users/{OWNER_ID}", json={"username": "renamed"})
+    assert response.status_code == 200
+    assert response.json()["id"] == OWNER_ID
+
+    response = await client.patch("/users/me", json={"username": "root"})
+    assert response.status_code == 200
+
+    response = await client.delete(f"/users/{OWNER_ID}")
+    assert response.status_code == 204
@@ -8,7 +8,16 @@ from sqlalchemy import text, Column, Integer, String
 # mock 설정을 사용하도록 설정
 sys.modules['fastapi_template.app.common.config.config_settings'] = mock.MagicMock(
     DATABASE_URL="sqlite+aiosqlite:///./test.db",
-    DB_ECHO_LOG=False
+    DB_ECHO_LOG=False,
+    DB_QUERY_CACHE_SIZE=1200,
+    DATABASE_REPLICA_URLS=[],
+    SQLITE_PERFORMANCE_MODE=True,
+    SQLITE_SYNCHRONOUS="NORMAL",
+    SQLITE_MMAP_SIZE=268435456,
+    SQLITE_CACHE_SIZE=-64000,
+    SQLITE_BUSY_TIMEOUT=5000,
+    SQLITE_POOL_SIZE=5,
+    SQLITE_SERIALIZE_WRITES=True
 )
 
 # 상대 경로로 import
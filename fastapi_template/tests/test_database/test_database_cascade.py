@@ -0,0 +1,82 @@
+"""
+# File: tests/test_database/test_database_cascade.py
+# Description: 사용자 삭제 시 DB 측 ON DELETE CASCADE 테스트
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_template.app.common.database.database_session import create_database_engine
+from fastapi_template.app.db.models import File, Item, Token, User
+
+
+@pytest.fixture
+async def engine():
+    """앱의 엔진 설정(고성능 모드 아님)으로 만든 인메모리 DB (사용자 1: 아이템 3, 파일 1, 토큰 1)"""
+    engine = create_database_engine("sqlite+aiosqlite:///:memory:")
+
+    async with engine.begin() as conn:
+        assert (await conn.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+        await conn.run_sync(User.metadata.create_all)
+        await conn.execute(
+            insert(User),
+            [
+                {"id": user_id, "email": f"user{user_id}@example.com", "username": f"user{user_id}",
+                 "hashed_password": "x"}
+                for user_id in (1, 2)
+            ],
+        )
+        await conn.execute(
+            insert(Item),
+            [{"title": f"item-{i}", "owner_id": 1 if i < 3 else 2} for i in range(4)],
+        )
+        await conn.execute(
+            insert(File),
+            [{"name": "a.txt", "path": "/tmp/a.txt", "type": "document",
+              "mime_type": "text/plain", "user_id": 1}],
+        )
+        await conn.execute(
+            insert(Token),
+            [{"token": "refresh-1", "type": "refresh", "expires_at": datetime(2030, 1, 1),
+              "user_id": 1}],
+        )
+    yield engine
+    await engine.dispose()
+
+
+def test_user_foreign_keys_cascade_on_delete():
+    """user.id 외래 키가 ON DELETE CASCADE이고 관계가 passive_deletes인지 테스트"""
+    for column in (Item.owner_id, File.user_id, Token.user_id):
+        (foreign_key,) = column.property.columns[0].foreign_keys
+        assert foreign_key.ondelete == "CASCADE"
+
+    for relationship in (User.items, User.files, User.tokens):
+        assert relationship.property.passive_deletes is True
+
+
+@pytest.mark.asyncio
+async def test_session_delete_does_not_load_children(engine):
+    """session.delete(user)가 자식 행을 조회하지 않고 DB에서 함께 삭제되는지 테스트"""
+    statements = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    async with AsyncSession(engine) as db:
+        user = await db.get(User, 1)
+        statements.clear()
+        await db.delete(user)
+        await db.commit()
+
+        # 사용자 DELETE 한 번만 실행되고 item/file/token SELECT는 없음
+        assert len(statements) == 1
+        assert statements[0].startswith("DELETE FROM user")
+
+        for model, column in ((Item, Item.owner_id), (File, File.user_id), (Token, Token.user_id)):
+            count = await db.scalar(select(func.count()).select_from(model).where(column == 1))
+            assert count == 0
+        assert await db.scalar(select(func.count()).select_from(Item)) == 1
@@ -0,0 +1,129 @@
+"""
+전문 검색 인덱스 테스트
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, String, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from app.common.utils.pagination import apply_keyset_pagination
+from fastapi_template.app.common.database.database_fulltext import FullTextIndex, search_terms
+
+
+class SearchBase(DeclarativeBase):
+    pass
+
+
+class Note(SearchBase):
+    __tablename__ = "note"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    body = Column(String, nullable=True)
+
+
+note_index = FullTextIndex(Note.__table__, ("title", "body"), weights=(4.0, 1.0))
+note_index.attach()
+
+
+@pytest.fixture
+async def db():
+    """FTS5 인덱스와 트리거가 생성된 인메모리 DB 세션"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SearchBase.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+async def search(db, text, **kwargs):
+    query, score = note_index.apply(select(Note.id), "sqlite", text, **kwargs)
+    return (await db.scalars(query.order_by(score, Note.id))).all()
+
+
+@pytest.mark.asyncio
+async def test_triggers_keep_index_in_sync(db):
+    """INSERT/UPDATE/DELETE가 트리거로 검색 인덱스에 반영되는지 테스트"""
+    apple = Note(title="red apple", body="fresh fruit")
+    pear = Note(title="green pear", body=None)
+    db.add_all([apple, pear])
+    await db.commit()
+    assert await search(db, "apple") == [apple.id]
+
+    apple.title = "red cherry"
+    await db.commit()
+    assert await search(db, "apple") == []
+    assert await search(db, "cherry") == [apple.id]
+
+    await db.delete(pear)
+    await db.commit()
+    assert await search(db, "pear") == []
+
+
+@pytest.mark.asyncio
+async def test_ranking_prefix_and_special_characters(db):
+    """제목 가중치 순위, 마지막 단어 접두어 검색, 특수 문자 무시를 테스트"""
+    in_body = Note(title="weekly notes", body="keyboard review")
+    in_title = Note(title="keyboard review", body="weekly notes")
+    other = Note(title="한국어 키보드", body=None)
+    db.add_all([in_body, in_title, other])
+    await db.commit()
+
+    assert await search(db, "keyboard") == [in_title.id, in_body.id]
+    assert await search(db, "review key") == [in_title.id, in_body.id]
+    assert await search(db, "review key", prefix=False) == []
+    assert await search(db, "키보") == [other.id]
+    assert await search(db, 'keyboard" OR title:* NEAR(') == []
+    assert search_terms('"a" -b* (c)') == ["a", "b", "c"]
+    assert note_index.apply(select(Note), "sqlite", "* ()")[0] is None
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_by_rank(db):
+    """(순위, id) 키셋으로 페이지를 나눠도 모든 결과를 순서대로 한 번씩 조회하는지 테스트"""
+    db.add_all(
+        Note(title=f"lamp {'lamp ' * (i % 3)}{i}", body="desk lamp" if i % 2 else None)
+        for i in range(25)
+    )
+    await db.commit()
+
+    query, score = note_index.apply(select(Note.id), "sqlite", "lamp")
+    expected = (await db.scalars(query.order_by(score, Note.id))).all()
+
+    seen, after = [], None
+    while True:
+        page = (
+            await db.execute(
+                apply_keyset_pagination(query.add_columns(score), score, Note.id, limit=10, after=after)
+            )
+        ).all()
+        seen.extend(id for id, _ in page)
+        if len(page) < 10:
+            break
+        after = [page[-1][1], page[-1][0]]
+
+    assert len(expected) == 25
+    assert seen == expected
+
+
+def test_postgresql_and_fallback_queries():
+    """PostgreSQL tsvector 검색 식과 DDL, 그 외 DB의 LIKE 검색을 생성하는지 테스트"""
+    query, score = note_index.apply(select(Note.id), "postgresql", "red app")
+    sql = str(query.order_by(score).compile(dialect=postgresql.dialect()))
+    assert '"note".search_vector @@ to_tsquery' in sql
+    assert "ts_rank_cd" in sql
+    assert query.compile().params["search_expression"] == "'red' & 'app':*"
+
+    ddl = note_index.create_statements("postgresql")
+    assert "setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A')" in ddl[1]
+    assert "coalesce(NEW.body, '')), 'B'" in ddl[1]
+    assert ddl[-1] == 'CREATE INDEX IF NOT EXISTS ix_note_search_vector ON "note" USING GIN (search_vector)'
+
+    query, score = note_index.apply(select(Note.id), "mysql", "in_stock%")
+    sql = str(query.compile())
+    assert "lower(note.title) LIKE '%' || lower(:title_1) || '%' ESCAPE '/'" in sql
+    assert query.compile().params["title_1"] == "in/_stock"
+    assert note_index.create_statements("mysql") == []
@@ -0,0 +1,68 @@
+"""
+그룹 커밋 작성기 테스트
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from fastapi_template.app.common.database.database_group_commit import GroupCommitWriter
+from tests.models import Widget
+
+
+@pytest.fixture
+def sessions(engine):
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_commits(sessions, commits):
+    """동시 요청이 max_batch_size 단위로 모여 커밋되고 각자 자신의 행을 받는지 테스트"""
+    writer = GroupCommitWriter(sessions, Widget, max_batch_size=20, max_delay=0.05)
+
+    widgets = await asyncio.gather(
+        *(writer.submit({"name": f"widget-{i}", "owner_id": i}) for i in range(50))
+    )
+    await writer.stop()
+
+    assert len(commits) == 3
+    assert [(w.name, w.owner_id) for w in widgets] == [(f"widget-{i}", i) for i in range(50)]
+    assert len({w.id for w in widgets}) == 50
+
+
+@pytest.mark.asyncio
+async def test_failed_row_gets_its_own_error(sessions, commits, db):
+    """배치 중 한 행이 실패하면 해당 요청만 예외를 받고 나머지는 함께 커밋되는지 테스트"""
+    inserted = []
+
+    async def after_insert(session, objs):
+        inserted.extend(obj.name for obj in objs)
+
+    writer = GroupCommitWriter(sessions, Widget, max_batch_size=5, after_insert=after_insert)
+    results = await asyncio.gather(
+        *(writer.submit({"name": name}) for name in ["a", "b", None, "c", "d"]),
+        return_exceptions=True,
+    )
+    await writer.stop()
+
+    assert isinstance(results[2], IntegrityError)
+    assert [w.name for i, w in enumerate(results) if i != 2] == ["a", "b", "c", "d"]
+    assert len(commits) == 1
+    assert (await db.scalars(select(Widget.name).order_by(Widget.id))).all() == ["a", "b", "c", "d"]
+    assert inserted == ["a", "b", "c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_written_after_max_delay(sessions):
+    """배치가 차지 않아도 max_delay 후 기록되고, stop으로 기록 작업이 종료되는지 테스트"""
+    writer = GroupCommitWriter(sessions, Widget, max_batch_size=100, max_delay=0.01)
+
+    widget = await asyncio.wait_for(writer.submit({"name": "alone"}), timeout=1)
+    assert widget.id is not None
+    assert writer.running
+
+    await writer.stop()
+    assert not writer.running
@@ -0,0 +1,106 @@
+"""
+# File: tests/test_database/test_database_index_advisor.py
+# Description: 인덱스 추천 도구 테스트
+"""
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, String, delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from fastapi_template.app.common.database.database_index_advisor import (
+    IndexAdvisor,
+    access_paths,
+)
+from fastapi_template.app.db.models import Item, Token, User
+
+
+class AdvisorBase(DeclarativeBase):
+    pass
+
+
+class Post(AdvisorBase):
+    __tablename__ = "post"
+
+    id = Column(Integer, primary_key=True)
+    author_id = Column(Integer, nullable=False)
+    title = Column(String)
+    created_at = Column(DateTime)
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(AdvisorBase.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+def test_access_paths_order_equality_sort_range():
+    """동등 조건 → 정렬 → 범위 조건 순서로 인덱스 컬럼을 추출하는지 테스트"""
+    query = (
+        select(Post)
+        .where(Post.author_id == 1, Post.created_at > func.now())
+        .order_by(Post.id)
+    )
+    assert access_paths(query)["post"].index_columns == ("author_id", "id", "created_at")
+
+    # 서브쿼리를 감싼 count(*) 쿼리도 내부 조건을 분석
+    count = select(func.count()).select_from(select(Post).where(Post.author_id == 1).subquery())
+    assert access_paths(count)["post"].index_columns == ("author_id",)
+
+
+@pytest.mark.asyncio
+async def test_suggests_missing_index_from_explain(engine):
+    """필터 컬럼에 인덱스가 없으면 추천하고, 인덱스를 만들면 추천하지 않는지 테스트"""
+    advisor = IndexAdvisor(engine)
+    advisor.start()
+    async with AsyncSession(engine) as db:
+        for author_id in (1, 2, 3):
+            await db.execute(select(Post).where(Post.author_id == author_id).order_by(Post.id))
+        await db.execute(select(Post).where(Post.id == 1))
+    advisor.stop()
+
+    suggestions = await advisor.suggest()
+    assert [(s.table, s.columns, s.calls) for s in suggestions] == [("post", ("author_id", "id"), 3)]
+    assert suggestions[0].ddl == "CREATE INDEX ix_post_author_id_id ON post (author_id, id)"
+
+    async with engine.begin() as conn:
+        await conn.execute(text(suggestions[0].ddl))
+    assert await advisor.suggest() == []
+
+
+def test_models_have_access_path_indexes():
+    """아이템/토큰 모델에 실제 조회 경로에 맞는 복합 인덱스가 있는지 테스트"""
+    item_indexes = {index.name: [c.name for c in index.columns] for index in Item.__table__.indexes}
+    assert item_indexes["ix_item_owner_id_id"] == ["owner_id", "id"]
+    assert item_indexes["ix_item_owner_id_created_at_id"] == ["owner_id", "created_at", "id"]
+
+    token_indexes = {index.name: [c.name for c in index.columns] for index in Token.__table__.indexes}
+    assert token_indexes["ix_token_user_id_type_expires_at"] == ["user_id", "type", "expires_at"]
+    assert "ix_token_user_id" not in token_indexes
+
+
+@pytest.mark.asyncio
+async def test_app_access_paths_are_indexed():
+    """아이템/토큰의 실제 조회 경로에 대해 추천되는 인덱스가 없는지 테스트"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(User.metadata.create_all)
+
+    advisor = IndexAdvisor(engine)
+    advisor.start()
+    async with AsyncSession(engine) as db:
+        owned = select(Item).where(Item.owner_id == 1)
+        await db.execute(owned.order_by(Item.id).limit(10))
+        await db.execute(owned.order_by(Item.created_at, Item.id).limit(10))
+        await db.execute(select(func.count()).select_from(owned.subquery()))
+        await db.execute(select(Token).where(Token.user_id == 1, Token.type == "refresh"))
+        await db.execute(delete(Token).where(Token.user_id == 1, Token.type == "refresh"))
+    advisor.stop()
+
+    try:
+        assert await advisor.suggest() == []
+    finally:
+        await engine.dispose()
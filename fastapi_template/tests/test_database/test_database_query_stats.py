@@ -0,0 +1,123 @@
+"""
+요청별 쿼리 통계 테스트
+"""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_template.app.common.database.database_query_stats import (
+    QueryStatsMiddleware,
+    install_query_stats,
+    observe_requests,
+    track_queries,
+)
+from fastapi_template.app.common.middleware.logging_middleware import RequestLoggingMiddleware
+from tests.models import Widget
+
+
+@pytest.fixture
+async def client(engine):
+    """위젯 목록과 N+1 조회 엔드포인트가 있는 앱의 클라이언트"""
+    install_query_stats()
+    app = FastAPI()
+    app.middleware("http")(RequestLoggingMiddleware())
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/widgets")
+    async def list_widgets():
+        async with AsyncSession(engine) as session:
+            widgets = (await session.scalars(select(Widget))).all()
+        return [widget.name for widget in widgets]
+
+    @app.get("/widgets/{owner_id}/each")
+    async def list_widgets_one_by_one(owner_id: int):
+        async with AsyncSession(engine) as session:
+            ids = (await session.scalars(select(Widget.id).where(Widget.owner_id == owner_id))).all()
+            return [(await session.get(Widget, id)).name for id in ids]
+
+    @app.get("/widgets/stream")
+    async def stream_widgets():
+        async def lines():
+            async with AsyncSession(engine) as session:
+                for owner_id in (1, 2):
+                    names = (await session.scalars(select(Widget.name).where(Widget.owner_id == owner_id))).all()
+                    yield "\n".join(names)
+
+        return StreamingResponse(lines())
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+async def widgets(db):
+    db.add_all(Widget(name=f"widget-{i}", owner_id=1) for i in range(5))
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_request_stats_in_server_timing_and_log(client, widgets, caplog):
+    """요청별 쿼리 수와 로드된 객체 수가 Server-Timing 헤더와 요청 로그에 기록되는지 테스트"""
+    with caplog.at_level("INFO"):
+        response = await client.get("/widgets")
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert response.headers["server-timing"].endswith('desc="1 queries, 5 objects"')
+    # 기존 요청 로그 한 줄에 통계를 덧붙임 (요청마다 한 줄)
+    [line] = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Path: ")]
+    assert line.startswith("Path: /widgets Method: GET Status: 200 ")
+    assert "Queries: 1 " in line and line.endswith("Objects: 5")
+
+
+@pytest.mark.asyncio
+async def test_request_log_includes_streamed_queries(client, widgets, caplog):
+    """스트리밍 응답 본문에서 실행된 쿼리도 요청 로그에 포함되는지 테스트"""
+    with caplog.at_level("INFO"):
+        response = await client.get("/widgets/stream")
+
+    assert response.headers["server-timing"].endswith('desc="0 queries, 0 objects"')
+    [line] = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Path: ")]
+    assert "Path: /widgets/stream " in line and "Queries: 2 " in line
+
+
+@pytest.mark.asyncio
+@pytest.mark.endpoint_query_budget(1)
+async def test_query_budget_marker(client, widgets, endpoint_query_budget):
+    """endpoint_query_budget 마커가 요청별 통계를 라우트 템플릿과 함께 수집하는지 테스트"""
+    await client.get("/widgets")
+
+    assert [(r.route, r.stats.statements) for r in endpoint_query_budget] == [("GET /widgets", 1)]
+
+
+@pytest.mark.asyncio
+async def test_n_plus_one_endpoint_exceeds_budget(client, widgets):
+    """행마다 조회하는 엔드포인트의 통계가 행 수만큼 늘어나는지 테스트"""
+    with observe_requests() as served:
+        await client.get("/widgets/1/each")
+
+    [request] = served
+    assert request.route == "GET /widgets/{owner_id}/each"
+    assert request.stats.statements == 6
+    assert request.stats.objects == 5
+
+
+@pytest.mark.asyncio
+async def test_track_queries_outside_requests(db, widgets):
+    """요청 밖에서는 집계하지 않고, 중첩 블록의 통계는 바깥 블록에 더해지는지 테스트"""
+    install_query_stats()
+    db.expunge_all()
+    await db.scalars(select(Widget.id))
+    with track_queries() as outer:
+        await db.scalars(select(Widget.id))
+        with track_queries() as inner:
+            (await db.scalars(select(Widget))).all()
+
+    assert (inner.statements, inner.objects) == (1, 5)
+    assert (outer.statements, outer.objects) == (2, 5)
+    assert outer.duration_ms >= inner.duration_ms > 0
@@ -0,0 +1,188 @@
+"""
+# File: tests/test_database/test_database_routing.py
+# Description: 읽기 전용 복제본 라우팅 세션 테스트
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, Integer, String, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from fastapi_template.app.common.database.database_routing import (
+    ReplicaRouter,
+    ReplicaStickinessMiddleware,
+    RoutingSession,
+    current_replica_client,
+    set_replica_client,
+    use_primary,
+)
+
+
+class RoutingBase(DeclarativeBase):
+    pass
+
+
+class Note(RoutingBase):
+    __tablename__ = "note"
+
+    id = Column(Integer, primary_key=True)
+    body = Column(String)
+
+
+@pytest.fixture
+async def engines(tmp_path):
+    """주 DB와 복제본 DB로 사용할 별도 SQLite 파일 엔진"""
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/primary.db")
+    replicas = [
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/replica_{i}.db") for i in range(2)
+    ]
+    for index, engine in enumerate([primary, *replicas]):
+        async with engine.begin() as conn:
+            await conn.run_sync(RoutingBase.metadata.create_all)
+            await conn.execute(insert(Note).values(id=1, body=f"db-{index}"))
+    yield primary, replicas
+    for engine in [primary, *replicas]:
+        await engine.dispose()
+
+
+def make_session_factory(primary, router):
+    return async_sessionmaker(
+        primary,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        router=router,
+    )
+
+
+async def read_body(session):
+    result = await session.execute(select(Note.body).where(Note.id == 1))
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_reads_round_robin_across_replicas(engines):
+    """읽기 쿼리가 복제본에 순차 분배되는지 테스트"""
+    primary, replicas = engines
+    router = ReplicaRouter(primary.sync_engine, [r.sync_engine for r in replicas], sticky_seconds=0)
+
+    async with make_session_factory(primary, router)() as session:
+        bodies = [await read_body(session) for _ in range(4)]
+
+    assert bodies == ["db-1", "db-2", "db-1", "db-2"]
+
+
+@pytest.mark.asyncio
+async def test_write_sticks_session_to_primary(engines):
+    """쓰기 이후 같은 세션의 읽기가 주 DB로 고정되는지 테스트"""
+    primary, replicas = engines
+    router = ReplicaRouter(primary.sync_engine, [r.sync_engine for r in replicas], sticky_seconds=0)
+    session_factory = make_session_factory(primary, router)
+
+    async with session_factory() as session:
+        session.add(Note(id=2, body="new"))
+        await session.commit()
+        result = await session.execute(select(Note.body).where(Note.id == 2))
+        assert result.scalar_one() == "new"
+        assert await read_body(session) == "db-0"
+
+    # 새 세션(요청)은 다시 복제본에서 읽음
+    async with session_factory() as session:
+        assert await read_body(session) != "db-0"
+
+
+@pytest.mark.asyncio
+async def test_sticky_window_is_scoped_to_writing_client(engines):
+    """쓰기 이후 고정 시간 동안 같은 클라이언트의 다른 세션만 주 DB를 사용하는지 테스트"""
+    primary, replicas = engines
+    router = ReplicaRouter(primary.sync_engine, [r.sync_engine for r in replicas], sticky_seconds=60)
+    session_factory = make_session_factory(primary, router)
+
+    async def read_as(client):
+        token = set_replica_client(client)
+        try:
+            async with session_factory() as session:
+                return await read_body(session)
+        finally:
+            token.var.reset(token)
+
+    # 클라이언트를 알 수 없는 쓰기(백그라운드 작업 등)는 다른 요청의 읽기를 고정하지 않음
+    async with session_factory() as session:
+        session.add(Note(id=2, body="background"))
+        await session.commit()
+    assert await read_as(None) != "db-0"
+
+    token = set_replica_client("client-a")
+    try:
+        async with session_factory() as session:
+            session.add(Note(id=3, body="from client-a"))
+            await session.commit()
+    finally:
+        token.var.reset(token)
+
+    assert await read_as("client-a") == "db-0"
+    assert await read_as("client-b") != "db-0"
+    assert await read_as(None) != "db-0"
+
+
+@pytest.mark.asyncio
+async def test_stickiness_middleware_keys_clients_by_credentials():
+    """미들웨어가 Authorization 헤더나 쿠키의 해시를 클라이언트 키로 지정하는지 테스트"""
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(current_replica_client())
+
+    middleware = ReplicaStickinessMiddleware(app, cookie_name="session")
+    for headers in (
+        [(b"authorization", b"Bearer token-a")],
+        [(b"authorization", b"Bearer token-a")],
+        [(b"authorization", b"Bearer token-b")],
+        [(b"cookie", b"theme=dark; session=abc")],
+        [],
+    ):
+        await middleware({"type": "http", "headers": headers}, None, None)
+
+    assert seen[0] == seen[1] and seen[0] != seen[2]
+    assert "token-a" not in seen[0]
+    assert seen[3] is not None and seen[4] is None
+    assert current_replica_client() is None
+
+
+@pytest.mark.asyncio
+async def test_use_primary_and_text_queries(engines):
+    """use_primary 및 텍스트 SQL이 주 DB를 사용하는지 테스트"""
+    primary, replicas = engines
+    router = ReplicaRouter(primary.sync_engine, [r.sync_engine for r in replicas], sticky_seconds=0)
+    session_factory = make_session_factory(primary, router)
+
+    async with session_factory() as session:
+        result = await session.execute(text("SELECT body FROM note WHERE id = 1"))
+        assert result.scalar_one() == "db-0"
+
+    async with session_factory() as session:
+        use_primary(session)
+        assert await read_body(session) == "db-0"
+
+
+def test_least_loaded_strategy():
+    """least_loaded 전략이 사용 중인 연결이 적은 복제본을 선택하는지 테스트"""
+    def fake_engine(checked_out):
+        return SimpleNamespace(pool=SimpleNamespace(checkedout=lambda: checked_out))
+
+    busy, idle = fake_engine(3), fake_engine(1)
+    router = ReplicaRouter(fake_engine(0), [busy, idle], strategy="least_loaded")
+
+    assert router.select_replica() is idle
+
+
+def test_router_without_replicas_uses_primary():
+    """복제본이 없으면 주 엔진을 반환하는지 테스트"""
+    primary = create_async_engine("sqlite+aiosqlite:///:memory:")
+    router = ReplicaRouter(primary.sync_engine)
+    assert router.select_replica() is primary.sync_engine
+
+    with pytest.raises(ValueError):
+        ReplicaRouter(primary.sync_engine, strategy="random")
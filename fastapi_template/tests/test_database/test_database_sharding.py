@@ -0,0 +1,266 @@
+"""
+수평 샤딩 테스트
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String, delete, event, insert, not_, or_, select, text, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, relationship
+
+from fastapi_template.app.common.database.database_fulltext import FullTextIndex
+from fastapi_template.app.common.database.database_group_commit import GroupCommitWriter
+from fastapi_template.app.common.database.database_sharding import ShardMap, shard_map_of
+from fastapi_template.app.common.database.database_sqlite import SerializedAsyncSession, SQLiteWriteQueue
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+
+SHARD_COUNT = 3
+
+
+class ShardBase(DeclarativeBase):
+    pass
+
+
+class Owner(ShardBase):
+    __tablename__ = "owner"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    note_count = Column(Integer, nullable=False, default=0)
+    notes = relationship("Note", back_populates="owner", passive_deletes=True)
+
+
+class Note(ShardBase):
+    __tablename__ = "note"
+    __shard_key__ = "owner_id"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    owner_id = Column(Integer, ForeignKey("owner.id", ondelete="CASCADE"), nullable=True)
+    owner = relationship("Owner", back_populates="notes")
+
+
+note_index = FullTextIndex(Note.__table__, ("title",))
+note_index.attach()
+
+
+@pytest.fixture
+async def shard_map(tmp_path):
+    """로컬 SQLite 파일 여러 개로 구성한 샤드 맵"""
+    default = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/default.db")
+    shards = [
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/shard{i}.db") for i in range(SHARD_COUNT)
+    ]
+    shard_map = ShardMap(shards, default=default)
+    await shard_map.create_all(ShardBase)
+    yield shard_map
+    for engine in shard_map.engines.values():
+        await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(shard_map):
+    return async_sessionmaker(
+        shard_map.engines["default"], expire_on_commit=False, **shard_map.session_options()
+    )
+
+
+@pytest.fixture
+async def owners(session_factory):
+    async with session_factory() as db:
+        owners = [Owner(name=f"owner-{i}") for i in range(4)]
+        db.add_all(owners)
+        await db.commit()
+    return owners
+
+
+async def rows_per_shard(shard_map):
+    """샤드별로 실제 저장된 (id, owner_id) 목록"""
+    rows = {}
+    for shard_id in shard_map.shard_ids:
+        async with shard_map.engines[shard_id].connect() as conn:
+            result = await conn.execute(text("SELECT id, owner_id FROM note ORDER BY id"))
+            rows[shard_id] = [tuple(row) for row in result]
+    return rows
+
+
+def count_statements(shard_map):
+    """엔진(샤드)별 실행된 SELECT 수"""
+    counts = {shard_id: 0 for shard_id in shard_map.engines}
+
+    for shard_id, engine in shard_map.engines.items():
+        def count(conn, cursor, statement, *args, shard_id=shard_id):
+            if statement.lstrip().upper().startswith("SELECT"):
+                counts[shard_id] += 1
+
+        event.listen(engine.sync_engine, "before_cursor_execute", count)
+    return counts
+
+
+@pytest.mark.asyncio
+async def test_objects_are_stored_on_owner_shard_with_global_ids(shard_map, session_factory, owners):
+    """샤드 키의 샤드에 저장되고, 전역 고유 ID에서 샤드를 알 수 있는지 테스트"""
+    async with session_factory() as db:
+        assert shard_map_of(db) is shard_map
+        db.add_all(Note(title=f"note-{i}", owner_id=owners[i % 4].id) for i in range(12))
+        db.add(Note(title="orphan", owner_id=None))
+        await db.commit()
+        assert await db.scalar(text("SELECT count(*) FROM owner")) == 4
+
+    stored = await rows_per_shard(shard_map)
+    ids = [id for rows in stored.values() for id, _ in rows]
+    assert len(ids) == len(set(ids)) == 13
+    for shard_id, rows in stored.items():
+        for id, owner_id in rows:
+            assert shard_map.shard_of_id(id) == shard_map.shard_for(owner_id) == shard_id
+    assert stored["shard0"][-1][1] is None
+
+    # 기본 DB에는 샤드 테이블이 없음
+    async with shard_map.engines["default"].connect() as conn:
+        tables = (await conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'"))).scalars()
+        assert "note" not in set(tables)
+
+
+@pytest.mark.asyncio
+async def test_statements_are_routed_by_shard_key_and_id(shard_map, session_factory, owners):
+    """샤드 키/ID 조건이 있는 문장은 한 샤드에서, 없는 문장은 모든 샤드에서 실행되는지 테스트"""
+    async with session_factory() as db:
+        db.add_all(Note(title=f"note-{i}", owner_id=owners[i % 4].id) for i in range(12))
+        await db.commit()
+
+    owner = owners[1]
+    counts = count_statements(shard_map)
+    async with session_factory() as db:
+        notes = (await db.scalars(select(Note).where(Note.owner_id == owner.id))).all()
+        assert len(notes) == 3
+        owner_shard = shard_map.shard_for(owner.id)
+        assert counts == {"default": 0, **{s: int(s == owner_shard) for s in shard_map.shard_ids}}
+
+        note = await db.get(Note, notes[0].id)
+        assert note is notes[0]
+        db.expunge_all()
+        assert (await db.get(Note, notes[1].id)).title == notes[1].title
+        assert counts[shard_map.shard_of_id(notes[1].id)] == 2
+
+        await db.execute(
+            update(Note).where(Note.owner_id.in_([owner.id])).values(title="updated")
+        )
+        await db.commit()
+
+        # 기본 DB의 소유자에서 샤드의 노트로 지연 로딩
+        loaded = await db.run_sync(lambda session: [n.title for n in session.get(Owner, owner.id).notes])
+        assert loaded == ["updated"] * 3
+
+        before = dict(counts)
+        every = (await db.scalars(select(Note.id).order_by(Note.id))).all()
+        assert len(every) == 12
+        assert {s: counts[s] - before[s] for s in counts} == {
+            "default": 0, **dict.fromkeys(shard_map.shard_ids, 1)
+        }
+
+
+@pytest.mark.asyncio
+async def test_or_and_not_conditions_use_every_shard(shard_map, session_factory, owners):
+    """OR/NOT 안의 샤드 키 비교로 샤드를 좁히지 않고 모든 샤드에서 실행하는지 테스트"""
+    first = owners[0]
+    second = next(o for o in owners if shard_map.shard_for(o.id) != shard_map.shard_for(first.id))
+    async with session_factory() as db:
+        db.add_all([Note(title="mine", owner_id=first.id), Note(title="shared", owner_id=second.id)])
+        await db.commit()
+
+        either = or_(Note.owner_id == first.id, Note.title == "shared")
+        titles = (await db.scalars(select(Note.title).where(either).order_by(Note.title))).all()
+        assert titles == ["mine", "shared"]
+        assert (await db.scalars(select(Note.title).where(not_(Note.owner_id == first.id)))).all() == ["shared"]
+        assert (await db.scalars(select(Note.title).where(Note.owner_id == first.id, either))).all() == ["mine"]
+
+        await db.execute(update(Note).where(either).values(title="updated"))
+        await db.commit()
+        assert (await db.scalars(select(Note.title))).all() == ["updated", "updated"]
+
+        await db.execute(delete(Note).where(or_(Note.owner_id == first.id, Note.owner_id == second.id)))
+        await db.commit()
+    assert sum(len(rows) for rows in (await rows_per_shard(shard_map)).values()) == 0
+
+
+@pytest.mark.asyncio
+async def test_gather_merges_sorted_shard_results(shard_map, session_factory, owners):
+    """모든 샤드의 정렬된 결과를 병합하여 오프셋/개수를 적용하는지 테스트"""
+    async with session_factory() as db:
+        db.add_all(Note(title=f"note-{i:02d}", owner_id=owners[i % 4].id) for i in range(20))
+        await db.commit()
+
+    query = select(Note).order_by(Note.title.desc(), Note.id)
+    rows = await shard_map.gather(
+        query, key=lambda row: row[0].title, descending=True, offset=3, limit=5
+    )
+    assert [row[0].title for row in rows] == [f"note-{i:02d}" for i in range(16, 11, -1)]
+    assert await shard_map.count(select(Note).where(Note.title >= "note-10")) == 10
+    assert len(await shard_map.gather(select(Note.id))) == 20
+
+    # 전문 검색 인덱스도 각 샤드에 생성됨
+    query, _ = note_index.apply(select(Note.title), "sqlite", "note 07")
+    assert [row[0] for row in await shard_map.gather(query)] == ["note-07"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_is_split_by_shard(shard_map, session_factory, owners):
+    """대량 삽입이 샤드별로 나뉘고, 샤드를 지정하지 않은 INSERT 문은 거부되는지 테스트"""
+    rows = [{"title": f"bulk-{i}", "owner_id": owners[i % 4].id} for i in range(10)]
+    async with session_factory() as db:
+        created = await BaseRepository(Note).bulk_create(db, obj_in_list=rows)
+        assert [note.title for note in created] == [f"bulk-{i}" for i in range(10)]
+
+        with pytest.raises(ValueError, match="샤드별로"):
+            await db.execute(insert(Note), [{"title": "unrouted", "owner_id": owners[0].id}])
+        await db.rollback()
+
+    writer = GroupCommitWriter(session_factory, Note, max_batch_size=4, max_delay=0.01)
+    try:
+        grouped = [await writer.submit({"title": "grouped", "owner_id": owner.id}) for owner in owners]
+    finally:
+        await writer.stop()
+    assert [note.owner_id for note in grouped] == [owner.id for owner in owners]
+
+    stored = await rows_per_shard(shard_map)
+    assert sum(len(rows) for rows in stored.values()) == 14
+    for shard_id, shard_rows in stored.items():
+        assert all(shard_map.shard_for(owner_id) == shard_id for _, owner_id in shard_rows)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_with_write_queue(shard_map, owners):
+    """쓰기 대기열 사용 시 객체 저장과 대량 삽입이 동시에 실행되어도 잠금 대기 없이 완료되는지 테스트"""
+    session_factory = async_sessionmaker(
+        shard_map.engines["default"],
+        class_=SerializedAsyncSession,
+        write_queue=SQLiteWriteQueue(),
+        expire_on_commit=False,
+        autoflush=False,
+        **shard_map.session_options(),
+    )
+    repository = BaseRepository(Note)
+
+    async def create(i):
+        # 대기열을 가진 채로 기본 DB의 카운터를 갱신 (ItemService.create_item과 같은 순서)
+        async with session_factory() as db:
+            owner = owners[i % 4]
+            db.add(Note(title=f"created-{i}", owner_id=owner.id))
+            await db.execute(
+                update(Owner).where(Owner.id == owner.id).values(note_count=Owner.note_count + 1)
+            )
+            await db.commit()
+
+    async def bulk(i):
+        async with session_factory() as db:
+            rows = [{"title": f"bulk-{i}-{j}", "owner_id": owners[j % 4].id} for j in range(3)]
+            await repository.bulk_create(db, obj_in_list=rows, return_objects=i % 2 == 0)
+
+    tasks = [task(i) for i in range(20) for task in (create, bulk)]
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=30)
+
+    stored = await rows_per_shard(shard_map)
+    assert sum(len(rows) for rows in stored.values()) == 20 + 20 * 3
+    async with session_factory() as db:
+        assert sum((await db.scalars(select(Owner.note_count))).all()) == 20
@@ -0,0 +1,102 @@
+"""
+느린 쿼리 기록 테스트
+"""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_template.app.common.database.database_slow_query import (
+    QueryContextMiddleware,
+    SlowQueryLog,
+)
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+from tests.models import Widget
+
+
+@pytest.fixture
+def slow_log(engine):
+    log = SlowQueryLog(threshold_ms=0)
+    log.attach(engine)
+    yield log
+    log.detach()
+
+
+@pytest.mark.asyncio
+async def test_records_caller_and_redacts_parameters(db, slow_log):
+    """리포지토리 메서드 이름을 기록하고 파라미터 값은 타입 이름으로 가리는지 테스트"""
+    await BaseRepository(Widget).get_multi(db, owner_id=7)
+
+    entry = slow_log.entries()[-1]
+    assert entry.statement.startswith("SELECT")
+    assert entry.caller == "BaseRepository.get_multi"
+    assert entry.route is None
+    assert "7" not in str(entry.parameters)
+    assert "int" in entry.parameters
+
+    slow_log.configure(threshold_ms=0, redact_parameters=False)
+    await BaseRepository(Widget).get_multi(db, owner_id=7)
+    assert 7 in slow_log.entries()[-1].parameters
+
+
+@pytest.mark.asyncio
+async def test_below_threshold_not_recorded(db, slow_log):
+    """기준 시간보다 빠른 쿼리는 기록하지 않는지 테스트"""
+    slow_log.configure(threshold_ms=60_000)
+    await db.execute(select(Widget))
+    assert slow_log.entries() == []
+    assert slow_log.report() == []
+
+
+@pytest.mark.asyncio
+async def test_failed_statements_do_not_leak_start_times(engine, slow_log):
+    """실패한 문장의 시작 시간이 연결에 남지 않는지 테스트"""
+    async with engine.connect() as conn:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                await conn.execute(text("SELECT * FROM missing_table"))
+        await conn.execute(select(Widget.id))
+        info = (await conn.get_raw_connection()).info
+
+    assert info["slow_query_started"] == []
+    assert [e.statement for e in slow_log.entries()] == [str(select(Widget.id))]
+
+
+@pytest.mark.asyncio
+async def test_records_route_template(engine, slow_log):
+    """미들웨어를 거친 요청의 쿼리에 라우트 경로 템플릿이 기록되는지 테스트"""
+    app = FastAPI()
+    app.add_middleware(QueryContextMiddleware)
+
+    @app.get("/widgets/{widget_id}")
+    async def read_widget(widget_id: int):
+        async with AsyncSession(engine) as session:
+            await session.get(Widget, widget_id)
+        return {}
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        assert (await client.get("/widgets/3")).status_code == 200
+
+    assert slow_log.entries()[-1].route == "GET /widgets/{widget_id}"
+
+
+@pytest.mark.asyncio
+async def test_report_aggregates_and_captures_plan(db, slow_log):
+    """보고서가 문장별로 합산되고 실행 계획이 한 번 수집되는지 테스트"""
+    slow_log.configure(threshold_ms=0, explain=True)
+    for owner_id in range(3):
+        await db.execute(select(Widget).where(Widget.owner_id == owner_id))
+    await db.execute(select(Widget.id))
+    await slow_log.wait_for_plans()
+
+    top = slow_log.report(limit=1)
+    assert len(top) == 1
+    assert top[0].calls == 3
+    assert top[0].total_ms >= top[0].max_ms
+    assert "widget" in top[0].plan
+    assert len(slow_log.report()) == 2
@@ -0,0 +1,117 @@
+"""
+# File: tests/test_database/test_database_sqlite.py
+# Description: SQLite 고성능 모드 테스트
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import Column, Integer, String, func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+from fastapi_template.app.common.database.database_sqlite import (
+    SerializedAsyncSession,
+    SQLiteWriteQueue,
+    apply_sqlite_pragmas,
+    build_sqlite_pragmas,
+    is_sqlite_memory_url,
+    sqlite_engine_options,
+)
+
+
+class SQLiteBase(DeclarativeBase):
+    pass
+
+
+class Counter(SQLiteBase):
+    __tablename__ = "counter"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+def make_engine(url):
+    engine = create_async_engine(url, **sqlite_engine_options(url, pool_size=4))
+    apply_sqlite_pragmas(engine, build_sqlite_pragmas(busy_timeout=100))
+    return engine
+
+
+def test_sqlite_engine_options():
+    """URL 종류에 따른 풀 선택 테스트"""
+    assert is_sqlite_memory_url("sqlite+aiosqlite:///:memory:")
+    assert is_sqlite_memory_url("sqlite+aiosqlite://")
+    assert not is_sqlite_memory_url("sqlite+aiosqlite:///./test.db")
+
+    assert sqlite_engine_options("sqlite+aiosqlite:///:memory:")["poolclass"] is StaticPool
+    options = sqlite_engine_options("sqlite+aiosqlite:///./test.db", pool_size=3)
+    assert options["poolclass"] is AsyncAdaptedQueuePool
+    assert options["pool_size"] == 3
+
+
+@pytest.mark.asyncio
+async def test_pragmas_applied_on_connect(tmp_path):
+    """연결 시 PRAGMA 튜닝이 적용되는지 테스트"""
+    engine = make_engine(f"sqlite+aiosqlite:///{tmp_path}/perf.db")
+    try:
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1  # NORMAL
+            assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 100
+            assert (await conn.execute(text("PRAGMA temp_store"))).scalar() == 2  # MEMORY
+            assert (await conn.execute(text("PRAGMA cache_size"))).scalar() == -64000
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_serialized_concurrent_writes(tmp_path):
+    """동시 쓰기가 대기열로 직렬화되어 모두 성공하는지 테스트"""
+    engine = make_engine(f"sqlite+aiosqlite:///{tmp_path}/writers.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLiteBase.metadata.create_all)
+
+    write_queue = SQLiteWriteQueue()
+    session_factory = async_sessionmaker(
+        engine, class_=SerializedAsyncSession, expire_on_commit=False, write_queue=write_queue
+    )
+
+    async def writer(index):
+        async with session_factory() as session:
+            session.add(Counter(name=f"writer-{index}"))
+            await session.flush()
+            # 다른 코루틴이 끼어들 수 있도록 트랜잭션 중간에 양보
+            await asyncio.sleep(0.01)
+            await session.commit()
+
+    try:
+        await asyncio.gather(*(writer(i) for i in range(20)))
+        assert not write_queue.locked()
+
+        async with session_factory() as session:
+            count = (await session.execute(select(func.count()).select_from(Counter))).scalar()
+        assert count == 20
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_writer_released_on_rollback(tmp_path):
+    """롤백 시 쓰기 권한이 반납되는지 테스트"""
+    engine = make_engine(f"sqlite+aiosqlite:///{tmp_path}/rollback.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLiteBase.metadata.create_all)
+
+    write_queue = SQLiteWriteQueue()
+    session_factory = async_sessionmaker(engine, class_=SerializedAsyncSession, write_queue=write_queue)
+
+    try:
+        async with session_factory() as session:
+            session.add(Counter(name="discarded"))
+            await session.flush()
+            assert write_queue.locked()
+            await session.rollback()
+            assert not write_queue.locked()
+    finally:
+        await engine.dispose()
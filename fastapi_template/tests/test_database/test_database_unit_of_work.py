@@ -0,0 +1,97 @@
+"""
+요청 단위 트랜잭션(Unit of Work) 테스트
+"""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_template.app.common.cache.cache_memory import MemoryCacheBackend
+from fastapi_template.app.common.database.database_unit_of_work import (
+    UnitOfWork,
+    current_unit_of_work,
+)
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+from tests.models import Widget
+from tests.test_repositories.test_repositories_cache import CachedWidgetRepository
+
+
+async def count_widgets(engine):
+    async with AsyncSession(engine) as other:
+        return await other.scalar(select(func.count(Widget.id)))
+
+
+@pytest.mark.asyncio
+async def test_writes_commit_once(engine, db, commits):
+    """단위 작업 안의 여러 쓰기가 한 번만 커밋되고, 그 전에는 다른 세션에 보이지 않는지 테스트"""
+    repository = BaseRepository(Widget)
+
+    async with UnitOfWork(db) as uow:
+        assert current_unit_of_work(db) is uow
+        widget = await repository.create(db, obj_in={"name": "a", "owner_id": 1})
+        await repository.update(db, db_obj=widget, obj_in={"name": "b"})
+        await repository.bulk_create(db, obj_in_list=[{"name": "c"}, {"name": "d"}])
+        assert commits == []
+
+    assert len(commits) == 1
+    assert current_unit_of_work(db) is None
+    assert await count_widgets(engine) == 3
+    assert (await db.get(Widget, widget.id)).name == "b"
+
+
+@pytest.mark.asyncio
+async def test_exception_rolls_back_every_write(engine, db):
+    """단위 작업 중 예외가 발생하면 이전 쓰기까지 모두 롤백되는지 테스트"""
+    repository = BaseRepository(Widget)
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(db):
+            await repository.create(db, obj_in={"name": "a"})
+            # 대상이 없는 삭제는 단위 작업을 롤백하지 않음
+            assert await repository.delete(db, id=999) is None
+            await repository.create(db, obj_in={"name": "b"})
+            raise RuntimeError("실패")
+
+    assert await count_widgets(engine) == 0
+
+
+@pytest.mark.asyncio
+async def test_savepoint_rolls_back_only_its_block(engine, db, commits):
+    """세이브포인트 블록의 예외는 블록 안의 변경만 롤백하는지 테스트"""
+    repository = BaseRepository(Widget)
+
+    async with UnitOfWork(db) as uow:
+        await repository.create(db, obj_in={"name": "kept"})
+        with pytest.raises(RuntimeError):
+            async with uow.savepoint():
+                await repository.create(db, obj_in={"name": "discarded"})
+                raise RuntimeError("실패")
+        # 중첩된 단위 작업은 바깥 단위 작업에 합류
+        async with UnitOfWork(db) as inner:
+            assert inner is uow
+            await repository.create(db, obj_in={"name": "joined"})
+
+    assert len(commits) == 1
+    names = (await db.scalars(select(Widget.name).order_by(Widget.id))).all()
+    assert names == ["kept", "joined"]
+
+
+@pytest.mark.asyncio
+async def test_cache_bypassed_and_invalidated_after_commit(db):
+    """단위 작업 안에서는 캐시를 사용하지 않고, 캐시 무효화는 커밋 후에 실행되는지 테스트"""
+    cache = MemoryCacheBackend(ttl=None)
+    repository = CachedWidgetRepository(cache)
+    widget = await repository.create(db, obj_in={"name": "before"})
+    await repository.get(db, widget.id)
+    key = repository._cache_key("id", widget.id)
+    assert await cache.get(key) is not None
+
+    async with UnitOfWork(db):
+        await repository.update(db, db_obj=widget, obj_in={"name": "after"})
+        # 다른 요청은 커밋 전까지 캐시된 이전 값을 읽음
+        assert await cache.get(key) is not None
+        assert (await repository.get(db, widget.id)).name == "after"
+
+    assert await cache.get(key) is None
+    db.expunge_all()
+    assert (await repository.get(db, widget.id)).name == "after"
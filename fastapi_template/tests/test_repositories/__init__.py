@@ -0,0 +1 @@
+"""Repositories 모듈 테스트 패키지"""
@@ -0,0 +1,271 @@
+"""
+기본 리포지토리 테스트
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+from fastapi_template.app.common.schemas.pagination_schema import CursorParams
+from tests.models import Gadget, Widget
+
+
+@pytest.fixture
+def repository():
+    return BaseRepository(Widget)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_returns_objects_in_batches(db, repository, statements):
+    """bulk_create가 배치 단위 INSERT ... RETURNING으로 객체를 반환하는지 테스트"""
+    rows = [{"name": f"widget-{i}", "owner_id": i % 3} for i in range(10)]
+
+    created = await repository.bulk_create(db, obj_in_list=rows, batch_size=4)
+
+    assert [widget.name for widget in created] == [row["name"] for row in rows]
+    assert all(widget.id is not None and widget.created_at is not None for widget in created)
+
+    inserts = [sql for sql in statements if sql.lstrip().upper().startswith("INSERT")]
+    selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    assert len(inserts) == 3  # 4 + 4 + 2
+    assert all("RETURNING" in sql.upper() for sql in inserts)
+    assert selects == []  # 행별 refresh 없음
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_without_returning(db, repository, statements):
+    """return_objects=False면 RETURNING 없이 생성된 행 수를 반환하는지 테스트"""
+    rows = [{"name": f"widget-{i}"} for i in range(5)]
+
+    created = await repository.bulk_create(db, obj_in_list=rows, return_objects=False)
+
+    assert created == 5
+    assert await repository.count(db) == 5
+    assert not any("RETURNING" in sql.upper() for sql in statements if "INSERT" in sql.upper())
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_empty(db, repository):
+    """빈 목록 처리 테스트"""
+    assert await repository.bulk_create(db, obj_in_list=[]) == []
+    assert await repository.bulk_create(db, obj_in_list=[], return_objects=False) == 0
+
+
+def test_column_value_defaults():
+    """COPY용 Python 측 기본값 계산 테스트"""
+    created_at = BaseRepository._column_value(Widget.__table__.c.created_at, {})
+    assert isinstance(created_at, datetime)
+    assert BaseRepository._column_value(Widget.__table__.c.name, {"name": "x"}) == "x"
+    assert BaseRepository._column_value(Widget.__table__.c.owner_id, {}) is None
+
+
+@pytest.mark.asyncio
+async def test_get_multi_and_get_page_keyset(db, repository):
+    """get_multi 키셋 조회와 get_page 커서 페이지네이션 테스트"""
+    await repository.bulk_create(
+        db, obj_in_list=[{"name": f"widget-{i:02d}", "owner_id": i % 2} for i in range(12)]
+    )
+
+    first = await repository.get_multi(db, limit=5, owner_id=1)
+    after = await repository.get_multi(db, limit=5, after=(first[-1].id, first[-1].id), owner_id=1)
+    assert [w.id for w in first] + [w.id for w in after] == [2, 4, 6, 8, 10, 12]
+
+    params = CursorParams(paging="cursor", page_size=5, descending=True)
+    page, next_cursor = await repository.get_page(db, params=params)
+    assert [w.id for w in page] == [12, 11, 10, 9, 8]
+
+    params = CursorParams(cursor=next_cursor, page_size=5, descending=True)
+    page, next_cursor = await repository.get_page(db, params=params)
+    assert [w.id for w in page] == [7, 6, 5, 4, 3]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_inserts_and_updates(db, statements):
+    """bulk_upsert가 ON CONFLICT DO UPDATE 배치로 삽입/수정하고 영향받은 행 수를 반환하는지 테스트"""
+    repository = BaseRepository(Gadget)
+    await repository.bulk_create(
+        db, obj_in_list=[{"sku": f"sku-{i}", "name": f"old-{i}", "stock": i} for i in range(3)]
+    )
+    statements.clear()
+
+    rows = [{"sku": f"sku-{i}", "name": f"new-{i}", "stock": 10 + i} for i in range(5)]
+    affected = await repository.bulk_upsert(
+        db, obj_in_list=rows, conflict_columns=["sku"], batch_size=2
+    )
+
+    assert affected == 5
+    gadgets = await repository.get_multi(db)
+    assert [(g.sku, g.name, g.stock) for g in gadgets] == [
+        (row["sku"], row["name"], row["stock"]) for row in rows
+    ]
+    # 수정된 행에만 onupdate 적용
+    assert [g.updated_at for g in gadgets] == [datetime(2030, 1, 1)] * 3 + [None] * 2
+
+    inserts = [sql for sql in statements if sql.lstrip().upper().startswith("INSERT")]
+    selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    assert len(inserts) == 3  # 2 + 2 + 1
+    assert all("ON CONFLICT" in sql.upper() for sql in inserts)
+    assert len(selects) == 1  # get_multi만 실행 (행별 조회 없음)
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_update_columns_and_do_nothing(db):
+    """update_columns 지정과 DO NOTHING 동작 테스트"""
+    repository = BaseRepository(Gadget)
+    await repository.bulk_create(db, obj_in_list=[{"sku": "a", "name": "A", "stock": 1}])
+
+    updated = await repository.bulk_upsert(
+        db,
+        obj_in_list=[{"sku": "a", "name": "renamed", "stock": 5}],
+        conflict_columns=["sku"],
+        update_columns=["stock"],
+        return_objects=True,
+    )
+    assert [(g.name, g.stock) for g in updated] == [("A", 5)]
+
+    affected = await repository.bulk_upsert(
+        db,
+        obj_in_list=[{"sku": "a", "name": "ignored"}, {"sku": "b", "name": "B"}],
+        conflict_columns=["sku"],
+        update_columns=[],
+    )
+    assert affected == 1  # 기존 행은 건너뜀
+    assert [(g.sku, g.name) for g in await repository.get_multi(db)] == [("a", "A"), ("b", "B")]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_by_primary_key(db, repository):
+    """기본 키 충돌 대상으로 upsert 테스트"""
+    await repository.bulk_create(db, obj_in_list=[{"id": 1, "name": "one"}])
+
+    upserted = await repository.bulk_upsert(
+        db, obj_in_list=[{"id": 1, "name": "uno"}, {"id": 2, "name": "dos"}], return_objects=True
+    )
+
+    assert [(w.id, w.name) for w in upserted] == [(1, "uno"), (2, "dos")]
+    assert await repository.bulk_upsert(db, obj_in_list=[]) == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_multi(db, repository):
+    """stream_multi가 필터/정렬/컬럼 지정과 함께 스트리밍하는지 테스트"""
+    await repository.bulk_create(
+        db, obj_in_list=[{"name": f"widget-{i}", "owner_id": i % 2} for i in range(1, 8)],
+        return_objects=False,
+    )
+
+    widgets = [w async for w in repository.stream_multi(db, owner_id=1, chunk_size=2)]
+    assert [w.id for w in widgets] == [1, 3, 5, 7]
+    assert all(isinstance(w, Widget) for w in widgets)
+
+    rows = [
+        row async for row in repository.stream_multi(
+            db, columns=["id", "name"], order_by="name", descending=True, chunk_size=3
+        )
+    ]
+    assert [tuple(row) for row in rows] == [(i, f"widget-{i}") for i in range(7, 0, -1)]
+
+
+@pytest.mark.asyncio
+async def test_stream_multi_early_exit(db, repository):
+    """반복을 중간에 멈춰도 세션을 계속 사용할 수 있는지 테스트"""
+    await repository.bulk_create(
+        db, obj_in_list=[{"name": f"widget-{i}"} for i in range(10)], return_objects=False
+    )
+
+    stream = repository.stream_multi(db, chunk_size=2)
+    async for widget in stream:
+        if widget.id == 3:
+            break
+    await stream.aclose()
+
+    assert await repository.count(db) == 10
+
+
+def writes_and_reads(statements):
+    """트랜잭션 제어 문을 제외한 실행 SQL 문"""
+    return [sql for sql in statements if sql.lstrip().split()[0].upper() in ("SELECT", "UPDATE", "DELETE")]
+
+
+@pytest.mark.asyncio
+async def test_update_single_statement(db, repository, statements):
+    """update가 UPDATE ... RETURNING 한 번으로 처리되는지 테스트"""
+    widget = await repository.create(db, obj_in={"name": "before", "owner_id": 1})
+    statements.clear()
+
+    updated = await repository.update(db, db_obj=widget, obj_in={"name": "after", "unknown": 1})
+
+    assert updated is widget
+    assert (updated.name, updated.owner_id) == ("after", 1)
+    executed = writes_and_reads(statements)
+    assert len(executed) == 1
+    assert executed[0].lstrip().upper().startswith("UPDATE") and "RETURNING" in executed[0].upper()
+
+
+@pytest.mark.asyncio
+async def test_delete_single_statement(db, repository, statements):
+    """delete가 DELETE ... RETURNING 한 번으로 처리되는지 테스트"""
+    widget = await repository.create(db, obj_in={"name": "doomed"})
+    statements.clear()
+
+    deleted = await repository.delete(db, id=widget.id)
+
+    assert deleted.name == "doomed"
+    executed = writes_and_reads(statements)
+    assert len(executed) == 1
+    assert executed[0].lstrip().upper().startswith("DELETE") and "RETURNING" in executed[0].upper()
+    assert await repository.get(db, widget.id) is None
+    assert await repository.delete(db, id=widget.id) is None
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_without_returning(engine, db, repository, statements, monkeypatch):
+    """RETURNING을 지원하지 않는 데이터베이스에서 기존 방식으로 처리되는지 테스트"""
+    dialect = engine.sync_engine.dialect
+    monkeypatch.setattr(dialect, "update_returning", False)
+    monkeypatch.setattr(dialect, "delete_returning", False)
+
+    widget = await repository.create(db, obj_in={"name": "before"})
+    statements.clear()
+
+    updated = await repository.update(db, db_obj=widget, obj_in={"name": "after"})
+    assert updated.name == "after"
+    assert [sql.lstrip().split()[0].upper() for sql in writes_and_reads(statements)] == ["UPDATE", "SELECT"]
+
+    statements.clear()
+    assert (await repository.delete(db, id=widget.id)).name == "after"
+    assert [sql.lstrip().split()[0].upper() for sql in writes_and_reads(statements)] == ["SELECT", "DELETE"]
+
+
+@pytest.mark.asyncio
+async def test_get_with_fields(db, repository, statements):
+    """fields로 지정한 컬럼만 조회하고, 나머지 컬럼 접근 시 지연 로딩 대신 예외가 발생하는지 테스트"""
+    await repository.bulk_create(
+        db, obj_in_list=[{"name": f"widget-{i}", "owner_id": i} for i in range(3)], return_objects=False
+    )
+    db.expunge_all()
+    statements.clear()
+
+    widgets = await repository.get_multi(db, fields=["name"])
+    assert [w.name for w in widgets] == ["widget-0", "widget-1", "widget-2"]
+    assert "created_at" not in statements[-1] and "owner_id" not in statements[-1]
+    with pytest.raises(InvalidRequestError):
+        widgets[0].owner_id
+
+    db.expunge_all()
+    widget = await repository.get(db, 2, fields=["owner_id"])
+    assert widget.owner_id == 1
+    assert "widget.name" not in statements[-1]
+
+
+def test_user_password_deferred_by_default():
+    """User.hashed_password는 기본 조회에서 제외되고 undefer 시에만 조회되는지 테스트"""
+    from sqlalchemy import select
+    from sqlalchemy.orm import undefer
+
+    from fastapi_template.app.db.models import User
+
+    assert "hashed_password" not in str(select(User))
+    assert "hashed_password" in str(select(User).options(undefer(User.hashed_password)))
@@ -0,0 +1,515 @@
+"""
+리포지토리 성능 벤치마크
+
+pytest -m slow -s tests/test_repositories/test_repositories_benchmark.py 로 실행하면
+초당 처리 행 수, 최대 메모리 사용량, 조회 1회당 소요 시간, 쓰기 요청 1회당 소요 시간, 동시 생성 요청 처리량을 출력합니다.
+측정값은 실행 환경에 따라 달라지므로 검증은 실행된 문장 수, 커밋 수, 기록된 행 수로만 합니다.
+"""
+
+import asyncio
+import gc
+import json
+import os
+import random
+import time
+import tracemalloc
+
+import pytest
+from sqlalchemy import bindparam, event, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from fastapi_template.app.common.database.database_group_commit import GroupCommitWriter
+from fastapi_template.app.common.database.database_unit_of_work import UnitOfWork
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+from fastapi_template.app.common.utils.bulk_export import encode_ndjson
+from fastapi_template.app.common.utils.bulk_import import bulk_import, iter_csv
+from fastapi_template.app.common.utils.statements import HotQueryRegistry
+from app.common.utils.pagination import apply_keyset_pagination
+from tests.test_database.test_database_fulltext import Note, SearchBase, note_index
+from tests.models import RepoBase, Widget
+from tests.test_utils.test_bulk_import import WidgetCreate
+
+BENCHMARK_ROWS = 5000
+STREAM_BENCHMARK_ROWS = int(os.environ.get("STREAM_BENCHMARK_ROWS", "20000"))
+HOT_QUERY_CALLS = 5000
+MULTI_WRITE_REQUESTS = 200
+GROUP_COMMIT_REQUESTS = 2000
+GROUP_COMMIT_CONCURRENCY = 200
+IMPORT_BENCHMARK_ROWS = int(os.environ.get("IMPORT_BENCHMARK_ROWS", "10000"))
+EXPORT_BENCHMARK_ROWS = int(os.environ.get("EXPORT_BENCHMARK_ROWS", "10000"))
+SEARCH_BENCHMARK_ROWS = int(os.environ.get("SEARCH_BENCHMARK_ROWS", "20000"))
+
+
+def count_events(engine):
+    """엔진에서 실행된 SQL 문과 커밋 횟수 (실행 중 계속 갱신)"""
+    counts = {"statements": 0, "commits": 0}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        counts["statements"] += 1
+
+    @event.listens_for(engine.sync_engine, "commit")
+    def count_commit(conn):
+        counts["commits"] += 1
+
+    return counts
+
+
+async def row_count(engine, model):
+    async with engine.connect() as conn:
+        return await conn.scalar(select(func.count()).select_from(model))
+
+
+async def legacy_bulk_create(db, model, rows):
+    """기존 구현: 행마다 add 후 커밋, 행마다 refresh"""
+    db_objs = []
+    for row in rows:
+        db_obj = model(**row)
+        db.add(db_obj)
+        db_objs.append(db_obj)
+    await db.commit()
+    for db_obj in db_objs:
+        await db.refresh(db_obj)
+    return db_objs
+
+
+async def measure(engine, counts, insert_rows):
+    """새 DB에서 insert_rows(db, rows)를 실행하고 (초당 행 수, 실행된 SQL 문 수)를 반환합니다."""
+    async with engine.begin() as conn:
+        await conn.run_sync(RepoBase.metadata.drop_all)
+        await conn.run_sync(RepoBase.metadata.create_all)
+
+    rows = [{"name": f"widget-{i}", "owner_id": i % 100} for i in range(BENCHMARK_ROWS)]
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        before = counts["statements"]
+        started = time.perf_counter()
+        await insert_rows(db, rows)
+        elapsed = time.perf_counter() - started
+        statements = counts["statements"] - before
+    assert await row_count(engine, Widget) == BENCHMARK_ROWS
+    return BENCHMARK_ROWS / elapsed, statements
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_bulk_create_benchmark(tmp_path):
+    """기존 bulk_create 대비 배치 INSERT ... RETURNING 처리량 비교"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/bench.db")
+    repository = BaseRepository(Widget)
+    counts = count_events(engine)
+
+    try:
+        legacy, legacy_statements = await measure(
+            engine, counts, lambda db, rows: legacy_bulk_create(db, Widget, rows)
+        )
+        returning, returning_statements = await measure(
+            engine, counts, lambda db, rows: repository.bulk_create(db, obj_in_list=rows)
+        )
+        no_returning, no_returning_statements = await measure(
+            engine,
+            counts,
+            lambda db, rows: repository.bulk_create(db, obj_in_list=rows, return_objects=False),
+        )
+    finally:
+        await engine.dispose()
+
+    print(
+        f"\nbulk_create {BENCHMARK_ROWS} rows (rows/sec, statements): "
+        f"legacy={legacy:,.0f} ({legacy_statements}) returning={returning:,.0f} ({returning_statements}) "
+        f"no_returning={no_returning:,.0f} ({no_returning_statements})"
+    )
+    # 기존 구현은 행마다 refresh SELECT를 실행
+    assert legacy_statements >= BENCHMARK_ROWS
+    assert returning_statements * 10 < legacy_statements
+    assert no_returning_statements * 10 < legacy_statements
+
+
+async def peak_memory(consume):
+    """consume() 실행 중 최대 메모리 할당량(바이트)을 반환합니다."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        await consume()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_stream_multi_memory_benchmark(tmp_path):
+    """get_multi(전체 적재) 대비 stream_multi의 최대 메모리 사용량 비교
+
+    STREAM_BENCHMARK_ROWS 환경 변수로 행 수를 지정합니다 (예: 1000000).
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/stream.db")
+    repository = BaseRepository(Widget)
+    async with engine.begin() as conn:
+        await conn.run_sync(RepoBase.metadata.create_all)
+        for start in range(0, STREAM_BENCHMARK_ROWS, 50000):
+            stop = min(start + 50000, STREAM_BENCHMARK_ROWS)
+            await conn.execute(
+                insert(Widget), [{"name": f"widget-{i}", "owner_id": i % 100} for i in range(start, stop)]
+            )
+
+    async def materialize():
+        async with AsyncSession(engine) as db:
+            widgets = await repository.get_multi(db, limit=STREAM_BENCHMARK_ROWS)
+            assert len(widgets) == STREAM_BENCHMARK_ROWS
+
+    async def stream(**kwargs):
+        async with AsyncSession(engine) as db:
+            count = 0
+            async for _ in repository.stream_multi(db, **kwargs):
+                count += 1
+            assert count == STREAM_BENCHMARK_ROWS
+
+    try:
+        materialized = await peak_memory(materialize)
+        streamed = await peak_memory(stream)
+        projected = await peak_memory(lambda: stream(columns=["id", "name"]))
+    finally:
+        await engine.dispose()
+
+    print(
+        f"\n{STREAM_BENCHMARK_ROWS} rows peak memory (MiB): "
+        f"get_multi={materialized / 2**20:.1f} stream_multi={streamed / 2**20:.1f} "
+        f"stream_multi(columns)={projected / 2**20:.1f}"
+    )
+
+
+async def per_call_microseconds(lookup, calls=HOT_QUERY_CALLS):
+    """lookup(id)의 1회당 평균 소요 시간(마이크로초)을 반환합니다."""
+    for id in range(1, 201):
+        await lookup(id)
+    started = time.perf_counter()
+    for i in range(calls):
+        await lookup(i % 100 + 1)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_hot_query_overhead_benchmark():
+    """호출마다 문장을 생성하는 조회 대비 미리 생성한 문장의 1회당 소요 시간 비교
+
+    인메모리 DB에서 100행 중 하나를 기본 키로 조회하므로 측정값은 대부분 Python 측 비용입니다.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    registry = HotQueryRegistry()
+    registry.register("widget.get_by_id")(
+        lambda: select(Widget).where(Widget.id == bindparam("widget_id"))
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(RepoBase.metadata.create_all)
+        await conn.execute(insert(Widget), [{"name": f"widget-{i}"} for i in range(100)])
+
+    try:
+        async with AsyncSession(engine) as db:
+
+            async def rebuilt(id):
+                result = await db.execute(select(Widget).filter(Widget.id == id))
+                return result.scalars().first()
+
+            async def prebuilt(id):
+                result = await registry.execute(db, "widget.get_by_id", widget_id=id)
+                return result.scalars().first()
+
+            before = await per_call_microseconds(rebuilt)
+            after = await per_call_microseconds(prebuilt)
+            assert [(await prebuilt(id)).id for id in (1, 50, 100)] == [1, 50, 100]
+    finally:
+        await engine.dispose()
+
+    print(f"\nget by id (us/call): rebuilt={before:.1f} prebuilt={after:.1f}")
+
+
+async def multi_write_request(db, repository, n):
+    """쓰기 4번을 수행하는 엔드포인트 (생성 2건, 수정, 일괄 수정)"""
+    widget = await repository.create(db, obj_in={"name": f"widget-{n}", "owner_id": n})
+    await repository.update(db, db_obj=widget, obj_in={"name": f"renamed-{n}"})
+    await repository.create(db, obj_in={"name": f"audit-{n}", "owner_id": n})
+    await repository.bulk_update(db, ids=[widget.id], obj_in={"owner_id": n + 1})
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_unit_of_work_benchmark(tmp_path):
+    """메서드마다 커밋하는 경우 대비 요청 단위 트랜잭션(한 번 커밋)의 요청 1회당 소요 시간 비교
+
+    파일 DB(기본 synchronous=FULL)를 사용하므로 커밋마다 fsync 비용이 포함됩니다.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/uow.db")
+    repository = BaseRepository(Widget)
+    async with engine.begin() as conn:
+        await conn.run_sync(RepoBase.metadata.create_all)
+    counts = count_events(engine)
+    commits = {}
+
+    async def per_request_milliseconds(transactional):
+        before = counts["commits"]
+        started = time.perf_counter()
+        for n in range(MULTI_WRITE_REQUESTS):
+            async with AsyncSession(engine, expire_on_commit=False) as db:
+                if transactional:
+                    async with UnitOfWork(db):
+                        await multi_write_request(db, repository, n)
+                else:
+                    await multi_write_request(db, repository, n)
+        elapsed = time.perf_counter() - started
+        commits[transactional] = counts["commits"] - before
+        return elapsed / MULTI_WRITE_REQUESTS * 1e3
+
+    try:
+        per_method = await per_request_milliseconds(transactional=False)
+        unit_of_work = await per_request_milliseconds(transactional=True)
+    finally:
+        await engine.dispose()
+
+    print(
+        f"\n4-write request (ms/request): "
+        f"commit_per_method={per_method:.2f} unit_of_work={unit_of_work:.2f}"
+    )
+    assert commits == {False: 4 * MULTI_WRITE_REQUESTS, True: MULTI_WRITE_REQUESTS}
+
+
+async def concurrent_creates(create):
+    """GROUP_COMMIT_CONCURRENCY개씩 동시에 create(n)을 호출하고 초당 요청 수와 최대 지연(ms)을 반환합니다."""
+    semaphore = asyncio.Semaphore(GROUP_COMMIT_CONCURRENCY)
+    latencies = []
+
+    async def request(n):
+        async with semaphore:
+            started = time.perf_counter()
+            await create(n)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request(n) for n in range(GROUP_COMMIT_REQUESTS)))
+    return GROUP_COMMIT_REQUESTS / (time.perf_counter() - started), max(latencies) * 1e3
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_group_commit_benchmark(tmp_path):
+    """요청마다 커밋하는 생성 대비 그룹 커밋의 처리량과 최대 지연 시간 비교"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/group.db")
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    repository = BaseRepository(Widget)
+    async with engine.begin() as conn:
+        await conn.run_sync(RepoBase.metadata.create_all)
+    counts = count_events(engine)
+    commits = {}
+
+    async def create_each(n):
+        async with sessions() as db:
+            await repository.create(db, obj_in={"name": f"widget-{n}", "owner_id": n})
+
+    try:
+        before = counts["commits"]
+        results = {"per_request": await concurrent_creates(create_each)}
+        commits["per_request"] = counts["commits"] - before
+        for delay_ms in (1, 5, 20):
+            writer = GroupCommitWriter(
+                sessions, Widget, max_batch_size=GROUP_COMMIT_CONCURRENCY, max_delay=delay_ms / 1000
+            )
+            before = counts["commits"]
+            results[f"group_{delay_ms}ms"] = await concurrent_creates(
+                lambda n: writer.submit({"name": f"widget-{n}", "owner_id": n})
+            )
+            await writer.stop()
+            commits[f"group_{delay_ms}ms"] = counts["commits"] - before
+        written = await row_count(engine, Widget)
+    finally:
+        await engine.dispose()
+
+    print(f"\n{GROUP_COMMIT_REQUESTS} concurrent creates (requests/sec, max latency ms, commits):")
+    for name, (throughput, latency) in results.items():
+        print(f"  {name}: {throughput:,.0f} req/s, max {latency:.1f}ms, {commits[name]} commits")
+    assert written == 4 * GROUP_COMMIT_REQUESTS
+    assert commits["per_request"] == GROUP_COMMIT_REQUESTS
+    # 동시 요청이 배치로 묶여 커밋 횟수가 요청 수보다 훨씬 적음
+    assert commits["group_5ms"] * 10 <= GROUP_COMMIT_REQUESTS
+
+
+async def csv_body(rows, chunk_rows=1000):
+    """rows행의 CSV 본문을 청크 단위로 생성 (본문 전체를 메모리에 만들지 않음)"""
+    yield b"name,owner_id\n"
+    for start in range(0, rows, chunk_rows):
+        stop = min(start + chunk_rows, rows)
+        yield "".join(f"widget-{i},{i % 100}\n" for i in range(start, stop)).encode()
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_bulk_import_benchmark(tmp_path):
+    """행마다 생성 요청 대비 스트리밍 대량 가져오기의 처리량과 최대 메모리 사용량
+
+    IMPORT_BENCHMARK_ROWS 환경 변수로 행 수를 지정합니다 (예: 1000000).
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/import.db")
+    repository = BaseRepository(Widget)
+    async with engine.begin() as conn:
+        await conn.run_sync(RepoBase.metadata.create_all)
+    counts = count_events(engine)
+
+    async def import_rows():
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            report = await bulk_import(
+                db, iter_csv(csv_body(IMPORT_BENCHMARK_ROWS)), schema=WidgetCreate, repository=repository
+            )
+        assert report.inserted == IMPORT_BENCHMARK_ROWS
+
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            started = time.perf_counter()
+            for i in range(BENCHMARK_ROWS // 5):
+                await repository.create(db, obj_in={"name": f"widget-{i}", "owner_id": i})
+            per_row = BENCHMARK_ROWS // 5 / (time.perf_counter() - started)
+
+        before = counts["statements"]
+        started = time.perf_counter()
+        await import_rows()
+        elapsed = time.perf_counter() - started
+        statements = counts["statements"] - before
+        memory = await peak_memory(import_rows)
+        written = await row_count(engine, Widget)
+    finally:
+        await engine.dispose()
+
+    print(
+        f"\n{IMPORT_BENCHMARK_ROWS} rows CSV import: {elapsed:.2f}s "
+        f"({IMPORT_BENCHMARK_ROWS / elapsed:,.0f} rows/s, "
+        f"{statements} statements, create per row: {per_row:,.0f} rows/s), "
+        f"peak memory {memory / 2**20:.1f} MiB"
+    )
+    assert written == BENCHMARK_ROWS // 5 + 2 * IMPORT_BENCHMARK_ROWS
+    # 행마다가 아니라 배치마다 INSERT
+    assert statements * 100 < IMPORT_BENCHMARK_ROWS
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_export_memory_benchmark(tmp_path):
+    """전체 조회 후 직렬화 대비 서버 측 커서 NDJSON 내보내기의 최대 메모리 사용량 비교
+
+    EXPORT_BENCHMARK_ROWS 환경 변수로 행 수를 지정합니다 (예: 1000000).
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/export.db")
+    repository = BaseRepository(Widget)
+    columns = ("id", "name", "owner_id", "created_at")
+    async with engine.begin() as conn:
+        await conn.run_sync(RepoBase.metadata.create_all)
+        for start in range(0, EXPORT_BENCHMARK_ROWS, 50000):
+            stop = min(start + 50000, EXPORT_BENCHMARK_ROWS)
+            await conn.execute(
+                insert(Widget), [{"name": f"widget-{i}", "owner_id": i % 100} for i in range(start, stop)]
+            )
+
+    async def materialize():
+        async with AsyncSession(engine) as db:
+            widgets = await repository.get_multi(db, limit=EXPORT_BENCHMARK_ROWS)
+            body = "\n".join(
+                json.dumps({column: str(getattr(widget, column)) for column in columns})
+                for widget in widgets
+            )
+            assert body.count("\n") == EXPORT_BENCHMARK_ROWS - 1
+
+    async def stream():
+        async with AsyncSession(engine) as db:
+            lines = 0
+            async for chunk in encode_ndjson(repository.stream_multi(db, columns=columns), columns):
+                lines += chunk.count(b"\n")
+            assert lines == EXPORT_BENCHMARK_ROWS
+
+    try:
+        materialized = await peak_memory(materialize)
+        streamed = await peak_memory(stream)
+    finally:
+        await engine.dispose()
+
+    print(
+        f"\n{EXPORT_BENCHMARK_ROWS} rows export peak memory (MiB): "
+        f"get_multi+json={materialized / 2**20:.1f} encode_ndjson(stream_multi)={streamed / 2**20:.1f}"
+    )
+
+
+SYLLABLES = "ka lo mi ru te sa no vi pe da zu ho ne ri go ba".split()
+# 음절 조합으로 만든 4096개 단어 (실제 텍스트처럼 대부분의 단어는 일부 행에만 등장)
+SEARCH_WORDS = [a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES]
+
+
+def synthetic_note(rng, i):
+    return {
+        "title": f"{' '.join(rng.choices(SEARCH_WORDS, k=3))} {i}",
+        "body": " ".join(rng.choices(SEARCH_WORDS, k=12)),
+    }
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_fulltext_search_benchmark(tmp_path):
+    """LIKE 검색(전체 스캔) 대비 FTS5 전문 검색의 첫 페이지/깊은 페이지 조회 시간 비교
+
+    SEARCH_BENCHMARK_ROWS 환경 변수로 행 수를 지정합니다 (예: 3000000).
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/search.db")
+    rng = random.Random(0)
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        await conn.run_sync(SearchBase.metadata.create_all)
+        for start in range(0, SEARCH_BENCHMARK_ROWS, 50000):
+            stop = min(start + 50000, SEARCH_BENCHMARK_ROWS)
+            await conn.execute(insert(Note), [synthetic_note(rng, i) for i in range(start, stop)])
+        load_seconds = time.perf_counter() - started
+        bodies = (await conn.scalars(select(Note.body).where(Note.id.in_([1, 2])))).all()
+
+    # 단어 하나, 접두어, 같은 행에 있는 두 단어(결과가 적어 LIKE는 전체를 스캔)
+    queries = [
+        *rng.sample(SEARCH_WORDS, 3),
+        *(word[:4] for word in rng.sample(SEARCH_WORDS, 3)),
+        *(" ".join(body.split()[:2]) for body in bodies),
+    ]
+
+    async def page_milliseconds(dialect_name, pages=1):
+        async with AsyncSession(engine) as db:
+            started = time.perf_counter()
+            for text in queries:
+                query, score = note_index.apply(select(Note.id), dialect_name, text)
+                query, after = query.add_columns(score), None
+                for _ in range(pages):
+                    rows = (
+                        await db.execute(
+                            apply_keyset_pagination(query, score, Note.id, limit=20, after=after)
+                        )
+                    ).all()
+                    if len(rows) < 20:
+                        break
+                    after = [rows[-1][1], rows[-1][0]]
+            return (time.perf_counter() - started) * 1000 / len(queries)
+
+    async def match_counts(dialect_name):
+        async with AsyncSession(engine) as db:
+            counts = []
+            for text in queries:
+                query, _ = note_index.apply(select(Note.id), dialect_name, text, prefix=False)
+                counts.append(await db.scalar(select(func.count()).select_from(query.subquery())))
+            return counts
+
+    try:
+        fts = await page_milliseconds("sqlite")
+        fts_deep = await page_milliseconds("sqlite", pages=10)
+        like = await page_milliseconds("other")
+        fts_matches = await match_counts("sqlite")
+        like_matches = await match_counts("other")
+    finally:
+        await engine.dispose()
+
+    print(
+        f"\n{SEARCH_BENCHMARK_ROWS} rows load with index triggers: {load_seconds:.1f}s, "
+        f"per query first page (ms): LIKE={like:.1f} FTS5={fts:.1f}, FTS5 10 pages={fts_deep:.1f}"
+    )
+    # 전체 단어 검색은 인덱스와 LIKE 전체 스캔의 결과 수가 같음 (접두어 검색은 부분 문자열과 다름)
+    full_words = [0, 1, 2, 6, 7]
+    assert [fts_matches[i] for i in full_words] == [like_matches[i] for i in full_words]
+    assert fts_matches[6] >= 1 and fts_matches[7] >= 1
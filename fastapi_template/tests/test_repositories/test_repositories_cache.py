@@ -0,0 +1,186 @@
+"""
+리포지토리 조회 결과 캐시 테스트
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from fastapi_template.app.common.cache.cache_memory import MemoryCacheBackend
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+from tests.models import RepoBase, Widget
+
+
+class WidgetSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    owner_id: Optional[int] = None
+    created_at: datetime
+
+
+class CachedWidgetRepository(BaseRepository):
+    cache_schema = WidgetSchema
+    cache_list_filters = ("owner_id",)
+
+    def __init__(self, cache=None):
+        super().__init__(Widget)
+        self.cache_backend = cache or MemoryCacheBackend(ttl=None)
+
+
+@pytest.fixture
+def repository():
+    return CachedWidgetRepository()
+
+
+async def seed(db, repository, count=3):
+    return await repository.bulk_create(
+        db, obj_in_list=[{"name": f"widget-{i}", "owner_id": i % 2} for i in range(count)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_served_from_cache(db, repository, statements):
+    """두 번째 get은 SQL 없이 캐시에서 조회되고 같은 세션 객체로 복원되는지 테스트"""
+    await seed(db, repository)
+    db.expunge_all()
+
+    first = await repository.get(db, 1)
+    db.expunge_all()
+    statements.clear()
+
+    cached = await repository.get(db, 1)
+    assert statements == []
+    assert (cached.id, cached.name, cached.owner_id) == (first.id, first.name, first.owner_id)
+    assert cached.created_at == first.created_at
+    assert cached in db
+
+    # fields/load를 지정한 조회는 캐시를 사용하지 않음
+    await repository.get(db, 1, fields=["name"])
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_id_and_list_keys(db, repository, statements):
+    """update/delete/bulk 작업이 ID 캐시와 목록 캐시를 무효화하는지 테스트"""
+    await seed(db, repository)
+    widget = await repository.get(db, 1)
+    assert [w.id for w in await repository.get_multi(db, owner_id=1)] == [2]
+
+    await repository.update(db, db_obj=widget, obj_in={"name": "renamed"})
+    db.expunge_all()
+    assert (await repository.get(db, 1)).name == "renamed"
+
+    await repository.create(db, obj_in={"name": "widget-new", "owner_id": 1})
+    assert [w.id for w in await repository.get_multi(db, owner_id=1)] == [2, 4]
+
+    await repository.bulk_update(db, ids=[2], obj_in={"owner_id": 0})
+    assert [w.id for w in await repository.get_multi(db, owner_id=1)] == [4]
+
+    await repository.bulk_upsert(db, obj_in_list=[{"id": 1, "name": "upserted"}])
+    db.expunge_all()
+    assert (await repository.get(db, 1)).name == "upserted"
+
+    await repository.delete(db, id=1)
+    db.expunge_all()
+    assert await repository.get(db, 1) is None
+
+
+@pytest.mark.asyncio
+async def test_list_cache_only_for_configured_filters(db, repository, statements):
+    """cache_list_filters에 없는 필터의 목록은 캐시하지 않는지 테스트"""
+    await seed(db, repository)
+
+    await repository.get_multi(db, owner_id=0)
+    await repository.get_multi(db, name="widget-0")
+    statements.clear()
+
+    await repository.get_multi(db, owner_id=0)
+    assert statements == []
+    await repository.get_multi(db, name="widget-0")
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_by_default(db, statements):
+    """cache_schema를 지정하지 않은 리포지토리는 캐시를 사용하지 않는지 테스트"""
+    repository = BaseRepository(Widget)
+    repository.cache_backend = MemoryCacheBackend(ttl=None)
+    await seed(db, repository)
+
+    await repository.get(db, 1)
+    await repository.get(db, 1)
+    assert len([s for s in statements if s.startswith("SELECT")]) == 2
+
+
+@pytest.mark.asyncio
+async def test_read_racing_write_does_not_cache_stale_value(db, repository):
+    """조회 중에 수정이 커밋되면 조회한 오래된 값을 캐시하지 않는지 테스트"""
+    await seed(db, repository)
+    db.expunge_all()
+
+    read_done = asyncio.Event()
+    write_done = asyncio.Event()
+    execute = db.execute
+
+    async def slow_execute(*args, **kwargs):
+        # 조회 후 캐시 저장 전에 다른 요청의 수정이 끝나도록 대기
+        result = await execute(*args, **kwargs)
+        read_done.set()
+        await write_done.wait()
+        return result
+
+    async def writer():
+        await read_done.wait()
+        await repository.bulk_update(db=db_writer, ids=[1], obj_in={"name": "fresh"})
+        write_done.set()
+
+    async with AsyncSession(db.bind, expire_on_commit=False) as db_writer:
+        db.execute = slow_execute
+        stale, _ = await asyncio.gather(repository.get(db, 1), writer())
+        db.execute = execute
+
+    assert stale.name == "widget-0"
+    db.expunge_all()
+    assert (await repository.get(db, 1)).name == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_cache_consistent_under_concurrent_writes(tmp_path):
+    """동시 수정/조회 후 캐시된 값이 DB의 최종 값과 일치하는지 테스트"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'cache.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(RepoBase.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    repository = CachedWidgetRepository()
+
+    async with sessions() as db:
+        await seed(db, repository, count=5)
+
+    async def write(n):
+        async with sessions() as db:
+            await repository.bulk_update(db, ids=[n % 5 + 1], obj_in={"name": f"v{n}"})
+
+    async def read(n):
+        async with sessions() as db:
+            await repository.get(db, n % 5 + 1)
+            await repository.get_multi(db, owner_id=n % 2)
+
+    await asyncio.gather(*(task(n) for n in range(40) for task in (write, read)))
+
+    async with sessions() as db:
+        expected = {w.id: w.name for w in (await db.scalars(select(Widget))).all()}
+        for id, name in expected.items():
+            assert (await repository.get(db, id)).name == name
+        for owner_id in (0, 1):
+            listed = await repository.get_multi(db, owner_id=owner_id)
+            assert {w.id: w.name for w in listed} == {
+                id: name for id, name in expected.items() if (id - 1) % 2 == owner_id
+            }
+    await engine.dispose()
@@ -0,0 +1,88 @@
+"""
+요청 범위 데이터 로더 테스트
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import insert
+
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+from fastapi_template.app.common.repositories.repositories_loader import DataLoaders
+from tests.models import Widget
+
+
+@pytest.fixture
+async def widgets(engine):
+    """id 1~10 위젯"""
+    async with engine.begin() as conn:
+        await conn.execute(insert(Widget), [{"id": i, "name": f"widget-{i}"} for i in range(1, 11)])
+
+
+def selects(statements):
+    return [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+
+
+@pytest.mark.asyncio
+async def test_loads_in_same_tick_are_batched(db, widgets, statements):
+    """같은 틱의 조회가 중복 제거되어 IN 쿼리 한 번으로 묶이는지 테스트"""
+    loader = DataLoaders(db).get(Widget)
+
+    results = await asyncio.gather(
+        loader.load(3), loader.load(1), loader.load(3), loader.load(99), loader.load(2)
+    )
+
+    assert [w.id if w else None for w in results] == [3, 1, 3, None, 2]
+    assert results[0] is results[2]
+    assert len(selects(statements)) == 1
+    assert " IN " in selects(statements)[0].upper()
+
+
+@pytest.mark.asyncio
+async def test_identity_cache(db, widgets, statements):
+    """이미 조회한 ID(없는 ID 포함)는 다시 조회하지 않는지 테스트"""
+    loaders = DataLoaders(db)
+    loader = loaders.get(Widget)
+
+    first = await loader.load_many([1, 2, 42])
+    statements.clear()
+    second = await loader.load_many([2, 1, 42])
+
+    assert [w.id for w in second[:2]] == [2, 1] and second[2] is None
+    assert second[1] is first[0]
+    assert selects(statements) == []
+    assert loaders.get(Widget) is loader
+
+    loader.clear(1)
+    assert (await loader.load(1)).id == 1
+    assert len(selects(statements)) == 1
+
+
+@pytest.mark.asyncio
+async def test_large_sets_are_chunked(db, widgets, statements):
+    """in_batch_size보다 많은 ID는 여러 IN 쿼리로 나누어 조회하는지 테스트"""
+    repository = BaseRepository(Widget)
+    repository.in_batch_size = 4
+    loader = DataLoaders(db).get(repository)
+
+    results = await loader.load_many(list(range(1, 11)))
+
+    assert [w.id for w in results] == list(range(1, 11))
+    assert len(selects(statements)) == 3  # 4 + 4 + 2
+
+
+@pytest.mark.asyncio
+async def test_prime_and_errors(db, widgets, statements):
+    """prime으로 저장한 값 사용과 조회 실패 전파 테스트"""
+    class FailingRepository(BaseRepository):
+        async def get_many(self, db, ids):
+            raise RuntimeError("boom")
+
+    loader = DataLoaders(db).get(FailingRepository(Widget))
+    loader.prime(5, "cached")
+    assert await loader.load(5) == "cached"
+
+    with pytest.raises(RuntimeError):
+        await asyncio.gather(loader.load(1), loader.load(2))
+    # 실패한 조회는 캐시되지 않음
+    assert 1 not in loader._cache
@@ -0,0 +1,119 @@
+"""
+관계 로딩 전략 테스트
+"""
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String, insert
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, relationship
+
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+
+
+class LoadingBase(DeclarativeBase):
+    pass
+
+
+class Author(LoadingBase):
+    __tablename__ = "author"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    books = relationship("Book", back_populates="author")
+
+
+class Book(LoadingBase):
+    __tablename__ = "book"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String)
+    author_id = Column(Integer, ForeignKey("author.id"))
+    author = relationship("Author", back_populates="books")
+
+
+@pytest.fixture
+async def engine():
+    """작가 5명, 작가당 책 3권"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(LoadingBase.metadata.create_all)
+        await conn.execute(insert(Author), [{"id": i, "name": f"author-{i}"} for i in range(1, 6)])
+        await conn.execute(
+            insert(Book),
+            [{"id": i, "title": f"book-{i}", "author_id": (i - 1) // 3 + 1} for i in range(1, 16)],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db(engine):
+    async with AsyncSession(engine) as session:
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_lazy_load_raises_by_default(db):
+    """로딩 전략을 지정하지 않은 관계 접근은 쿼리 대신 예외가 발생하는지 테스트"""
+    authors = await BaseRepository(Author).get_multi(db)
+
+    with pytest.raises(InvalidRequestError):
+        authors[0].books
+
+
+@pytest.mark.asyncio
+async def test_selectin_load_within_budget(engine, db, query_budget):
+    """selectin 전략은 부모 수와 관계없이 쿼리 2개로 조회하는지 테스트"""
+    with query_budget(engine, 2):
+        authors = await BaseRepository(Author).get_multi(db, load={"books": "selectin"})
+
+    assert [len(author.books) for author in authors] == [3] * 5
+
+
+@pytest.mark.asyncio
+async def test_joined_load_single_query(engine, db, query_budget):
+    """joined 전략은 쿼리 1개로 조회하고 중복 부모가 없는지 테스트"""
+    repository = BaseRepository(Author)
+
+    with query_budget(engine, 1):
+        authors = await repository.get_multi(db, limit=2, load={"books": "joined"})
+    with query_budget(engine, 1):
+        author = await repository.get(db, 3, load={"books": "joined"})
+
+    assert [author.id for author in authors] == [1, 2]
+    assert [book.id for book in authors[1].books] == [4, 5, 6]
+    assert len(author.books) == 3
+
+
+@pytest.mark.asyncio
+async def test_many_to_one_from_identity_map(db, query_budget, engine):
+    """식별자 맵에 이미 있는 다대일 관계는 SQL 없이 접근 가능한지 테스트"""
+    authors = await BaseRepository(Author).get_multi(db)  # noqa: F841 (식별자 맵 유지)
+    books = await BaseRepository(Book).get_multi(db)
+
+    with query_budget(engine, 0):
+        assert books[0].author.name == "author-1"
+
+
+@pytest.mark.asyncio
+async def test_invalid_load_options(db):
+    """없는 관계 또는 지원하지 않는 전략 지정 시 예외 테스트"""
+    with pytest.raises(ValueError):
+        await BaseRepository(Author).get_multi(db, load={"publisher": "selectin"})
+    with pytest.raises(ValueError):
+        await BaseRepository(Author).get_multi(db, load={"books": "eager"})
+
+
+@pytest.mark.asyncio
+async def test_query_budget_fails_when_exceeded(engine, db, query_budget):
+    """N+1 패턴이 쿼리 예산을 초과하면 fixture가 테스트를 실패시키는지 테스트"""
+    repository = BaseRepository(Book)
+    repository.raise_on_lazy_load = False
+
+    with pytest.raises(pytest.fail.Exception, match="쿼리 예산 초과"):
+        with query_budget(engine, 2):
+            books = await repository.get_multi(db)
+            for book in books:
+                # 책마다 작가를 개별 조회하는 N+1 패턴
+                await db.run_sync(lambda _, book=book: book.author)
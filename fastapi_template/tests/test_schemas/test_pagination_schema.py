@@ -156,4 +156,33 @@ class TestPaginatedResponse:
         assert response.page_info.total_items == 20
         assert response.page_info.total_pages == 2
         assert response.page_info.has_previous is True
-        assert response.page_info.has_next is False  # 마지막 페이지 
\ No newline at end of file
+        assert response.page_info.has_next is False  # 마지막 페이지
+
+    def test_paginated_response_unknown_total(self):
+        """총 개수를 알 수 없는 경우 테스트"""
+        params = PaginationParams(page=2, page_size=10)
+        response = PaginatedResponse.create(
+            items=self.items[10:20],
+            total_items=None,
+            params=params
+        )
+        
+        # 총 개수와 페이지 수는 None, 다음 페이지 여부는 현재 페이지가 가득 찼는지로 판단
+        assert response.page_info.total_items is None
+        assert response.page_info.total_pages is None
+        assert response.page_info.has_previous is True
+        assert response.page_info.has_next is True
+
+    def test_paginated_response_approximate_total(self):
+        """추정 총 개수 테스트"""
+        params = PaginationParams(page=1, page_size=10)
+        response = PaginatedResponse.create(
+            items=self.items[:10],
+            total_items=30,
+            params=params,
+            total_is_exact=False
+        )
+        
+        assert response.page_info.total_items == 30
+        assert response.page_info.total_pages == 3
+        assert response.page_info.total_is_exact is False
@@ -0,0 +1 @@
+"""Services 모듈 테스트 패키지"""
@@ -0,0 +1,211 @@
+"""
+아이템 서비스 쓰기 권한 테스트
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.common.exceptions import NotFoundError, PermissionDeniedError
+from app.db.models.item import Item
+from app.db.models.user import User
+from app.common.utils.pagination import PaginationParams
+from app.db.schemas.item import ItemCreate, ItemUpdate
+from app.services import item_service
+from app.services.item_service import ItemService
+
+OWNER_ID = 1
+OTHER_ID = 2
+
+
+async def create_engine(returning=True):
+    """소유자/다른 사용자와 아이템 2개가 있는 인메모리 엔진 (returning=False면 UPDATE/DELETE RETURNING 미지원)"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    engine.sync_engine.dialect.update_returning = returning
+    engine.sync_engine.dialect.delete_returning = returning
+    async with engine.begin() as conn:
+        await conn.run_sync(Item.metadata.create_all)
+    async with AsyncSession(engine) as db:
+        db.add_all([
+            User(id=OWNER_ID, email="owner@example.com", username="owner", hashed_password="x", item_count=2),
+            User(id=OTHER_ID, email="other@example.com", username="other", hashed_password="x"),
+            Item(id=1, title="first", owner_id=OWNER_ID),
+            Item(id=2, title="second", owner_id=OWNER_ID),
+        ])
+        await db.commit()
+    return engine
+
+
+@pytest.fixture
+async def engine():
+    engine = await create_engine()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def settings(monkeypatch):
+    """기본 설정 (exact 개수 계산 전략, 그룹 커밋 미사용)"""
+    monkeypatch.setattr(item_service.config_settings, "PAGINATION_COUNT_STRATEGY", "exact")
+    monkeypatch.setattr(item_service.config_settings, "PAGINATION_COUNT_CACHE_TTL", 60)
+    monkeypatch.setattr(item_service.config_settings, "ITEM_GROUP_COMMIT_ENABLED", False)
+    ItemService.get_count_strategy.cache_clear()
+    yield item_service.config_settings
+    ItemService.get_count_strategy.cache_clear()
+
+
+@pytest.fixture
+def counter_strategy(settings):
+    """counter 개수 계산 전략 (User.item_count 유지)"""
+    settings.PAGINATION_COUNT_STRATEGY = "counter"
+
+
+@pytest.fixture
+async def db(engine):
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+
+def test_write_condition_adds_owner_predicate_unless_admin():
+    """관리자가 아니면 소유자 조건이 추가되는지 테스트"""
+    assert str(ItemService._write_condition(1)) == "item.id = :id_1"
+    assert "owner_id" in str(ItemService._write_condition(1, user_id=OWNER_ID))
+    assert "owner_id" not in str(ItemService._write_condition(1, user_id=OWNER_ID, is_admin=True))
+
+
+@pytest.mark.asyncio
+async def test_owner_update_is_single_statement(engine, db, query_budget):
+    """소유자 수정은 UPDATE ... RETURNING 한 문장으로 끝나는지 테스트"""
+    with query_budget(engine, 1) as executed:
+        item = await ItemService.update_user_item(db, 1, ItemUpdate(description="updated"), user_id=OWNER_ID)
+
+    assert item.description == "updated"
+    assert executed[0].lstrip().upper().startswith("UPDATE")
+    assert "RETURNING" in executed[0].upper()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "item_id, error", [(1, PermissionDeniedError), (999, NotFoundError)], ids=["non_owner", "missing"]
+)
+async def test_failed_update_checks_existence_once(engine, db, query_budget, item_id, error):
+    """수정 실패 시 SELECT 한 번으로 권한 없음/없음을 구분하는지 테스트"""
+    with query_budget(engine, 2) as executed:
+        with pytest.raises(error):
+            await ItemService.update_user_item(db, item_id, ItemUpdate(description="stolen"), user_id=OTHER_ID)
+
+    assert executed[1].lstrip().upper().startswith("SELECT")
+    assert await db.scalar(select(Item.description).where(Item.id == 1)) is None
+
+
+@pytest.mark.asyncio
+async def test_admin_bypasses_owner_predicate(engine, db, query_budget):
+    """관리자는 다른 사용자의 아이템도 수정/삭제할 수 있는지 테스트"""
+    with query_budget(engine, 1):
+        item = await ItemService.update_user_item(
+            db, 1, ItemUpdate(description="moderated"), user_id=OTHER_ID, is_admin=True
+        )
+    assert item.description == "moderated"
+
+    await ItemService.delete_user_item(db, 2, user_id=OTHER_ID, is_admin=True)
+    assert await db.scalar(select(Item).where(Item.id == 2)) is None
+
+
+@pytest.mark.asyncio
+async def test_owner_delete_is_single_statement(engine, db, query_budget):
+    """counter 전략이 아니면 소유자 삭제는 DELETE ... RETURNING 한 문장이고 카운터는 그대로인지 테스트"""
+    with query_budget(engine, 1) as executed:
+        await ItemService.delete_user_item(db, 1, user_id=OWNER_ID)
+
+    assert executed[0].lstrip().upper().startswith("DELETE")
+    assert "RETURNING" in executed[0].upper()
+    assert await db.scalar(select(User.item_count).where(User.id == OWNER_ID)) == 2
+    assert await db.scalar(select(Item).where(Item.id == 1)) is None
+
+
+@pytest.mark.asyncio
+async def test_owner_delete_decrements_item_count(engine, db, query_budget, counter_strategy):
+    """counter 전략이면 삭제와 카운터 갱신만 실행하고, 사용자 updated_at은 바뀌지 않는지 테스트"""
+    updated_at = await db.scalar(select(User.updated_at).where(User.id == OWNER_ID))
+    with query_budget(engine, 2) as executed:
+        await ItemService.delete_user_item(db, 1, user_id=OWNER_ID)
+
+    assert executed[0].lstrip().upper().startswith("DELETE")
+    assert executed[1].lstrip().upper().startswith("UPDATE")
+    owner = (await db.execute(select(User.item_count, User.updated_at).where(User.id == OWNER_ID))).one()
+    assert owner == (1, updated_at)
+    assert await db.scalar(select(Item).where(Item.id == 1)) is None
+
+
+@pytest.mark.asyncio
+async def test_item_writes_invalidate_cached_counts(db, settings):
+    """cached 전략에서 아이템 생성/삭제 후 캐시된 총 개수가 무효화되는지 테스트"""
+    settings.PAGINATION_COUNT_STRATEGY = "cached"
+    params = PaginationParams(page=1, page_size=10)
+    assert (await ItemService.get_items_page(db, params, owner_id=OWNER_ID))[1].total == 2
+
+    await ItemService.create_item(db, ItemCreate(title="third"), owner_id=OWNER_ID)
+    assert (await ItemService.get_items_page(db, params, owner_id=OWNER_ID))[1].total == 3
+
+    await ItemService.delete_user_item(db, 1, user_id=OWNER_ID)
+    assert (await ItemService.get_items_page(db, params, owner_id=OWNER_ID))[1].total == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "item_id, error", [(1, PermissionDeniedError), (999, NotFoundError)], ids=["non_owner", "missing"]
+)
+async def test_failed_delete_checks_existence_once(engine, db, query_budget, item_id, error):
+    """삭제 실패 시 SELECT 한 번으로 구분하고 카운터는 그대로인지 테스트"""
+    with query_budget(engine, 2) as executed:
+        with pytest.raises(error):
+            await ItemService.delete_user_item(db, item_id, user_id=OTHER_ID)
+
+    assert executed[1].lstrip().upper().startswith("SELECT")
+    assert await db.scalar(select(User.item_count).where(User.id == OWNER_ID)) == 2
+    assert await db.scalar(select(Item.id).where(Item.id == 1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_update_without_returning_support(query_budget):
+    """RETURNING을 지원하지 않는 DB에서는 rowcount와 재조회로 처리하는지 테스트"""
+    engine = await create_engine(returning=False)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            with pytest.raises(PermissionDeniedError):
+                await ItemService.update_user_item(db, 1, ItemUpdate(description="stolen"), user_id=OTHER_ID)
+            with pytest.raises(NotFoundError):
+                await ItemService.update_user_item(db, 999, ItemUpdate(description="stolen"), user_id=OWNER_ID)
+
+            with query_budget(engine, 2) as executed:
+                item = await ItemService.update_user_item(
+                    db, 1, ItemUpdate(description="updated"), user_id=OWNER_ID
+                )
+            assert item.description == "updated"
+            assert "RETURNING" not in executed[0].upper()
+            assert executed[1].lstrip().upper().startswith("SELECT")
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy, queries", [("exact", 1), ("counter", 3)])
+async def test_delete_without_returning_support(query_budget, settings, strategy, queries):
+    """RETURNING을 지원하지 않는 DB에서는 rowcount로 삭제를 확인하고, counter 전략이면 소유자를 먼저 조회하는지 테스트"""
+    settings.PAGINATION_COUNT_STRATEGY = strategy
+    engine = await create_engine(returning=False)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            with pytest.raises(PermissionDeniedError):
+                await ItemService.delete_user_item(db, 1, user_id=OTHER_ID)
+            with pytest.raises(NotFoundError):
+                await ItemService.delete_user_item(db, 999, user_id=OWNER_ID)
+
+            with query_budget(engine, queries) as executed:
+                await ItemService.delete_user_item(db, 1, user_id=OWNER_ID)
+            assert all("RETURNING" not in statement.upper() for statement in executed)
+            assert await db.scalar(select(Item).where(Item.id == 1)) is None
+            item_count = await db.scalar(select(User.item_count).where(User.id == OWNER_ID))
+            assert item_count == (1 if strategy == "counter" else 2)
+    finally:
+        await engine.dispose()
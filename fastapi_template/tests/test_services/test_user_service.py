@@ -0,0 +1,59 @@
+"""
+사용자 서비스 테스트
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.common.exceptions import NotFoundError
+
+from app.db.models.item import Item
+from app.db.models.user import User
+from app.services import user_service
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Item.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", ["exact", "counter"])
+async def test_should_delete_in_background(db, monkeypatch, strategy):
+    """아이템 수가 기준 이상인 사용자만 백그라운드로 삭제하는지 테스트 (카운터를 유지하지 않는 전략 포함)"""
+    monkeypatch.setattr(user_service.config_settings, "PAGINATION_COUNT_STRATEGY", strategy)
+    monkeypatch.setattr(user_service.config_settings, "USER_DELETE_BACKGROUND_THRESHOLD", 3)
+    user = User(email="owner@example.com", username="owner", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    db.add_all(Item(title=f"item-{i}", owner_id=user.id) for i in range(2))
+    user.item_count = 2
+    await db.commit()
+    assert not await UserService.should_delete_in_background(db, user)
+
+    db.add(Item(title="item-2", owner_id=user.id))
+    user.item_count = 3
+    await db.commit()
+    assert await UserService.should_delete_in_background(db, user)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("returning", [True, False], ids=["returning", "rowcount"])
+async def test_delete_user(db, returning):
+    """RETURNING 지원 여부와 관계없이 사용자를 삭제하고, 없는 사용자는 NotFoundError인지 테스트"""
+    db.get_bind().dialect.delete_returning = returning
+    user = User(email="owner@example.com", username="owner", hashed_password="x")
+    db.add(user)
+    await db.commit()
+
+    assert await UserService.delete_user(db, user.id)
+    assert await db.scalar(select(User.id).where(User.id == user.id)) is None
+    with pytest.raises(NotFoundError):
+        await UserService.delete_user(db, user.id)
@@ -0,0 +1,3 @@
+"""
+백그라운드 작업 모듈 테스트 패키지
+"""
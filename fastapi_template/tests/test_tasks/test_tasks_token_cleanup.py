@@ -0,0 +1,98 @@
+"""
+만료 토큰 정리 작업 테스트
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from fastapi_template.app.common.repositories.repositories_auth import AuthRepository
+from fastapi_template.app.common.tasks import PeriodicTask, TokenCleanupTask
+from fastapi_template.app.db.models import Token, User
+
+NOW = datetime(2030, 1, 1)
+
+
+@pytest.fixture
+async def engine():
+    """만료된 토큰 23개와 유효한 토큰 5개가 있는 인메모리 DB"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(User.metadata.create_all)
+        await conn.execute(
+            insert(User), [{"id": 1, "email": "user@example.com", "username": "user", "hashed_password": "x"}]
+        )
+        await conn.execute(
+            insert(Token),
+            [
+                {
+                    "token": f"token-{i}",
+                    "type": "refresh",
+                    "user_id": 1,
+                    "expires_at": NOW + timedelta(hours=-1 if i < 23 else 1),
+                }
+                for i in range(28)
+            ],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def sessions(engine):
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def count_tokens(sessions):
+    async with sessions() as db:
+        return await db.scalar(select(func.count()).select_from(Token))
+
+
+@pytest.mark.asyncio
+async def test_clean_expired_tokens_in_batches(engine, sessions):
+    """만료 토큰을 batch_size개씩 나누어 삭제하고 배치마다 커밋하는지 테스트"""
+    commits = []
+    event.listen(engine.sync_engine, "commit", lambda conn: commits.append(1))
+
+    async with sessions() as db:
+        deleted = await AuthRepository().clean_expired_tokens(db, batch_size=5, now=NOW)
+
+    assert deleted == 23
+    assert len(commits) == 5
+    assert await count_tokens(sessions) == 5
+
+
+@pytest.mark.asyncio
+async def test_token_cleanup_task_reports_throughput(sessions):
+    """정리 작업이 삭제 행 수와 처리량을 보고하는지 테스트"""
+    report = await TokenCleanupTask(sessions, batch_size=10, pause=0).run_once(now=NOW)
+
+    assert (report.deleted, report.partitions) == (23, 0)
+    assert report.rows_per_second > 0
+    assert await count_tokens(sessions) == 5
+
+
+@pytest.mark.asyncio
+async def test_periodic_task_survives_errors():
+    """실행 중 예외가 발생해도 다음 주기에 다시 실행되고 stop()으로 종료되는지 테스트"""
+
+    class Flaky(PeriodicTask):
+        def __init__(self):
+            super().__init__(interval=0)
+            self.calls = 0
+
+        async def run_once(self):
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("일시적 오류")
+
+    task = Flaky()
+    task.start()
+    while task.calls < 3:
+        await asyncio.sleep(0)
+    await task.stop()
+
+    assert not task.running
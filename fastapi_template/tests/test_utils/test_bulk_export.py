@@ -0,0 +1,107 @@
+"""
+스트리밍 대량 내보내기 테스트
+"""
+
+import json
+from datetime import datetime
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+from fastapi_template.app.common.utils.bulk_export import (
+    ExportFormat,
+    encode_csv,
+    encode_ndjson,
+    export_response,
+)
+from fastapi_template.app.common.utils.bulk_import import iter_csv
+from tests.models import Widget
+
+COLUMNS = ("id", "name", "owner_id")
+
+
+async def rows_of(*rows):
+    for row in rows:
+        yield row
+
+
+@pytest.mark.asyncio
+async def test_encoders_chunk_rows_and_convert_values():
+    """청크당 행 수만큼 묶어 변환하고, 날짜/None/Enum 값을 변환하는지 테스트"""
+    rows = [
+        (1, "a", datetime(2024, 1, 2, 3, 4, 5)),
+        (2, 'b "quoted", name', None),
+        (3, ExportFormat.CSV, 7),
+    ]
+
+    ndjson = [chunk async for chunk in encode_ndjson(rows_of(*rows), COLUMNS, rows_per_chunk=2)]
+    assert len(ndjson) == 2
+    assert [json.loads(line) for line in b"".join(ndjson).splitlines()] == [
+        {"id": 1, "name": "a", "owner_id": "2024-01-02T03:04:05"},
+        {"id": 2, "name": 'b "quoted", name', "owner_id": None},
+        {"id": 3, "name": "csv", "owner_id": 7},
+    ]
+
+    csv_chunks = [chunk async for chunk in encode_csv(rows_of(*rows), COLUMNS, rows_per_chunk=2)]
+    assert len(csv_chunks) == 2
+    assert b"".join(csv_chunks).decode() == (
+        'id,name,owner_id\n1,a,2024-01-02T03:04:05\n2,"b ""quoted"", name",\n3,csv,7\n'
+    )
+
+
+@pytest.mark.asyncio
+async def test_stopped_export_closes_rows():
+    """전송이 중간에 멈추면 행 스트림(서버 측 커서)을 닫는지 테스트"""
+    closed = []
+
+    async def rows():
+        try:
+            for i in range(10):
+                yield (i, f"widget-{i}", None)
+        finally:
+            closed.append(True)
+
+    chunks = encode_ndjson(rows(), COLUMNS, rows_per_chunk=2)
+    await chunks.__anext__()
+    await chunks.aclose()
+
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_export_endpoint_streams_every_row(engine, db):
+    """엔드포인트가 반환된 뒤에도 세션이 열린 채로 모든 행을 스트리밍하는지 테스트"""
+    db.add_all(Widget(name=f"widget-{i}", owner_id=i % 2) for i in range(1200))
+    await db.commit()
+
+    repository = BaseRepository(Widget)
+    app = FastAPI()
+
+    async def get_session():
+        async with AsyncSession(engine) as session:
+            yield session
+
+    @app.get("/widgets/export")
+    async def export_widgets(export_format: ExportFormat, session=Depends(get_session)):
+        rows = repository.stream_multi(session, columns=COLUMNS, owner_id=1, chunk_size=100)
+        return export_response(rows, COLUMNS, export_format, filename="widgets")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        ndjson = await client.get("/widgets/export", params={"export_format": "ndjson"})
+        csv = await client.get("/widgets/export", params={"export_format": "csv"})
+
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    assert ndjson.headers["content-disposition"] == 'attachment; filename="widgets.ndjson"'
+    lines = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert len(lines) == 600
+    assert {line["owner_id"] for line in lines} == {1}
+
+    assert csv.headers["content-type"] == "text/csv; charset=utf-8"
+    records = [record async for record in iter_csv(rows_of(csv.content))]
+    assert [record.data for record in records] == [
+        {"id": str(line["id"]), "name": line["name"], "owner_id": "1"} for line in lines
+    ]
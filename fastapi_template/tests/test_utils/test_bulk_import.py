@@ -0,0 +1,129 @@
+"""
+스트리밍 대량 가져오기 테스트
+"""
+
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field
+from sqlalchemy import func, select
+
+from fastapi_template.app.common.repositories.repositories_base import BaseRepository
+from fastapi_template.app.common.utils.bulk_import import (
+    bulk_import,
+    get_record_parser,
+    iter_csv,
+    iter_ndjson,
+)
+from tests.models import Widget
+
+
+class WidgetCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=20)
+    owner_id: Optional[int] = None
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(records):
+    return [record async for record in records]
+
+
+@pytest.mark.asyncio
+async def test_csv_records_split_across_chunks():
+    """청크 경계에 걸친 레코드, 따옴표 안의 줄바꿈, 빈 값, 열 개수 오류를 처리하는지 테스트"""
+    body = '\ufeffname,owner_id\r\nfirst,1\r\n"multi\nline, name",\r\n\r\nbroken\r\nlast,2'.encode()
+    records = await collect(iter_csv(stream(*(body[i:i + 5] for i in range(0, len(body), 5)))))
+
+    assert [(r.row, r.data) for r in records] == [
+        (1, {"name": "first", "owner_id": "1"}),
+        (2, {"name": "multi\nline, name", "owner_id": None}),
+        (3, None),
+        (4, {"name": "last", "owner_id": "2"}),
+    ]
+    assert "열 개수" in records[2].error
+
+
+@pytest.mark.asyncio
+async def test_ndjson_records_and_invalid_lines():
+    """NDJSON의 잘못된 JSON과 객체가 아닌 줄을 행 오류로 반환하는지 테스트"""
+    body = b'{"name": "a"}\n\n{"name": \n[1, 2]\n{"name": "\xec\x95\x84"}'
+    records = await collect(iter_ndjson(stream(body[:3], body[3:17], body[17:-1], body[-1:])))
+
+    assert [r.row for r in records] == [1, 2, 3, 4]
+    assert records[0].data == {"name": "a"}
+    assert records[1].error.startswith("잘못된 JSON")
+    assert records[2].error == "JSON 객체가 아닙니다"
+    assert records[3].data == {"name": "아"}
+    assert get_record_parser("application/x-ndjson; charset=utf-8") is iter_ndjson
+    assert get_record_parser("text/csv") is iter_csv
+    assert get_record_parser("application/json") is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_reports_row_errors(db):
+    """유효한 행은 청크 단위로 삽입하고, 검증 실패 행은 행 번호와 함께 보고하는지 테스트"""
+    lines = [f'{{"name": "widget-{i}"}}' for i in range(7)]
+    lines[2] = '{"name": ""}'
+    lines[5] = '{"owner_id": "x"}'
+    inserted = []
+
+    async def before_insert(session, rows):
+        inserted.append(len(rows))
+
+    report = await bulk_import(
+        db,
+        iter_ndjson(stream("\n".join(lines).encode())),
+        schema=WidgetCreate,
+        repository=BaseRepository(Widget),
+        chunk_size=2,
+        max_errors=1,
+        values={"owner_id": 7},
+        before_insert=before_insert,
+    )
+
+    assert (report.inserted, report.failed) == (5, 2)
+    assert inserted == [2, 2, 1]
+    assert [error.row for error in report.errors] == [3]
+    assert report.errors[0].errors[0]["loc"] == ["name"]
+    assert report.errors_truncated
+    assert await db.scalar(select(func.count(Widget.id)).where(Widget.owner_id == 7)) == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_rolled_back_and_import_continues(db):
+    """삽입에 실패한 청크만 롤백하고 다음 청크를 계속 가져오는지 테스트"""
+
+    class NullableName(BaseModel):
+        name: Optional[str] = None
+        owner_id: Optional[int] = None
+
+    report = await bulk_import(
+        db,
+        iter_csv(stream(b"name,owner_id\na,1\n,2\nb,3\nc,4\n")),
+        schema=NullableName,
+        repository=BaseRepository(Widget),
+        chunk_size=2,
+    )
+
+    assert (report.inserted, report.failed) == (2, 2)
+    assert [error.row for error in report.errors] == [1, 2]
+    assert report.errors[0].errors[0]["msg"] == "저장 실패: IntegrityError"
+    assert (await db.scalars(select(Widget.name).order_by(Widget.id))).all() == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_undecodable_body_aborts_with_partial_result(db):
+    """디코딩할 수 없는 본문은 그때까지 파싱한 행을 삽입하고 중단 사유를 남기는지 테스트"""
+    report = await bulk_import(
+        db,
+        iter_csv(stream(b"name\na\n", b"\xff\xfe\n")),
+        schema=WidgetCreate,
+        repository=BaseRepository(Widget),
+    )
+
+    assert report.inserted == 1
+    assert "디코딩할 수 없는" in report.aborted
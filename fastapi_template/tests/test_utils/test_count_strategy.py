@@ -0,0 +1,139 @@
+"""
+페이지네이션 개수 계산 전략 테스트
+"""
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from app.common.cache.cache_memory import MemoryCacheBackend
+from app.common.utils.count_strategy import (
+    CachedCountStrategy,
+    CounterCountStrategy,
+    CountResult,
+    EstimatedCountStrategy,
+    ExactCountStrategy,
+    WindowCountStrategy,
+    build_count_strategy,
+)
+from app.common.utils.pagination import PaginationParams
+
+
+class CountBase(DeclarativeBase):
+    pass
+
+
+class Owner(CountBase):
+    __tablename__ = "owner"
+
+    id = Column(Integer, primary_key=True)
+    row_count = Column(Integer, default=0)
+
+
+class Row(CountBase):
+    __tablename__ = "row"
+
+    id = Column(Integer, primary_key=True)
+    owner_id = Column(Integer, ForeignKey("owner.id"))
+    name = Column(String)
+
+
+@pytest.fixture
+async def session():
+    """개수 계산 테스트용 인메모리 DB 세션 (소유자 1: 15행, 소유자 2: 8행)"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(CountBase.metadata.create_all)
+        await conn.execute(insert(Owner), [{"id": 1, "row_count": 15}, {"id": 2, "row_count": 8}])
+        await conn.execute(
+            insert(Row),
+            [{"id": i, "owner_id": 1 if i <= 15 else 2, "name": f"row-{i}"} for i in range(1, 24)],
+        )
+    async with AsyncSession(engine) as db:
+        yield db
+    await engine.dispose()
+
+
+def owner_query(owner_id=None):
+    query = select(Row).order_by(Row.id)
+    if owner_id is not None:
+        query = query.where(Row.owner_id == owner_id)
+    return query
+
+
+@pytest.mark.asyncio
+async def test_exact_count_strategy(session):
+    """exact 전략 테스트"""
+    items, count = await ExactCountStrategy().paginate(
+        session, owner_query(1), PaginationParams(page=2, page_size=10)
+    )
+
+    assert [row.id for row in items] == list(range(11, 16))
+    assert count == CountResult(total=15, exact=True)
+
+
+@pytest.mark.asyncio
+async def test_window_count_strategy(session):
+    """window 전략이 페이지와 총 개수를 함께 반환하는지 테스트"""
+    strategy = WindowCountStrategy()
+
+    items, count = await strategy.paginate(session, owner_query(), PaginationParams(page=1, page_size=5))
+    assert [row.id for row in items] == [1, 2, 3, 4, 5]
+    assert count.total == 23
+
+    # 범위를 벗어난 페이지는 count(*)로 보완
+    items, count = await strategy.paginate(session, owner_query(), PaginationParams(page=9, page_size=5))
+    assert items == []
+    assert count.total == 23
+
+
+@pytest.mark.asyncio
+async def test_cached_count_strategy(session):
+    """cached 전략이 필터별로 캐시하고 재사용하는지 테스트"""
+    strategy = CachedCountStrategy(cache=MemoryCacheBackend(), ttl=60, key_prefix="test_count")
+    await strategy.invalidate()
+
+    assert await strategy.count(session, owner_query(1)) == CountResult(total=15, exact=True)
+    assert await strategy.count(session, owner_query(2)) == CountResult(total=8, exact=True)
+
+    await session.execute(update(Row).where(Row.id == 1).values(owner_id=2))
+
+    # 캐시된 값은 갱신 전 값이며 exact=False로 표시
+    assert await strategy.count(session, owner_query(1)) == CountResult(total=15, exact=False)
+
+    await strategy.invalidate()
+    assert await strategy.count(session, owner_query(1)) == CountResult(total=14, exact=True)
+
+
+@pytest.mark.asyncio
+async def test_estimated_count_strategy_falls_back_on_sqlite(session):
+    """PostgreSQL이 아니면 estimate 전략이 fallback을 사용하는지 테스트"""
+    count = await EstimatedCountStrategy(threshold=0).count(session, owner_query())
+
+    assert count == CountResult(total=23, exact=True)
+
+
+@pytest.mark.asyncio
+async def test_counter_count_strategy(session):
+    """counter 전략이 카운터 컬럼을 읽고, 키가 없으면 fallback을 사용하는지 테스트"""
+    strategy = CounterCountStrategy(Owner.row_count, Owner.id)
+
+    assert await strategy.count(session, owner_query(2), owner_id=2) == CountResult(total=8, exact=True)
+    assert await strategy.count(session, owner_query()) == CountResult(total=23, exact=True)
+
+
+def test_build_count_strategy():
+    """이름으로 전략 생성 테스트"""
+    assert isinstance(build_count_strategy("exact"), ExactCountStrategy)
+    assert isinstance(build_count_strategy("window"), WindowCountStrategy)
+    assert build_count_strategy("cached", cache_ttl=5).ttl == 5
+    assert build_count_strategy("estimate", estimate_threshold=10).threshold == 10
+    assert isinstance(
+        build_count_strategy("counter", counter_column=Owner.row_count, key_column=Owner.id),
+        CounterCountStrategy,
+    )
+
+    with pytest.raises(ValueError):
+        build_count_strategy("counter")
+    with pytest.raises(ValueError):
+        build_count_strategy("unknown")
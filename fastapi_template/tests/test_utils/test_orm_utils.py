@@ -3,10 +3,11 @@ SQLAlchemy ORM 유틸리티 테스트
 """
 import pytest
 from unittest.mock import Mock, patch
-from sqlalchemy import Column, Integer, String
+from pydantic import BaseModel
+from sqlalchemy import Column, Integer, String, select
 from sqlalchemy.orm import declarative_base
 
-from app.common.utils.orm_utils import get_python_value
+from app.common.utils.orm_utils import get_python_value, load_fields, schema_fields
 
 # SQLAlchemy 기본 베이스 클래스 생성
 Base = declarative_base()
@@ -68,4 +69,22 @@ class TestOrmUtils:
         # get_python_value 함수에서 사용될 때 모의 객체 반환
         with patch('app.common.utils.orm_utils.isinstance', return_value=True):
             result = get_python_value(mock_column)
-            assert result == 1 
\ No newline at end of file
+            assert result == 1 
+
+    def test_schema_fields(self):
+        """응답 스키마와 모델에 모두 있는 컬럼만 반환하는지 테스트"""
+        class UserSchema(BaseModel):
+            id: int
+            name: str
+            display_name: str
+
+        assert schema_fields(User, UserSchema) == ["id", "name"]
+
+    def test_load_fields(self):
+        """지정한 컬럼만 SELECT하는지 테스트"""
+        sql = str(select(User).options(load_fields(User, ["name"])))
+        assert "users.name" in sql and "users.id" in sql
+        assert "users.email" not in sql
+
+        with pytest.raises(ValueError):
+            load_fields(User, ["unknown"])
@@ -2,15 +2,25 @@
 페이지네이션 유틸리티 테스트
 """
 import pytest
+from datetime import datetime, timedelta
 from typing import List
 from pydantic import BaseModel
 from unittest.mock import MagicMock
+from sqlalchemy import Column, DateTime, Integer, String, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
 
+from app.common.exceptions import InvalidParameterError
 from app.common.utils.pagination import (
     PaginationParams,
+    CursorParams,
     PageInfo,
     PaginatedResponse,
-    apply_pagination
+    CursorPaginatedResponse,
+    apply_pagination,
+    decode_cursor,
+    encode_cursor,
+    paginate_by_cursor,
 )
 
 
@@ -210,4 +220,116 @@ class TestPaginatedResponse:
         assert response.page_info.total_items == 0
         assert response.page_info.total_pages == 0
         assert response.page_info.has_previous is False
-        assert response.page_info.has_next is False 
\ No newline at end of file
+        assert response.page_info.has_next is False
+
+
+class CursorBase(DeclarativeBase):
+    pass
+
+
+class CursorRow(CursorBase):
+    __tablename__ = "cursor_row"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    created_at = Column(DateTime)
+
+
+@pytest.fixture
+async def cursor_session():
+    """커서 페이지네이션 테스트용 인메모리 DB 세션"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(CursorBase.metadata.create_all)
+
+    base_time = datetime(2024, 1, 1)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        # created_at이 겹치는 행을 포함해 동점 처리를 검증
+        session.add_all(
+            CursorRow(id=i, name=f"row-{i:02d}", created_at=base_time + timedelta(minutes=i // 3))
+            for i in range(1, 26)
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+class TestCursorPagination:
+    """커서(키셋) 페이지네이션 테스트"""
+
+    def test_cursor_params_mode(self):
+        """CursorParams 모드 판별 테스트"""
+        assert CursorParams().use_cursor is False
+        assert CursorParams(paging="cursor").use_cursor is True
+        assert CursorParams(cursor="abc").use_cursor is True
+
+    def test_cursor_roundtrip(self):
+        """커서 인코딩/디코딩 테스트"""
+        created_at = datetime(2024, 5, 1, 12, 30)
+        cursor = encode_cursor([created_at, 42], "created_at", True)
+
+        assert decode_cursor(cursor, "created_at", True) == [created_at, 42]
+
+    def test_cursor_tampered_or_mismatched(self):
+        """변조되었거나 정렬 조건이 다른 커서 거부 테스트"""
+        cursor = encode_cursor([10, 10], "id", False)
+        body, signature = cursor.split(".")
+
+        with pytest.raises(InvalidParameterError):
+            decode_cursor(f"{body}.x{signature[1:]}", "id", False)
+        with pytest.raises(InvalidParameterError):
+            decode_cursor("not-a-cursor", "id", False)
+        with pytest.raises(InvalidParameterError):
+            decode_cursor(cursor, "id", True)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort_by,descending", [
+        ("id", False),
+        ("id", True),
+        ("created_at", False),
+        ("created_at", True),
+    ])
+    async def test_paginate_by_cursor_walks_all_rows(self, cursor_session, sort_by, descending):
+        """커서를 따라가면 모든 행을 중복/누락 없이 정렬 순서대로 조회하는지 테스트"""
+        seen = []
+        cursor = None
+        while True:
+            params = CursorParams(
+                paging="cursor", cursor=cursor, page_size=7, sort_by=sort_by, descending=descending
+            )
+            rows, cursor = await paginate_by_cursor(
+                cursor_session, select(CursorRow), CursorRow, params, ("id", "created_at")
+            )
+            seen.extend(rows)
+            if cursor is None:
+                break
+
+        expected = sorted(seen, key=lambda row: (getattr(row, sort_by), row.id), reverse=descending)
+        assert [row.id for row in seen] == [row.id for row in expected]
+        assert len({row.id for row in seen}) == 25
+
+    @pytest.mark.asyncio
+    async def test_paginate_by_cursor_rejects_unknown_sort(self, cursor_session):
+        """허용되지 않은 정렬 필드 거부 테스트"""
+        params = CursorParams(paging="cursor", sort_by="name")
+
+        with pytest.raises(InvalidParameterError):
+            await paginate_by_cursor(cursor_session, select(CursorRow), CursorRow, params, ("id",))
+
+    @pytest.mark.asyncio
+    async def test_cursor_paginated_response(self, cursor_session):
+        """CursorPaginatedResponse 생성 테스트"""
+        params = CursorParams(paging="cursor", page_size=10)
+        rows, next_cursor = await paginate_by_cursor(
+            cursor_session, select(CursorRow), CursorRow, params
+        )
+
+        response = CursorPaginatedResponse.create(
+            items=[SampleItem(id=row.id, name=row.name) for row in rows],
+            next_cursor=next_cursor,
+            params=params,
+        )
+
+        assert len(response.items) == 10
+        assert response.page_info.has_next is True
+        assert response.page_info.next_cursor == next_cursor
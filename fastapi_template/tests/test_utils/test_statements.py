@@ -0,0 +1,65 @@
+"""
+미리 생성한 쿼리 문장 레지스트리 테스트
+"""
+import pytest
+from sqlalchemy import Column, Integer, String, bindparam, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from app.common.utils.statements import HotQueryRegistry
+
+
+class StatementBase(DeclarativeBase):
+    pass
+
+
+class Account(StatementBase):
+    __tablename__ = "account"
+
+    id = Column(Integer, primary_key=True)
+    email = Column(String)
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(StatementBase.metadata.create_all)
+        await conn.execute(insert(Account), [{"id": i, "email": f"{i}@example.com"} for i in (1, 2)])
+    async with AsyncSession(engine) as db:
+        yield db
+    await engine.dispose()
+
+
+def test_statement_built_once():
+    """생성 함수가 최초 사용 시 한 번만 호출되고 같은 문장을 재사용하는지 테스트"""
+    registry = HotQueryRegistry()
+    calls = []
+
+    @registry.register("account.get_by_id")
+    def build():
+        calls.append(1)
+        return select(Account).where(Account.id == bindparam("account_id"))
+
+    assert calls == []
+    assert registry.get("account.get_by_id") is registry.get("account.get_by_id")
+    assert calls == [1]
+    assert registry.names() == ["account.get_by_id"]
+
+    with pytest.raises(KeyError):
+        registry.get("unknown")
+
+
+@pytest.mark.asyncio
+async def test_execute_with_bound_parameters(session):
+    """같은 문장을 다른 파라미터로 실행하는지 테스트"""
+    registry = HotQueryRegistry()
+    registry.register("account.get_by_email")(
+        lambda: select(Account).where(Account.email == bindparam("email"))
+    )
+
+    first = await registry.execute(session, "account.get_by_email", email="1@example.com")
+    second = await registry.execute(session, "account.get_by_email", email="2@example.com")
+
+    assert first.scalars().one().id == 1
+    assert second.scalars().one().id == 2